@@ -0,0 +1,357 @@
+"""
+Aquecimento dos caches do processo antes do primeiro visitante.
+
+Executa, uma única vez por processo, todas as etapas que o primeiro
+visitante pagaria: importação das dependências pesadas (só em servidor.py
+e na linha de comando; o aquecimento iniciado pelo app as deixa sob
+demanda), fragmentos HTML, índice de projetos (varredura de Imagem/ e
+leitura das descrições), animações Lottie, dados e índices do PIB e
+miniaturas da galeria, que então são publicadas em static/galeria/ (ver
+ativos_estaticos). Ao terminar, grava um arquivo de prontidão com o PID
+do processo, que as ferramentas de deploy podem aguardar em vez de usar
+sleep:
+
+    python servidor.py                        # aquece e então aceita conexões
+    python aquecimento.py --aguardar [--timeout 120] [--url http://127.0.0.1:8501/_stcore/health]
+    python aquecimento.py                     # apenas preenche os caches em disco
+
+Variáveis de ambiente:
+    PORTFOLIO_AQUECIMENTO=1   0 desliga o aquecimento feito pelo próprio app
+"""
+
+import argparse
+import importlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+import metricas
+from configuracao import DIRETORIO_CACHE, IMAGENS_DIR, ambiente
+
+logger = logging.getLogger(__name__)
+
+ARQUIVO_PRONTO = os.path.join(DIRETORIO_CACHE, "pronto.json")
+
+# Dependências que as páginas importam apenas no primeiro uso; pré-importadas
+# só por servidor.py e pela linha de comando
+IMPORTACOES = ("PIL.Image", "streamlit_lottie", "plotly.graph_objects", "email_validator", "numpy")
+
+INTERVALO_ESPERA = 0.5
+
+_habilitado = None
+
+
+def habilitado() -> bool:
+    """Indica se o app deve aquecer os caches; PORTFOLIO_AQUECIMENTO=0 desliga (lida uma vez, sob demanda)."""
+    global _habilitado
+    if _habilitado is None:
+        _habilitado = ambiente("PORTFOLIO_AQUECIMENTO", "1") != "0"
+    return _habilitado
+
+
+def _importacoes():
+    for modulo in IMPORTACOES:
+        try:
+            importlib.import_module(modulo)
+        except ImportError as e:
+            logger.warning("Aquecimento: não foi possível importar %s: %s", modulo, e)
+
+
+def _fragmentos():
+    import fragmentos_html
+
+    return len(fragmentos_html.fragmentos())
+
+
+def _lottie():
+    from cache_lottie import ANIMACOES_DISTRIBUIDAS, carregar_lottie
+
+    return sum(carregar_lottie(url) is not None for url in ANIMACOES_DISTRIBUIDAS)
+
+
+def _pib():
+    from busca_paises import obter_indice
+    from dados_pib import carregar_pib
+    from indicadores_pib import obter_indicadores
+
+    dados = carregar_pib()
+    obter_indicadores(dados)
+    obter_indice(dados)
+    return len(dados)
+
+
+class Aquecimento:
+    """
+    Executa as etapas de aquecimento e registra a duração de cada uma.
+
+    Args:
+        caminho_base: Pasta com uma subpasta por projeto
+        aguardar_miniaturas: Espera as miniaturas pendentes ficarem prontas;
+            se False, elas continuam em segundo plano e a prontidão só é
+            sinalizada quando terminarem
+        importar_dependencias: Pré-importa IMPORTACOES; desligado no
+            aquecimento iniciado pelo app, para que cada processo só carregue
+            as dependências das páginas efetivamente visitadas
+    """
+
+    def __init__(self, caminho_base: str = IMAGENS_DIR, aguardar_miniaturas: bool = True,
+                 importar_dependencias: bool = True):
+        self.caminho_base = caminho_base
+        self.aguardar_miniaturas = aguardar_miniaturas
+        self.importar_dependencias = importar_dependencias
+        self.etapas = {}
+        self.erros = {}
+        self.duracao = None
+        self._pronto = threading.Event()
+
+    @property
+    def pronto(self) -> bool:
+        return self._pronto.is_set()
+
+    def aguardar(self, timeout: float = None) -> bool:
+        """
+        Args:
+            timeout: Tempo máximo de espera em segundos
+
+        Returns:
+            True se o aquecimento terminou dentro do prazo
+        """
+        return self._pronto.wait(timeout)
+
+    def _indice_projetos(self):
+        from indice_projetos import obter_indice
+
+        return len(obter_indice(self.caminho_base).projetos())
+
+    def _estaticos(self):
+        import ativos_estaticos
+        from indice_projetos import obter_indice
+        from miniaturas import LARGURA_GALERIA
+
+        if not ativos_estaticos.habilitado():
+            return 0
+        return ativos_estaticos.sincronizar(obter_indice(self.caminho_base).projetos(), LARGURA_GALERIA)
+
+    def _busca(self):
+        from busca_conteudo import obter_busca
+
+        return len(obter_busca(self.caminho_base).indice)
+
+    def _etapa(self, nome: str, funcao):
+        inicio = time.perf_counter()
+        try:
+            resultado = funcao()
+        except Exception as e:
+            self.erros[nome] = str(e)
+            logger.error("Aquecimento: etapa %s falhou: %s", nome, e)
+            resultado = None
+        self.etapas[nome] = time.perf_counter() - inicio
+        return resultado
+
+    def executar(self, publicar: bool = True) -> dict:
+        """
+        Executa todas as etapas e bloqueia até terminar (exceto as miniaturas,
+        se aguardar_miniaturas for False).
+
+        Args:
+            publicar: Grava o arquivo de prontidão ao final
+
+        Returns:
+            Relatório (ver relatorio())
+        """
+        inicio = time.perf_counter()
+        if self.importar_dependencias:
+            self._etapa("importacoes", _importacoes)
+        self._etapa("fragmentos", _fragmentos)
+        self._etapa("indice_projetos", self._indice_projetos)
+        self._etapa("busca", self._busca)
+        self._etapa("lottie", _lottie)
+        self._etapa("pib", _pib)
+
+        from preprocessamento import iniciar_galeria
+
+        galeria = self._etapa("miniaturas", lambda: iniciar_galeria(self.caminho_base))
+
+        def _concluir():
+            if galeria is not None:
+                espera = time.perf_counter()
+                galeria.aguardar()
+                self.etapas["miniaturas"] += time.perf_counter() - espera
+            self._etapa("estaticos", self._estaticos)
+            self.duracao = time.perf_counter() - inicio
+            self._pronto.set()
+            logger.info(
+                "Aquecimento concluído em %.2fs (%s)", self.duracao,
+                ", ".join(f"{nome} {segundos:.2f}s" for nome, segundos in self.etapas.items()),
+            )
+            if publicar:
+                self._publicar()
+
+        if self.aguardar_miniaturas:
+            _concluir()
+        else:
+            threading.Thread(target=_concluir, name="aquecimento-prontidao", daemon=True).start()
+        return self.relatorio()
+
+    def _publicar(self):
+        os.makedirs(os.path.dirname(ARQUIVO_PRONTO), exist_ok=True)
+        temporario = f"{ARQUIVO_PRONTO}.{os.getpid()}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            json.dump(dict(self.relatorio(), pid=os.getpid(), concluido_em=time.time()), arquivo)
+        os.replace(temporario, ARQUIVO_PRONTO)
+
+    def relatorio(self) -> dict:
+        """
+        Returns:
+            Dicionário com pronto, duração total, duração por etapa e erros
+        """
+        return {
+            "pronto": self.pronto,
+            "duracao": self.duracao,
+            "etapas": dict(self.etapas),
+            "erros": dict(self.erros),
+        }
+
+    def estatisticas(self) -> dict:
+        """Métricas numéricas para o coletor do módulo metricas."""
+        estatisticas = {"pronto": int(self.pronto), "duracao_s": self.duracao or 0.0}
+        estatisticas.update({f"etapa_{nome}_s": segundos for nome, segundos in self.etapas.items()})
+        return estatisticas
+
+
+_aquecimento = None
+_aquecimento_lock = threading.Lock()
+
+
+def aquecer(caminho_base: str = IMAGENS_DIR, aguardar_miniaturas: bool = True,
+            em_segundo_plano: bool = False, importar_dependencias: bool = True) -> Aquecimento:
+    """
+    Aquece os caches do processo na primeira chamada; as seguintes não fazem nada.
+
+    Um arquivo de prontidão deixado por um processo anterior não vale para
+    este: pronto() confere se o PID gravado ainda está vivo.
+
+    Args:
+        caminho_base: Pasta com uma subpasta por projeto
+        aguardar_miniaturas: Ver Aquecimento
+        em_segundo_plano: Executa as etapas em uma thread e retorna imediatamente
+        importar_dependencias: Ver Aquecimento
+
+    Returns:
+        O Aquecimento do processo
+    """
+    global _aquecimento
+    if _aquecimento is not None:
+        return _aquecimento
+    with _aquecimento_lock:
+        if _aquecimento is None:
+            aquecimento = Aquecimento(caminho_base, aguardar_miniaturas, importar_dependencias)
+            metricas.registrar_coletor("aquecimento", aquecimento.estatisticas)
+            if em_segundo_plano:
+                threading.Thread(target=aquecimento.executar, name="aquecimento", daemon=True).start()
+            else:
+                aquecimento.executar()
+            _aquecimento = aquecimento
+    return _aquecimento
+
+
+def ler_prontidao():
+    """
+    Returns:
+        Conteúdo do arquivo de prontidão ou None se não existir
+    """
+    try:
+        with open(ARQUIVO_PRONTO, encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):
+        return None
+
+
+def _processo_vivo(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _servidor_responde(url: str) -> bool:
+    from urllib.error import URLError
+    from urllib.request import urlopen
+
+    try:
+        with urlopen(url, timeout=2) as resposta:
+            return resposta.status == 200
+    except (URLError, OSError):
+        return False
+
+
+def pronto(url: str = None) -> bool:
+    """
+    Indica se um processo vivo terminou o aquecimento.
+
+    Args:
+        url: Endereço opcional que também precisa responder 200 (ex.: o
+            /_stcore/health do Streamlit)
+
+    Returns:
+        True se o servidor está pronto para receber visitantes
+    """
+    prontidao = ler_prontidao()
+    if not prontidao or not _processo_vivo(int(prontidao.get("pid", 0))):
+        return False
+    return url is None or _servidor_responde(url)
+
+
+def aguardar_pronto(timeout: float, url: str = None) -> bool:
+    """
+    Aguarda o arquivo de prontidão (e, opcionalmente, a resposta do servidor).
+
+    Args:
+        timeout: Tempo máximo de espera em segundos
+        url: Ver pronto()
+
+    Returns:
+        True se ficou pronto dentro do prazo
+    """
+    limite = time.monotonic() + timeout
+    while not pronto(url):
+        if time.monotonic() >= limite:
+            return False
+        time.sleep(INTERVALO_ESPERA)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Aquece os caches do portfólio ou aguarda a prontidão do servidor.")
+    parser.add_argument("--aguardar", action="store_true", help="Aguarda o servidor terminar o aquecimento")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Tempo máximo de espera (segundos)")
+    parser.add_argument("--url", default=None, help="Endereço que também precisa responder 200")
+    parser.add_argument("--base", default=IMAGENS_DIR, help="Pasta com as imagens dos projetos")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.aguardar:
+        inicio = time.perf_counter()
+        if not aguardar_pronto(args.timeout, args.url):
+            print(f"Servidor não ficou pronto em {args.timeout:.0f}s", file=sys.stderr)
+            sys.exit(1)
+        print(f"Servidor pronto (aguardado {time.perf_counter() - inicio:.1f}s)")
+        return
+
+    relatorio = Aquecimento(args.base).executar(publicar=False)
+    for nome, segundos in relatorio["etapas"].items():
+        print(f"{nome:<16} {segundos * 1000:9.1f} ms")
+    print(f"{'total':<16} {relatorio['duracao'] * 1000:9.1f} ms")
+    if relatorio["erros"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Publicação das imagens da galeria no diretório static/ servido pelo Streamlit.
+
+st.image(caminho) copia o arquivo para o gerenciador de mídia em memória de
+cada sessão e o serve em uma URL válida apenas para ela: a memória do
+servidor cresce com o número de visitantes e o navegador não reaproveita a
+imagem entre sessões. Com server.enableStaticServing, os arquivos de static/
+são lidos do disco e servidos em app/static/. Cada imagem (original ou
+miniatura) é publicada em static/galeria/ com o hash do próprio conteúdo no
+nome; como a URL muda sempre que o conteúdo muda, o navegador pode guardar a
+resposta indefinidamente (servidor.py adiciona Cache-Control immutable).
+
+As imagens já são comprimidas (WEBP/JPEG/PNG), portanto não há variantes
+gzip/brotli: o middleware de compressão do Streamlit também as ignora.
+
+    python ativos_estaticos.py   # publica as miniaturas e remove arquivos obsoletos
+"""
+
+import logging
+import os
+import shutil
+import threading
+
+from configuracao import BASE_DIR, IMAGENS_DIR
+from miniaturas import hash_conteudo
+
+logger = logging.getLogger(__name__)
+
+DIRETORIO_ESTATICO = os.path.join(BASE_DIR, "static")
+DIRETORIO_GALERIA = os.path.join(DIRETORIO_ESTATICO, "galeria")
+# Relativa à página do app, como na documentação do static serving do Streamlit
+PREFIXO_URL = "app/static/galeria/"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# URL publicada memorizada por (mtime, tamanho) do arquivo de origem
+_publicados = {}
+_lock = threading.Lock()
+
+
+def habilitado() -> bool:
+    """Indica se o Streamlit está servindo o diretório static/."""
+    import streamlit as st
+
+    try:
+        return bool(st.get_option("server.enableStaticServing"))
+    except RuntimeError:
+        return False
+
+
+def nome_publicado(caminho: str) -> str:
+    """
+    Args:
+        caminho: Arquivo de imagem
+
+    Returns:
+        Nome do arquivo em static/galeria/ (hash do conteúdo + extensão)
+    """
+    return hash_conteudo(caminho) + os.path.splitext(caminho)[1].lower()
+
+
+def publicar(caminho: str):
+    """
+    Copia a imagem para static/galeria/ sob o hash do conteúdo, se ainda não estiver lá.
+
+    A cópia (em vez de link) garante que o arquivo publicado nunca mude,
+    mesmo que a origem seja editada no lugar.
+
+    Args:
+        caminho: Arquivo de imagem (original ou miniatura)
+
+    Returns:
+        URL relativa da imagem ou None se a publicação falhar
+    """
+    try:
+        info = os.stat(caminho)
+        assinatura = (info.st_mtime_ns, info.st_size)
+        with _lock:
+            memorizado = _publicados.get(caminho)
+        if memorizado and memorizado[0] == assinatura:
+            return memorizado[1]
+
+        nome = nome_publicado(caminho)
+        destino = os.path.join(DIRETORIO_GALERIA, nome)
+        if not os.path.exists(destino):
+            os.makedirs(DIRETORIO_GALERIA, exist_ok=True)
+            temporario = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+            shutil.copyfile(caminho, temporario)
+            os.replace(temporario, destino)
+    except OSError as e:
+        logger.warning("Não foi possível publicar %s em %s: %s", caminho, DIRETORIO_GALERIA, e)
+        return None
+
+    url = PREFIXO_URL + nome
+    with _lock:
+        _publicados[caminho] = (assinatura, url)
+    return url
+
+
+def limpar(em_uso) -> int:
+    """
+    Remove de static/galeria/ os arquivos que não estão em `em_uso`.
+
+    Args:
+        em_uso: Nomes (ver nome_publicado) que devem ser mantidos
+
+    Returns:
+        Quantidade de arquivos removidos
+    """
+    em_uso = set(em_uso)
+    removidos = 0
+    try:
+        nomes = os.listdir(DIRETORIO_GALERIA)
+    except OSError:
+        return 0
+    for nome in nomes:
+        if nome.startswith(".") or nome in em_uso:
+            continue
+        try:
+            os.remove(os.path.join(DIRETORIO_GALERIA, nome))
+            removidos += 1
+        except OSError as e:
+            logger.warning("Não foi possível remover %s: %s", nome, e)
+    return removidos
+
+
+def sincronizar(projetos: list, largura: int) -> int:
+    """
+    Publica as miniaturas já geradas dos projetos e remove os arquivos obsoletos.
+
+    Originais são publicados sob demanda (ao abrir a resolução original) e
+    mantidos enquanto a imagem de origem não mudar.
+
+    Args:
+        projetos: Lista de projetos (ver indice_projetos.IndiceProjetos.projetos)
+        largura: Largura das miniaturas exibidas na galeria
+
+    Returns:
+        Quantidade de arquivos mantidos em static/galeria/
+    """
+    from miniaturas import LARGURAS_MINIATURA, miniatura_existente
+
+    em_uso = set()
+    for projeto in projetos:
+        for imagem in projeto["imagens"]:
+            try:
+                em_uso.add(nome_publicado(imagem))
+            except OSError:
+                continue
+            for largura_miniatura in {largura, *LARGURAS_MINIATURA}:
+                miniatura = miniatura_existente(imagem, largura_miniatura)
+                if miniatura is not None and publicar(miniatura):
+                    em_uso.add(nome_publicado(miniatura))
+    removidos = limpar(em_uso)
+    if removidos:
+        logger.info("%d arquivo(s) obsoleto(s) removido(s) de %s", removidos, DIRETORIO_GALERIA)
+    return len(em_uso)
+
+
+class CacheImutavel:
+    """
+    Middleware ASGI que marca as respostas de static/galeria/ como imutáveis.
+
+    O static serving do Streamlit responde apenas com ETag/Last-Modified, o
+    que obriga o navegador a revalidar cada imagem; com nomes derivados do
+    conteúdo, a revalidação é desnecessária.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or "/" + PREFIXO_URL not in scope["path"]:
+            await self.app(scope, receive, send)
+            return
+
+        async def enviar(mensagem):
+            if mensagem["type"] == "http.response.start" and mensagem["status"] in (200, 304):
+                cabecalhos = [
+                    (nome, valor) for nome, valor in mensagem.get("headers", [])
+                    if nome.lower() != b"cache-control"
+                ]
+                cabecalhos.append((b"cache-control", CACHE_CONTROL.encode("ascii")))
+                mensagem = dict(mensagem, headers=cabecalhos)
+            await send(mensagem)
+
+        await self.app(scope, receive, enviar)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    from indice_projetos import obter_indice
+    from miniaturas import LARGURA_GALERIA
+
+    mantidos = sincronizar(obter_indice(IMAGENS_DIR).projetos(), LARGURA_GALERIA)
+    print(f"{mantidos} arquivo(s) em {DIRETORIO_GALERIA}")
+
+
+if __name__ == "__main__":
+    main()
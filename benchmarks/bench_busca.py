@@ -0,0 +1,75 @@
+"""
+Benchmark da busca de países do explorador do PIB.
+
+Mede a construção do índice e a latência (mediana e p99) de consultas por
+prefixo, com vários termos e aproximadas (com erros de digitação), sempre
+com a memória de consultas limpa, comparando com uma varredura linear dos
+nomes normalizados.
+
+    python benchmarks/bench_busca.py [--repeticoes N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import busca_paises  # noqa: E402
+import dados_pib  # noqa: E402
+
+CONSULTAS = {
+    "prefixo": ["bra", "ger", "united", "s", "CHN", "são tomé"],
+    "vários termos": ["united kingdom", "korea rep", "east asia pacific", "high income"],
+    "aproximada": ["Brasil", "germny", "phillipines", "argentna", "indonezia"],
+}
+
+
+def _percentis(tempos):
+    tempos = sorted(tempos)
+    return tempos[len(tempos) // 2], tempos[min(len(tempos) - 1, int(len(tempos) * 0.99))]
+
+
+def _varredura(nomes_normalizados, consulta):
+    consulta = busca_paises.normalizar(consulta)
+    return [i for i, nome in enumerate(nomes_normalizados) if consulta in nome]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=200)
+    args = parser.parse_args()
+
+    dados = dados_pib.carregar_pib()
+    construcoes = []
+    for _ in range(max(1, args.repeticoes // 20)):
+        inicio = time.perf_counter()
+        indice = busca_paises.IndicePaises(dados.codigos, dados.nomes)
+        construcoes.append(time.perf_counter() - inicio)
+    print(f"{len(dados)} nomes; construção do índice {_percentis(construcoes)[0] * 1000:.2f} ms")
+    print(f"{'consulta':>14} {'p50':>9} {'p99':>9} {'varredura':>10}  primeiro resultado")
+
+    nomes = [busca_paises.normalizar(nome) for nome in dados.nomes]
+    for tipo, consultas in CONSULTAS.items():
+        tempos, varreduras = [], []
+        for _ in range(args.repeticoes):
+            for consulta in consultas:
+                indice._memoria.clear()
+                inicio = time.perf_counter()
+                indice.buscar(consulta)
+                tempos.append(time.perf_counter() - inicio)
+                inicio = time.perf_counter()
+                _varredura(nomes, consulta)
+                varreduras.append(time.perf_counter() - inicio)
+        p50, p99 = _percentis(tempos)
+        primeiros = ", ".join(
+            f"{consulta}→{(indice.buscar(consulta, limite=1) or [busca_paises.Resultado('-', '', '', 0)])[0].codigo}"
+            for consulta in consultas
+        )
+        print(f"{tipo:>14} {p50 * 1000:6.3f} ms {p99 * 1000:6.3f} ms {_percentis(varreduras)[0] * 1000:7.3f} ms  {primeiros}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark da busca textual no currículo e nos projetos.
+
+Mede a montagem do índice a partir de Imagem/ e do conteúdo do currículo e,
+para algumas consultas, a latência p50/p99 de uma busca sem memória (índice
+recém-alterado) e de uma busca repetida, como acontece a cada reexecução do
+script do Streamlit.
+
+    python benchmarks/bench_busca_conteudo.py [--repeticoes N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from busca_conteudo import BuscaConteudo  # noqa: E402
+from configuracao import IMAGENS_DIR  # noqa: E402
+from indice_projetos import IndiceProjetos  # noqa: E402
+
+CONSULTAS = ["postgis", "drone", "dengue", "banco de dados espacial", "análises", "geo", "python r shiny"]
+
+
+def _percentil(tempos, p):
+    ordenados = sorted(tempos)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=500)
+    args = parser.parse_args()
+
+    indice_projetos = IndiceProjetos(IMAGENS_DIR)
+    indice_projetos.projetos()
+    inicio = time.perf_counter()
+    busca = BuscaConteudo(indice_projetos)
+    montagem = time.perf_counter() - inicio
+    estatisticas = busca.indice.estatisticas()
+    print(f"{estatisticas['documentos']} documentos, {estatisticas['termos']} termos; "
+          f"montagem {montagem * 1000:.1f} ms")
+
+    print(f"{'consulta':<26} {'result.':>7} {'p50 fria':>10} {'p99 fria':>10} {'repetida':>10}")
+    for consulta in CONSULTAS:
+        frias, repetidas = [], []
+        for _ in range(args.repeticoes):
+            busca.indice._memoria.clear()
+            inicio = time.perf_counter()
+            resultados = busca.buscar(consulta)
+            frias.append(time.perf_counter() - inicio)
+            inicio = time.perf_counter()
+            busca.buscar(consulta)
+            repetidas.append(time.perf_counter() - inicio)
+        print(f"{consulta:<26} {len(resultados):>7} {_percentil(frias, 0.5) * 1000:>7.3f} ms "
+              f"{_percentil(frias, 0.99) * 1000:>7.3f} ms {_percentil(repetidas, 0.5) * 1000:>7.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
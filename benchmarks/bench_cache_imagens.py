@@ -0,0 +1,69 @@
+"""
+Benchmark do cache de imagens com orçamento de bytes.
+
+Simula visitantes abrindo as imagens de Imagem/ com popularidade desigual
+(as capas são as mais vistas) e mede, para alguns orçamentos, a taxa de
+acerto, os descartes, os bytes em memória e o tempo por leitura, comparando
+com a leitura direta do disco.
+
+    python benchmarks/bench_cache_imagens.py [--leituras N] [--orcamentos 4,16,64]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from cache_imagens import CacheImagens  # noqa: E402
+from configuracao import IMAGENS_DIR  # noqa: E402
+from indice_projetos import IndiceProjetos  # noqa: E402
+
+
+def _sequencia(projetos, leituras, semente=42):
+    """Acessos com peso 1/(posição + 1) dentro de cada projeto e entre projetos."""
+    imagens, pesos = [], []
+    for i, projeto in enumerate(projetos):
+        for j, imagem in enumerate(projeto["imagens"]):
+            imagens.append(imagem)
+            pesos.append(1.0 / (i + 1) / (j + 1))
+    return random.Random(semente).choices(imagens, pesos, k=leituras)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--leituras", type=int, default=5000)
+    parser.add_argument("--orcamentos", default="4,16,64", help="Orçamentos em MiB, separados por vírgula")
+    args = parser.parse_args()
+
+    projetos = IndiceProjetos(IMAGENS_DIR).projetos()
+    sequencia = _sequencia(projetos, args.leituras)
+    total = sum(os.path.getsize(imagem) for projeto in projetos for imagem in projeto["imagens"])
+    print(f"{sum(len(p['imagens']) for p in projetos)} imagens, {total / 1024 / 1024:.1f} MiB em disco; "
+          f"{args.leituras} leituras")
+
+    inicio = time.perf_counter()
+    for caminho in sequencia:
+        with open(caminho, "rb") as arquivo:
+            arquivo.read()
+    disco = (time.perf_counter() - inicio) / len(sequencia)
+    print(f"{'disco':>10} {'':>8} {'':>10} {'':>10} {disco * 1e6:9.1f} µs/leitura")
+
+    print(f"{'orçamento':>10} {'acertos':>8} {'descartes':>10} {'residente':>10}")
+    for mib in (float(valor) for valor in args.orcamentos.split(",")):
+        cache = CacheImagens(int(mib * 1024 * 1024))
+        inicio = time.perf_counter()
+        for caminho in sequencia:
+            cache.ler(caminho)
+        por_leitura = (time.perf_counter() - inicio) / len(sequencia)
+        estatisticas = cache.estatisticas()
+        taxa = estatisticas["acertos"] / len(sequencia)
+        print(f"{mib:>6.0f} MiB {taxa:>8.1%} {estatisticas['descartes']:>10} "
+              f"{estatisticas['bytes'] / 1024 / 1024:>6.1f} MiB {por_leitura * 1e6:9.1f} µs/leitura")
+
+
+if __name__ == "__main__":
+    main()
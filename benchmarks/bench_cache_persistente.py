@@ -0,0 +1,67 @@
+"""
+Benchmark do cache persistente (memória + SQLite).
+
+Para as figuras de ranking do PIB de vários anos, compara o tempo de
+construir e serializar cada figura (processo frio, sem cache), de lê-la do
+disco (processo reiniciado) e de lê-la da memória, pelo mesmo caminho que a
+página usa (graficos_pib.figura_ranking) e com um banco temporário.
+
+    python benchmarks/bench_cache_persistente.py [--anos N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import dados_pib  # noqa: E402
+import graficos_pib  # noqa: E402
+from cache_persistente import CachePersistente  # noqa: E402
+
+
+def _mediana(tempos):
+    return sorted(tempos)[len(tempos) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--anos", type=int, default=20)
+    args = parser.parse_args()
+
+    dados = dados_pib.carregar_pib()
+    anos = [int(ano) for ano in dados.anos[-args.anos:]]
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, "cache.db")
+
+        def medir(cache):
+            graficos_pib.obter_cache_persistente = lambda: cache
+            tempos = []
+            for ano in anos:
+                inicio = time.perf_counter()
+                graficos_pib.figura_ranking(dados, ano)
+                tempos.append(time.perf_counter() - inicio)
+            return _mediana(tempos)
+
+        # Processo frio sem nada em disco; depois um reinício (memória vazia,
+        # mesmo arquivo); por fim o mesmo processo, já com as figuras em memória
+        graficos_pib._cache = graficos_pib.CacheFiguras()
+        construcao = medir(CachePersistente(caminho))
+        graficos_pib._cache = graficos_pib.CacheFiguras()
+        cache = CachePersistente(caminho)
+        disco = medir(cache)
+        memoria = medir(cache)
+
+        estatisticas = cache.estatisticas()
+        print(f"{len(anos)} figuras, {estatisticas['bytes_disco'] / 1024:.0f} KiB em disco")
+        print(f"{'construir':>10} {construcao * 1000:8.2f} ms/figura")
+        print(f"{'disco':>10} {disco * 1000:8.2f} ms/figura")
+        print(f"{'memória':>10} {memoria * 1000:8.3f} ms/figura")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark do cache de fragmentos HTML.
+
+Compara, por rerun, o custo de montar o HTML estático das páginas da forma
+antiga (concatenação a cada execução) com a leitura dos fragmentos
+pré-montados, e mede o tempo de script de um rerun completo de cada página
+com o AppTest do Streamlit.
+
+    python benchmarks/bench_fragmentos.py [--repeticoes N] [--sem-app]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import fragmentos_html  # noqa: E402
+from conteudo import SECOES_CURRICULO  # noqa: E402
+
+
+def _rerun_antigo(links):
+    """Reproduz o trabalho feito a cada rerun antes do cache de fragmentos."""
+    # Barra de links montada nas três páginas
+    for _ in range(3):
+        links_html = '<div class="icone-rede">'
+        for link in links:
+            links_html += f'<a href="{link["url"]}" target="_blank" title="{link["label"]}">{link["icon"]}</a> '
+        links_html += '</div>'
+    # Listas do currículo reconstruídas a partir dos dados
+    for secao in SECOES_CURRICULO:
+        fragmentos_html.construir_secao(secao)
+    return links_html
+
+
+def _rerun_novo():
+    fragmentos_html.obter("links_sociais")
+    for secao in SECOES_CURRICULO:
+        fragmentos_html.obter(f"curriculo_{secao['id']}")
+    return fragmentos_html.obter("links_sociais")
+
+
+def _medir(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes
+
+
+def _medir_paginas(repeticoes):
+    from streamlit.testing.v1 import AppTest
+
+    resultados = {}
+    for pagina in ("Home", "Currículo", "Portfólio", "Contato"):
+        app = AppTest.from_file(os.path.join(RAIZ, "streamlit_app.py"), default_timeout=120)
+        app.session_state["page"] = pagina
+        app.run()  # primeiro rerun aquece caches e imports
+        tempos = []
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            app.run()
+            tempos.append(time.perf_counter() - inicio)
+        resultados[pagina] = sorted(tempos)[len(tempos) // 2]
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=2000)
+    parser.add_argument("--sem-app", action="store_true", help="Não mede reruns completos com AppTest")
+    args = parser.parse_args()
+
+    links = fragmentos_html.links_com_icone()
+    antes = _medir(lambda: _rerun_antigo(links), args.repeticoes)
+    depois = _medir(_rerun_novo, args.repeticoes)
+    print(f"HTML estático por rerun: antes {antes * 1e6:8.1f} µs | depois {depois * 1e6:8.1f} µs "
+          f"({antes / depois:.0f}x)")
+
+    if not args.sem_app:
+        for pagina, segundos in _medir_paginas(max(3, args.repeticoes // 200)).items():
+            print(f"Rerun completo ({pagina:9}): mediana {segundos * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
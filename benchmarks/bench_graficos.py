@@ -0,0 +1,81 @@
+"""
+Benchmark das figuras do explorador do PIB.
+
+Para seleções com quantidades crescentes de países, mede o tamanho do JSON
+da figura (payload enviado ao navegador por interação) com e sem a
+decimação LTTB, e o tempo de uma interação com a figura construída do zero
+e servida pelo cache de figuras. O tempo inclui a serialização que o
+st.plotly_chart faz da figura recebida.
+
+    python benchmarks/bench_graficos.py [--repeticoes N] [--orcamento PONTOS]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import plotly.io as pio  # noqa: E402
+import plotly.tools  # noqa: E402
+
+import dados_pib  # noqa: E402
+import graficos_pib  # noqa: E402
+from indicadores_pib import IndicadoresPIB  # noqa: E402
+
+
+def _payload_streamlit(figura) -> str:
+    """Reproduz a conversão feita por st.plotly_chart antes do envio."""
+    figura = plotly.tools.return_figure_from_figure_or_data(figura, validate_figure=True)
+    return pio.to_json(figura, validate=False)
+
+
+def _medir(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return sorted(tempos)[len(tempos) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=10)
+    parser.add_argument("--orcamento", type=int, default=graficos_pib.ORCAMENTO_PONTOS,
+                        help="Pontos por figura antes da decimação")
+    args = parser.parse_args()
+
+    dados = dados_pib.carregar_pib()
+    indicadores = IndicadoresPIB(dados)
+    print(f"Orçamento: {args.orcamento} pontos por figura")
+    print(f"{'países':>6} {'sem LTTB':>10} {'com LTTB':>10} {'construção':>12} {'cache':>9}")
+
+    for quantidade in (5, 20, 60, 120, len(dados)):
+        codigos = dados.codigos[:quantidade]
+
+        graficos_pib.ORCAMENTO_PONTOS = 10 ** 9
+        completo = graficos_pib.figura_evolucao(dados, indicadores, codigos, 1960, 2022, "pib")
+        graficos_pib.ORCAMENTO_PONTOS = args.orcamento
+
+        def _construir():
+            graficos_pib._cache = graficos_pib.CacheFiguras()
+            especificacao = graficos_pib.figura_evolucao(dados, indicadores, codigos, 1960, 2022, "pib")
+            return _payload_streamlit(graficos_pib._FiguraPronta(json.loads(especificacao)))
+
+        def _do_cache():
+            especificacao = graficos_pib.figura_evolucao(dados, indicadores, codigos, 1960, 2022, "pib")
+            return _payload_streamlit(graficos_pib._FiguraPronta(json.loads(especificacao)))
+
+        tempo_construcao = _medir(_construir, args.repeticoes)
+        decimado = _do_cache()
+        tempo_cache = _medir(_do_cache, args.repeticoes)
+        print(f"{quantidade:6d} {len(completo) / 1024:8.1f} KiB {len(decimado) / 1024:8.1f} KiB "
+              f"{tempo_construcao * 1000:9.1f} ms {tempo_cache * 1000:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark do pipeline de logging em reruns com muitos avisos.
+
+Compara o custo no thread do script de um rerun que registra muitos
+avisos (e-mails inválidos, imagens ausentes) em três configurações, cada
+uma em um processo separado:
+
+- antes: logging.basicConfig com FileHandler síncrono (configuração antiga);
+- fila: registro_log com QueueHandler/QueueListener, sem amostragem;
+- fila+amostragem: registro_log com amostragem de avisos repetidos.
+
+A opção --atraso-disco simula um disco lento (ex.: volume de rede)
+acrescentando um atraso a cada gravação no arquivo.
+
+    python benchmarks/bench_logging.py [--reruns N] [--avisos N] [--atraso-disco MS]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODOS = ("antes", "fila", "fila+amostragem")
+
+
+def _rerun(logger, avisos: int, rodada: int):
+    """Reproduz os registros de um rerun com muitos avisos."""
+    for i in range(avisos):
+        logger.warning("E-mail inválido: %s - %s", f"visitante{rodada}-{i}@", "falta o domínio")
+    logger.error("Erro ao carregar imagem %s: %s", "Imagem/ausente.png", "arquivo não encontrado")
+
+
+def _executar_modo(modo: str, reruns: int, avisos: int, atraso_disco: float) -> dict:
+    import logging
+
+    if atraso_disco:
+        emitir = logging.FileHandler.emit
+
+        def _emitir_lento(self, record):
+            time.sleep(atraso_disco)
+            emitir(self, record)
+
+        logging.FileHandler.emit = _emitir_lento
+
+    arquivo = os.path.join(tempfile.mkdtemp(prefix="bench-logging-"), "portfolio.log")
+    if modo == "antes":
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=[logging.FileHandler(arquivo), logging.StreamHandler()],
+        )
+    else:
+        os.environ["PORTFOLIO_LOG_ARQUIVO"] = arquivo
+        os.environ["PORTFOLIO_LOG_AMOSTRAGEM"] = "60" if modo == "fila+amostragem" else "0"
+        sys.path.insert(0, RAIZ)
+        import registro_log
+
+        registro_log.configurar_logging()
+
+    logger = logging.getLogger("utils")
+    tempos = []
+    inicio_total = time.perf_counter()
+    for rodada in range(reruns):
+        inicio = time.perf_counter()
+        _rerun(logger, avisos, rodada)
+        tempos.append(time.perf_counter() - inicio)
+    no_script = time.perf_counter() - inicio_total
+
+    if modo != "antes":
+        registro_log.encerrar_logging()
+    ate_o_disco = time.perf_counter() - inicio_total
+
+    tempos.sort()
+    with open(arquivo, "rb") as log:
+        linhas = sum(1 for _ in log)
+    return {
+        "p50_ms": tempos[len(tempos) // 2] * 1000,
+        "p99_ms": tempos[min(len(tempos) - 1, int(0.99 * len(tempos)))] * 1000,
+        "script_s": no_script,
+        "total_s": ate_o_disco,
+        "linhas": linhas,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reruns", type=int, default=200)
+    parser.add_argument("--avisos", type=int, default=50, help="Avisos registrados por rerun")
+    parser.add_argument("--atraso-disco", type=float, default=0, help="Atraso por gravação no arquivo, em ms")
+    parser.add_argument("--modo", choices=MODOS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.modo:
+        resultado = _executar_modo(args.modo, args.reruns, args.avisos, args.atraso_disco / 1000)
+        sys.stdout.write(json.dumps(resultado))
+        return
+
+    print(f"{args.reruns} reruns x {args.avisos + 1} registros, atraso de disco {args.atraso_disco} ms")
+    print(f"{'modo':17} {'p50/rerun':>11} {'p99/rerun':>11} {'no script':>10} {'até o disco':>12} {'linhas':>8}")
+    for modo in MODOS:
+        processo = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--modo", modo, "--reruns", str(args.reruns),
+             "--avisos", str(args.avisos), "--atraso-disco", str(args.atraso_disco)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True,
+        )
+        r = json.loads(processo.stdout)
+        print(f"{modo:17} {r['p50_ms']:8.2f} ms {r['p99_ms']:8.2f} ms {r['script_s']:8.2f} s "
+              f"{r['total_s']:10.2f} s {r['linhas']:8d}")
+
+
+if __name__ == "__main__":
+    main()
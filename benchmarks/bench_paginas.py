@@ -0,0 +1,275 @@
+"""
+Benchmark headless das páginas com o AppTest do Streamlit.
+
+Executa cada página de streamlit_app.py e as funções equivalentes de
+pages.py sem servidor, com a rede e o SMTP substituídos por stubs, e
+registra por página:
+
+- mediana do tempo de execução do script por rerun;
+- número de elementos emitidos (deltas);
+- total de bytes dos deltas enviados ao navegador.
+
+Os resultados são comparados com benchmarks/baseline_paginas.json e o
+script termina com código 1 se alguma página regredir além do limite.
+
+    python benchmarks/bench_paginas.py [--repeticoes N] [--limite 0.25]
+    python benchmarks/bench_paginas.py --atualizar-baseline
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CAMINHO_BASELINE = os.path.join(RAIZ, "benchmarks", "baseline_paginas.json")
+
+# Ambiente isolado: sem revalidação de Lottie, sem consultas MX e com uma
+# caixa de saída descartável. Precisa ser definido antes de importar o app.
+_TEMPORARIO = tempfile.mkdtemp(prefix="bench-paginas-")
+os.environ.update({
+    "LOTTIE_REVALIDAR": "0",
+    "EMAIL_VERIFICAR_ENTREGA": "0",
+    "PORTFOLIO_CAIXA_SAIDA": os.path.join(_TEMPORARIO, "caixa_saida.db"),
+    "SMTP_SERVER": "smtp.invalido",
+    "SMTP_PORT": "465",
+    "EMAIL_USUARIO": "bench@exemplo.com",
+    "EMAIL_SENHA": "senha",
+    "EMAIL_DESTINO": "destino@exemplo.com",
+})
+sys.path.insert(0, RAIZ)
+
+PAGINAS = ("Home", "Currículo", "Portfólio", "PIB", "Contato")
+FUNCOES_PAGES = {
+    "Home": "pagina_home",
+    "Currículo": "pagina_curriculo",
+    "Portfólio": "pagina_portfolio",
+    "Contato": "pagina_contato",
+}
+
+# Folga absoluta somada ao limite relativo de tempo, para absorver ruído
+FOLGA_TEMPO_MS = 5.0
+
+_ultima_execucao = {}
+
+
+# ============= STUBS =============
+
+class _SMTPFalso:
+    """Servidor SMTP em memória: aceita tudo e não abre sockets."""
+
+    enviadas = 0
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def ehlo(self, *args, **kwargs):
+        return 250, b"ok"
+
+    def starttls(self, *args, **kwargs):
+        return 220, b"ok"
+
+    def login(self, *args, **kwargs):
+        return 235, b"ok"
+
+    def noop(self):
+        return 250, b"ok"
+
+    def send_message(self, *args, **kwargs):
+        _SMTPFalso.enviadas += 1
+        return {}
+
+    def quit(self):
+        return 221, b"ok"
+
+    def close(self):
+        pass
+
+
+def _instalar_stubs():
+    import smtplib
+
+    import requests
+
+    def _sem_rede(*args, **kwargs):
+        raise requests.exceptions.ConnectionError("rede desabilitada no benchmark")
+
+    requests.Session.request = _sem_rede
+    smtplib.SMTP = _SMTPFalso
+    smtplib.SMTP_SSL = _SMTPFalso
+
+    # Captura os deltas de cada execução antes de virarem a árvore de elementos
+    import streamlit.testing.v1.local_script_runner as executor
+
+    original = executor.parse_tree_from_messages
+
+    def _capturar(mensagens):
+        deltas = [mensagem for mensagem in mensagens if mensagem.WhichOneof("type") == "delta"]
+        _ultima_execucao["elementos"] = len(deltas)
+        _ultima_execucao["bytes"] = sum(delta.ByteSize() for delta in deltas)
+        return original(mensagens)
+
+    executor.parse_tree_from_messages = _capturar
+
+
+# ============= CENÁRIOS =============
+
+def _app(pagina):
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(os.path.join(RAIZ, "streamlit_app.py"), default_timeout=120)
+    app.session_state["page"] = pagina
+    return app
+
+
+def _pages(pagina):
+    from streamlit.testing.v1 import AppTest
+
+    script = (
+        "import sys\n"
+        f"sys.path.insert(0, {RAIZ!r})\n"
+        "import pages\n"
+        "from utils import apply_custom_css\n"
+        "apply_custom_css()\n"
+        f"pages.{FUNCOES_PAGES[pagina]}()\n"
+    )
+    return AppTest.from_string(script, default_timeout=120)
+
+
+def _envio_contato(app):
+    """Preenche e envia o formulário de contato antes do rerun."""
+    app.text_input[0].input("Visitante")
+    app.text_input[1].input("visitante@exemplo.com")
+    app.text_area[0].input("Mensagem de teste do benchmark.")
+    app.button[-1].click()
+
+
+def cenarios():
+    """
+    Returns:
+        Lista de tuplas (nome, fabrica_do_app, acao_antes_do_rerun)
+    """
+    lista = [(f"app:{pagina}", lambda p=pagina: _app(p), None) for pagina in PAGINAS]
+    lista.append(("app:Contato (envio)", lambda: _app("Contato"), _envio_contato))
+    lista += [(f"pages:{pagina}", lambda p=pagina: _pages(p), None) for pagina in FUNCOES_PAGES]
+    return lista
+
+
+def medir(fabrica, acao, repeticoes: int) -> dict:
+    """
+    Mede os reruns de um cenário.
+
+    Args:
+        fabrica: Função que cria o AppTest
+        acao: Função aplicada ao AppTest antes de cada rerun, ou None
+        repeticoes: Quantidade de reruns medidos após o aquecimento
+
+    Returns:
+        Dicionário com tempo_ms (mediana), elementos e bytes
+    """
+    app = fabrica()
+    app.run()  # primeiro rerun aquece caches e imports
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+
+    tempos = []
+    for _ in range(repeticoes):
+        if acao is not None:
+            acao(app)
+        inicio = time.perf_counter()
+        app.run()
+        tempos.append(time.perf_counter() - inicio)
+        if app.exception:
+            raise RuntimeError(app.exception[0].message)
+
+    return {
+        "tempo_ms": round(sorted(tempos)[len(tempos) // 2] * 1000, 2),
+        "elementos": _ultima_execucao["elementos"],
+        "bytes": _ultima_execucao["bytes"],
+    }
+
+
+# ============= BASELINE =============
+
+def carregar_baseline(caminho: str = CAMINHO_BASELINE) -> dict:
+    try:
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+    except FileNotFoundError:
+        return {}
+
+
+def regressoes(resultado: dict, base: dict, limite: float) -> list:
+    """
+    Compara um resultado com a baseline da mesma página.
+
+    Args:
+        resultado: Medição atual
+        base: Medição de referência
+        limite: Aumento relativo tolerado (0.25 = 25%)
+
+    Returns:
+        Lista de descrições das métricas que regrediram
+    """
+    problemas = []
+    teto_tempo = base["tempo_ms"] * (1 + limite) + FOLGA_TEMPO_MS
+    if resultado["tempo_ms"] > teto_tempo:
+        problemas.append(f"tempo {resultado['tempo_ms']:.1f} ms > {teto_tempo:.1f} ms")
+    for metrica in ("elementos", "bytes"):
+        teto = base[metrica] * (1 + limite)
+        if resultado[metrica] > teto:
+            problemas.append(f"{metrica} {resultado[metrica]} > {teto:.0f}")
+    return problemas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=10, help="Reruns medidos por página")
+    parser.add_argument("--limite", type=float, default=None,
+                        help="Regressão relativa tolerada (padrão: o valor salvo na baseline)")
+    parser.add_argument("--atualizar-baseline", action="store_true",
+                        help="Grava os resultados como nova baseline")
+    parser.add_argument("--filtro", default="", help="Mede apenas os cenários cujo nome contém o texto")
+    args = parser.parse_args()
+
+    _instalar_stubs()
+    baseline = carregar_baseline()
+    limite = args.limite if args.limite is not None else baseline.get("limite", 0.25)
+    referencias = baseline.get("paginas", {})
+
+    resultados = {}
+    falhas = 0
+    for nome, fabrica, acao in cenarios():
+        if args.filtro not in nome:
+            continue
+        resultado = medir(fabrica, acao, args.repeticoes)
+        resultados[nome] = resultado
+
+        linha = (f"{nome:22} {resultado['tempo_ms']:8.1f} ms  "
+                 f"{resultado['elementos']:4d} elementos  {resultado['bytes']:7d} bytes")
+        base = referencias.get(nome)
+        if base is not None and not args.atualizar_baseline:
+            problemas = regressoes(resultado, base, limite)
+            if problemas:
+                falhas += 1
+                linha += "  REGRESSÃO: " + "; ".join(problemas)
+        print(linha)
+
+    if args.atualizar_baseline:
+        referencias.update(resultados)
+        with open(CAMINHO_BASELINE, "w", encoding="utf-8") as arquivo:
+            json.dump({"limite": limite, "paginas": referencias}, arquivo, ensure_ascii=False, indent=2)
+            arquivo.write("\n")
+        print(f"Baseline gravada em {os.path.relpath(CAMINHO_BASELINE, RAIZ)}")
+        return 0
+
+    if falhas:
+        print(f"{falhas} página(s) regrediram além de {limite:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
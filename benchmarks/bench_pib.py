@@ -0,0 +1,103 @@
+"""
+Benchmark do carregamento dos dados de PIB.
+
+Compara a leitura ingênua do CSV largo com o pandas, a conversão do CSV
+para a matriz float32 e o carregamento do cache colunar, além da memória
+ocupada por cada representação. Mede também o cálculo completo dos
+indicadores derivados e a atualização incremental quando um novo ano
+(sintético) é acrescentado ao final da matriz.
+
+    python benchmarks/bench_pib.py [--repeticoes N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import numpy as np  # noqa: E402
+
+import dados_pib  # noqa: E402
+import indicadores_pib  # noqa: E402
+
+
+def _medir(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return sorted(tempos)[len(tempos) // 2], resultado
+
+
+def _crescimento_por_linha(dados):
+    """Crescimento ano a ano com laços Python, para comparação."""
+    resultado = []
+    for linha in dados.valores.tolist():
+        resultado.append([None] + [
+            atual / anterior - 1 if anterior and anterior > 0 and atual == atual else None
+            for anterior, atual in zip(linha, linha[1:])
+        ])
+    return resultado
+
+
+def _com_ano_novo(dados):
+    """Acrescenta um ano sintético (último ano × 1,03) ao final da matriz."""
+    nova = dados.valores[:, -1:] * np.float32(1.03)
+    return dados_pib.DadosPIB(
+        dados.nomes, dados.codigos, np.append(dados.anos, dados.anos[-1] + 1),
+        np.concatenate([dados.valores, nova], axis=1),
+    )
+
+
+def _medir_incremental(dados, repeticoes):
+    ampliados = _com_ano_novo(dados)
+    tempos = []
+    for _ in range(repeticoes):
+        motor = indicadores_pib.IndicadoresPIB(dados)
+        inicio = time.perf_counter()
+        motor.atualizar(ampliados)
+        tempos.append(time.perf_counter() - inicio)
+    return sorted(tempos)[len(tempos) // 2], ampliados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeticoes", type=int, default=20)
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    import pandas as pd
+    importacao_pandas = time.perf_counter() - inicio
+
+    tempo_pandas, tabela = _medir(lambda: pd.read_csv(dados_pib.CAMINHO_CSV), args.repeticoes)
+    tempo_csv, _ = _medir(lambda: dados_pib.ler_csv(), args.repeticoes)
+    dados_pib.carregar_pib()  # garante o cache em disco
+    tempo_cache, dados = _medir(lambda: dados_pib.carregar_pib(), args.repeticoes)
+
+    print(f"{len(dados)} países x {len(dados.anos)} anos")
+    print(f"pandas.read_csv (largo)   {tempo_pandas * 1000:7.2f} ms  (+{importacao_pandas * 1000:.0f} ms de import)  "
+          f"{tabela.memory_usage(deep=True).sum() / 1024:7.1f} KiB")
+    print(f"CSV -> matriz float32     {tempo_csv * 1000:7.2f} ms")
+    print(f"cache colunar (.npy)      {tempo_cache * 1000:7.2f} ms  "
+          f"{dados.nbytes / 1024:7.1f} KiB na matriz")
+
+    tempo_laco, _ = _medir(lambda: _crescimento_por_linha(dados), args.repeticoes)
+    tempo_yoy, _ = _medir(lambda: indicadores_pib.crescimento_anual(dados.valores), args.repeticoes)
+    tempo_completo, _ = _medir(lambda: indicadores_pib.IndicadoresPIB(dados), args.repeticoes)
+    tempo_incremental, ampliados = _medir_incremental(dados, args.repeticoes)
+    tempo_reconstrucao, _ = _medir(lambda: indicadores_pib.IndicadoresPIB(ampliados), args.repeticoes)
+
+    print()
+    print(f"crescimento anual (laços Python)      {tempo_laco * 1000:7.2f} ms")
+    print(f"crescimento anual (NumPy)             {tempo_yoy * 1000:7.2f} ms")
+    print(f"indicadores: construção completa      {tempo_completo * 1000:7.2f} ms")
+    print(f"indicadores: +1 ano incremental       {tempo_incremental * 1000:7.2f} ms")
+    print(f"indicadores: +1 ano reconstruindo     {tempo_reconstrucao * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
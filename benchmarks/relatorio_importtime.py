@@ -0,0 +1,142 @@
+"""
+Relatório do custo de importação do ponto de entrada do app.
+
+Executa streamlit_app.py em modo "bare" (sem servidor) com
+``python -X importtime`` e aguarda o aquecimento que o app inicia em segundo
+plano, agrega o tempo cumulativo por pacote de primeiro nível e indica em
+que fase cada dependência pesada foi carregada: na primeira execução do
+script (página Home, medida de novo sem iniciar o aquecimento) ou só no
+aquecimento em segundo plano, fora do caminho da resposta. O resultado é
+gravado em benchmarks/importtime.txt para acompanhar regressões.
+
+    python benchmarks/relatorio_importtime.py [--saida ARQUIVO] [--top N]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAIDA_PADRAO = os.path.join(RAIZ, "benchmarks", "importtime.txt")
+
+# Dependências que só devem ser carregadas pelas páginas que as usam
+DEPENDENCIAS_PESADAS = (
+    "numpy",
+    "pandas",
+    "pyarrow",
+    "plotly",
+    "streamlit_lottie",
+    "email_validator",
+    "dns",
+    "smtplib",
+    "requests",
+    "PIL",
+    "dotenv",
+    "watchdog",
+)
+
+_LINHA = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def medir(script: str = "streamlit_app.py", aquecimento: bool = True):
+    """
+    Executa o script com -X importtime e devolve as linhas interpretadas.
+
+    Args:
+        script: Caminho do ponto de entrada, relativo à raiz do repositório
+        aquecimento: False executa o script sem iniciar o aquecimento em
+            segundo plano (aquecer() vira uma operação nula, mas o app o
+            considera habilitado, como em produção)
+
+    Returns:
+        Lista de tuplas (modulo, proprio_us, cumulativo_us, nivel)
+    """
+    # O aquecimento roda em uma thread; sem esperá-lo, as importações que ele
+    # faz entrariam ou não no relatório conforme a velocidade da máquina
+    preparo = "" if aquecimento else "import aquecimento; aquecimento.aquecer = lambda *a, **k: None\n"
+    codigo = preparo + (
+        f"import runpy; runpy.run_path({script!r}, run_name='__main__')\n"
+        "import aquecimento\n"
+        "if aquecimento._aquecimento is not None: aquecimento._aquecimento.aguardar(120)"
+    )
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        cwd=RAIZ,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "LOTTIE_REVALIDAR": "0", "PORTFOLIO_AQUECIMENTO": "1"},
+    )
+    linhas = []
+    for linha in processo.stderr.splitlines():
+        casamento = _LINHA.match(linha)
+        if casamento:
+            proprio, cumulativo, recuo, modulo = casamento.groups()
+            linhas.append((modulo, int(proprio), int(cumulativo), len(recuo) // 2))
+    return linhas
+
+
+def agregar_por_pacote(linhas) -> dict:
+    """
+    Soma o tempo próprio de cada módulo no seu pacote de primeiro nível.
+
+    Returns:
+        Dicionário pacote -> microssegundos
+    """
+    pacotes = {}
+    for modulo, proprio, _, _ in linhas:
+        pacote = modulo.split(".", 1)[0]
+        pacotes[pacote] = pacotes.get(pacote, 0) + proprio
+    return pacotes
+
+
+def montar_relatorio(linhas, linhas_primeira_execucao, top: int = 20) -> str:
+    pacotes = agregar_por_pacote(linhas)
+    primeira_execucao = agregar_por_pacote(linhas_primeira_execucao)
+    total = sum(pacotes.values())
+
+    partes = [
+        "Custo de importação de streamlit_app.py (python -X importtime, primeira execução e aquecimento)",
+        "",
+        f"Total: {total / 1000:.1f} ms em {len(linhas)} módulos",
+        "",
+        f"{'Pacote':<28}{'ms':>10}",
+    ]
+    for pacote, micros in sorted(pacotes.items(), key=lambda item: item[1], reverse=True)[:top]:
+        partes.append(f"{pacote:<28}{micros / 1000:>10.1f}")
+
+    partes += ["", "Dependências pesadas carregadas na inicialização:"]
+    for pacote in DEPENDENCIAS_PESADAS:
+        if pacote in primeira_execucao:
+            estado = f"{primeira_execucao[pacote] / 1000:>6.1f} ms  primeira execução (Home)"
+        elif pacote in pacotes:
+            estado = f"{pacotes[pacote] / 1000:>6.1f} ms  aquecimento em segundo plano"
+        else:
+            estado = "não carregado"
+        partes.append(f"  {pacote:<26}{estado}")
+    return "\n".join(partes) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--saida", default=SAIDA_PADRAO, help="Arquivo do relatório ('-' para a saída padrão)")
+    parser.add_argument("--top", type=int, default=20, help="Quantidade de pacotes listados")
+    args = parser.parse_args()
+
+    linhas = medir()
+    linhas_primeira_execucao = medir(aquecimento=False)
+    if not linhas or not linhas_primeira_execucao:
+        raise SystemExit("Nenhuma linha de importtime capturada")
+    relatorio = montar_relatorio(linhas, linhas_primeira_execucao, args.top)
+
+    if args.saida == "-":
+        sys.stdout.write(relatorio)
+    else:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(relatorio)
+        sys.stdout.write(relatorio)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+"""
+Busca textual nos projetos do portfólio e nas seções do currículo.
+
+Títulos e descrições dos projetos (indice_projetos), o resumo profissional e
+as seções de conteudo.SECOES_CURRICULO formam um índice invertido montado
+uma única vez por processo. Os termos passam por remoção de acentos e de
+caixa (busca_paises.normalizar), descarte de stopwords e um radicalizador
+leve (plural e gênero), de modo que "análises", "analise" e "Análise" caiam
+no mesmo termo. Os resultados são ordenados por BM25, com o título valendo
+mais que o corpo, e trazem um trecho com os termos destacados.
+
+O índice é atualizado por documento: quando a versão do índice de projetos
+muda (por exemplo, um descricao.txt editado), apenas os projetos cujo
+título ou descrição mudou são reindexados.
+
+    python busca_conteudo.py postgis drone [--limite N]
+"""
+
+import argparse
+import collections
+import math
+import re
+import threading
+from bisect import bisect_left
+from html import escape
+
+from busca_paises import normalizar
+from conteudo import RESUMO_PROFISSIONAL, SECOES_CURRICULO
+
+# Parâmetros do BM25
+K1 = 1.2
+B = 0.75
+# Ocorrências no título contam como PESO_TITULO ocorrências no corpo
+PESO_TITULO = 3
+
+LIMITE_PADRAO = 8
+PALAVRAS_TRECHO = 28
+MAX_EXPANSOES_PREFIXO = 12
+# Cada interação do visitante reexecuta o script e repete a mesma consulta
+MAX_CONSULTAS_MEMORIZADAS = 128
+TAMANHO_MINIMO_PREFIXO = 3
+
+STOPWORDS = frozenset("""
+a ao aos as ate com como da das de dela delas dele deles depois do dos e ela elas ele eles em entre
+era essa essas esse esses esta estas este estes eu foi for isso isto ja la lhe lhes mais mas me mesmo
+meu meus minha minhas muito na nas nao nem no nos nossa nossas nosso nossos num numa o os ou para
+pela pelas pelo pelos por qual quando que quem se sem ser seu seus so sua suas tambem te tem ter teu
+tua um uma umas uns voce voces etc and of the to in for
+""".split())
+
+# Plurais mais comuns, do sufixo mais longo para o mais curto (texto já sem acentos)
+_PLURAIS = (
+    ("coes", "cao"), ("soes", "sao"), ("oes", "ao"), ("aes", "ao"), ("ais", "al"), ("eis", "el"),
+    ("ois", "ol"), ("res", "r"), ("zes", "z"), ("ns", "m"),
+)
+
+Resultado = collections.namedtuple("Resultado", ["id", "tipo", "titulo", "pagina", "pontuacao", "trecho"])
+
+_palavra = re.compile(r"\w+")
+
+
+def radical(termo: str) -> str:
+    """
+    Reduz um termo normalizado a um radical leve (plural e gênero).
+
+    Args:
+        termo: Termo já normalizado (sem acentos, minúsculo)
+
+    Returns:
+        Radical usado no índice
+    """
+    if len(termo) <= 3 or termo.isdigit():
+        return termo
+    for sufixo, troca in _PLURAIS:
+        if termo.endswith(sufixo) and len(termo) - len(sufixo) >= 2:
+            termo = termo[:-len(sufixo)] + troca
+            break
+    else:
+        if termo.endswith("s") and not termo.endswith(("ss", "us", "is")):
+            termo = termo[:-1]
+    # Gênero/vogal temática: "costeira" e "costeiro" viram "costeir"
+    if len(termo) > 4 and termo[-1] in "aoe":
+        termo = termo[:-1]
+    return termo
+
+
+def termos(texto: str) -> list:
+    """
+    Tokeniza um texto em radicais, sem stopwords.
+
+    Returns:
+        Lista de radicais na ordem do texto
+    """
+    resultado = []
+    for palavra in normalizar(texto).split():
+        if palavra not in STOPWORDS and (len(palavra) > 1 or palavra.isdigit()):
+            resultado.append(radical(palavra))
+    return resultado
+
+
+def _tokens_posicionados(texto: str) -> list:
+    """Lista de (início, fim, radical ou None para stopword) de cada palavra do texto."""
+    tokens = []
+    for encontrado in _palavra.finditer(texto):
+        normalizada = normalizar(encontrado.group())
+        partes = normalizada.split()
+        if len(partes) != 1 or partes[0] in STOPWORDS:
+            tokens.append((encontrado.start(), encontrado.end(), None))
+        else:
+            tokens.append((encontrado.start(), encontrado.end(), radical(partes[0])))
+    return tokens
+
+
+class _Documento:
+    __slots__ = ("id", "tipo", "titulo", "pagina", "texto", "frequencias", "comprimento", "tokens", "posicoes")
+
+    def __init__(self, id_documento, tipo, titulo, pagina, texto):
+        self.id = id_documento
+        self.tipo = tipo
+        self.titulo = titulo
+        self.pagina = pagina
+        self.texto = texto
+        self.frequencias = collections.Counter(termos(texto))
+        for termo in termos(titulo):
+            self.frequencias[termo] += PESO_TITULO
+        self.comprimento = sum(self.frequencias.values())
+        # Posições das palavras e de cada radical, usadas apenas nos trechos
+        self.tokens = _tokens_posicionados(texto)
+        self.posicoes = collections.defaultdict(list)
+        for i, (_, _, termo) in enumerate(self.tokens):
+            if termo is not None:
+                self.posicoes[termo].append(i)
+
+
+class IndiceBusca:
+    """
+    Índice invertido com ranqueamento BM25 e atualização por documento.
+    """
+
+    def __init__(self):
+        self._documentos = {}
+        self._postagens = collections.defaultdict(dict)
+        self._comprimento_total = 0
+        self._vocabulario = None
+        self._memoria = collections.OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._documentos)
+
+    def definir(self, id_documento: str, tipo: str, titulo: str, pagina: str, texto: str) -> bool:
+        """
+        Adiciona ou substitui um documento.
+
+        Args:
+            id_documento: Identificador único (ex.: "projeto:<slug>")
+            tipo: "projeto" ou "curriculo"
+            titulo: Título exibido no resultado
+            pagina: Página do app onde o conteúdo aparece
+            texto: Corpo indexado e usado nos trechos
+
+        Returns:
+            False se o documento já estava indexado com o mesmo conteúdo
+        """
+        with self._lock:
+            anterior = self._documentos.get(id_documento)
+            if anterior is not None and (anterior.titulo, anterior.texto, anterior.pagina) == (titulo, texto, pagina):
+                return False
+            documento = _Documento(id_documento, tipo, titulo, pagina, texto)
+            if anterior is not None:
+                self._retirar(anterior)
+            self._documentos[id_documento] = documento
+            for termo, frequencia in documento.frequencias.items():
+                if termo not in self._postagens:
+                    self._vocabulario = None
+                self._postagens[termo][id_documento] = frequencia
+            self._comprimento_total += documento.comprimento
+            self._memoria.clear()
+            return True
+
+    def remover(self, id_documento: str) -> bool:
+        with self._lock:
+            documento = self._documentos.pop(id_documento, None)
+            if documento is None:
+                return False
+            self._retirar(documento)
+            return True
+
+    def _retirar(self, documento: _Documento):
+        for termo in documento.frequencias:
+            postagem = self._postagens[termo]
+            postagem.pop(documento.id, None)
+            if not postagem:
+                del self._postagens[termo]
+                self._vocabulario = None
+        self._comprimento_total -= documento.comprimento
+        self._memoria.clear()
+
+    def ids(self, prefixo: str = "") -> set:
+        with self._lock:
+            return {id_documento for id_documento in self._documentos if id_documento.startswith(prefixo)}
+
+    def _expandir(self, termo: str) -> list:
+        """Termos do vocabulário que começam com `termo` (consultas digitadas pela metade)."""
+        if self._vocabulario is None:
+            self._vocabulario = sorted(self._postagens)
+        expansoes = []
+        i = bisect_left(self._vocabulario, termo)
+        while i < len(self._vocabulario) and self._vocabulario[i].startswith(termo):
+            expansoes.append(self._vocabulario[i])
+            if len(expansoes) >= MAX_EXPANSOES_PREFIXO:
+                break
+            i += 1
+        return expansoes
+
+    def _termos_consulta(self, consulta: str) -> dict:
+        """Radical da consulta -> termos do índice que ele alcança."""
+        alcance = {}
+        for palavra in normalizar(consulta).split():
+            if palavra in STOPWORDS:
+                continue
+            termo = radical(palavra)
+            if termo in self._postagens:
+                alcance[termo] = [termo]
+            elif len(palavra) >= TAMANHO_MINIMO_PREFIXO:
+                # "postg" alcança "postgis"; a palavra sem radicalizar evita
+                # perder letras que o usuário digitou
+                alcance[termo] = self._expandir(palavra) or self._expandir(termo)
+        return alcance
+
+    def buscar(self, consulta: str, limite: int = LIMITE_PADRAO) -> list:
+        """
+        Procura documentos que contenham algum termo da consulta.
+
+        Args:
+            consulta: Texto digitado
+            limite: Quantidade máxima de resultados
+
+        Returns:
+            Lista de Resultado, do mais para o menos relevante
+        """
+        chave = (normalizar(consulta), limite)
+        with self._lock:
+            resultados = self._memoria.get(chave)
+            if resultados is not None:
+                self._memoria.move_to_end(chave)
+                return resultados
+            resultados = self._buscar(consulta, limite)
+            self._memoria[chave] = resultados
+            while len(self._memoria) > MAX_CONSULTAS_MEMORIZADAS:
+                self._memoria.popitem(last=False)
+            return resultados
+
+    def _buscar(self, consulta: str, limite: int) -> list:
+        with self._lock:
+            alcance = self._termos_consulta(consulta)
+            if not alcance or not self._documentos:
+                return []
+
+            total = len(self._documentos)
+            media = self._comprimento_total / total
+            pontuacoes = collections.defaultdict(float)
+            for alcancados in alcance.values():
+                for termo in alcancados:
+                    postagem = self._postagens[termo]
+                    idf = math.log(1 + (total - len(postagem) + 0.5) / (len(postagem) + 0.5))
+                    for id_documento, frequencia in postagem.items():
+                        comprimento = self._documentos[id_documento].comprimento
+                        pontuacoes[id_documento] += idf * frequencia * (K1 + 1) / (
+                            frequencia + K1 * (1 - B + B * comprimento / media)
+                        )
+
+            melhores = sorted(pontuacoes.items(), key=lambda item: (-item[1], item[0]))[:limite]
+            destacar = {termo for alcancados in alcance.values() for termo in alcancados}
+            resultados = []
+            for id_documento, pontuacao in melhores:
+                documento = self._documentos[id_documento]
+                encontradas = sorted(
+                    posicao for termo in destacar for posicao in documento.posicoes.get(termo, ())
+                )
+                resultados.append(Resultado(
+                    documento.id, documento.tipo, documento.titulo, documento.pagina,
+                    pontuacao, trecho(documento.texto, documento.tokens, encontradas),
+                ))
+            return resultados
+
+    def estatisticas(self) -> dict:
+        with self._lock:
+            return {
+                "documentos": len(self._documentos),
+                "termos": len(self._postagens),
+                "comprimento_medio": self._comprimento_total / max(1, len(self._documentos)),
+            }
+
+
+def trecho(texto: str, tokens: list, encontradas: list, palavras: int = PALAVRAS_TRECHO) -> str:
+    """
+    Recorta a janela de `palavras` palavras com mais termos da consulta e os destaca.
+
+    Args:
+        texto: Texto original do documento
+        tokens: Resultado de _tokens_posicionados(texto)
+        encontradas: Índices (em `tokens`, em ordem crescente) das palavras a destacar
+
+    Returns:
+        HTML escapado, com os termos encontrados em <mark>
+    """
+    if not tokens:
+        return ""
+    janela = min(palavras, len(tokens))
+
+    # Janela com mais ocorrências, percorrendo apenas as posições encontradas
+    inicio_melhor, melhor, j = 0, 0, 0
+    for i, posicao in enumerate(encontradas):
+        while j < len(encontradas) and encontradas[j] - posicao < janela:
+            j += 1
+        if j - i > melhor:
+            melhor, inicio_melhor = j - i, posicao
+    # Algumas palavras de contexto antes da primeira ocorrência
+    inicio_melhor = max(0, min(inicio_melhor - 3, len(tokens) - janela)) if melhor else 0
+    fim = inicio_melhor + janela - 1
+    destacadas = set(encontradas)
+
+    partes = ["…" if inicio_melhor > 0 else ""]
+    posicao = tokens[inicio_melhor][0]
+    for i in range(inicio_melhor, fim + 1):
+        comeco, final, _ = tokens[i]
+        partes.append(escape(texto[posicao:comeco]))
+        palavra = escape(texto[comeco:final])
+        partes.append(f"<mark>{palavra}</mark>" if i in destacadas else palavra)
+        posicao = final
+    partes.append("…" if fim < len(tokens) - 1 else escape(texto[posicao:]))
+    return "".join(partes)
+
+
+def _frase(texto: str) -> str:
+    """Termina o texto com um único ponto, sem duplicar o que já houver."""
+    texto = texto.strip().rstrip(".")
+    return texto + "." if texto else ""
+
+
+def _texto_item(item) -> str:
+    if isinstance(item, dict):
+        partes = [item["titulo"]] + [f"{rotulo}: {valor}" for rotulo, valor in item["campos"]]
+        return " ".join(_frase(parte) for parte in partes)
+    if isinstance(item, tuple):
+        return _frase(f"{item[0]}: {item[1]}")
+    return _frase(item)
+
+
+def documentos_curriculo() -> list:
+    """
+    Returns:
+        Lista de (id, titulo, texto) do resumo e das seções do currículo
+    """
+    documentos = [("curriculo:resumo", "Resumo Profissional", RESUMO_PROFISSIONAL)]
+    for secao in SECOES_CURRICULO:
+        texto = "\n".join(_texto_item(item) for item in secao["itens"])
+        documentos.append((f"curriculo:{secao['id']}", secao["titulo"], texto))
+    return documentos
+
+
+class BuscaConteudo:
+    """
+    Índice de busca do currículo e dos projetos de um IndiceProjetos.
+
+    Args:
+        indice_projetos: indice_projetos.IndiceProjetos de onde vêm os projetos
+    """
+
+    def __init__(self, indice_projetos):
+        self.indice_projetos = indice_projetos
+        self.indice = IndiceBusca()
+        self._versao_projetos = None
+        self._lock = threading.Lock()
+        for id_documento, titulo, texto in documentos_curriculo():
+            self.indice.definir(id_documento, "curriculo", titulo, "Currículo", texto)
+        self.sincronizar()
+
+    def sincronizar(self) -> int:
+        """
+        Reindexa os projetos que mudaram desde a última sincronização.
+
+        Returns:
+            Quantidade de documentos adicionados, alterados ou removidos
+        """
+        with self._lock:
+            versao = self.indice_projetos.versao
+            if versao == self._versao_projetos:
+                return 0
+            projetos = self.indice_projetos.projetos()
+            alterados = 0
+            atuais = set()
+            for projeto in projetos:
+                id_documento = f"projeto:{projeto['slug']}"
+                atuais.add(id_documento)
+                alterados += self.indice.definir(
+                    id_documento, "projeto", projeto["titulo"], "Portfólio", projeto["descricao"],
+                )
+            for id_documento in self.indice.ids("projeto:") - atuais:
+                alterados += self.indice.remover(id_documento)
+            self._versao_projetos = versao
+            return alterados
+
+    def buscar(self, consulta: str, limite: int = LIMITE_PADRAO) -> list:
+        """Ver IndiceBusca.buscar; antes, aplica as mudanças pendentes dos projetos."""
+        self.sincronizar()
+        return self.indice.buscar(consulta, limite)
+
+
+_buscas = {}
+_buscas_lock = threading.Lock()
+
+
+def obter_busca(caminho_base: str) -> BuscaConteudo:
+    """
+    Retorna o índice de busca do processo para a pasta base, montado na primeira chamada.
+
+    Args:
+        caminho_base: Pasta com uma subpasta por projeto
+
+    Returns:
+        BuscaConteudo ligado ao índice de projetos da pasta
+    """
+    with _buscas_lock:
+        busca = _buscas.get(caminho_base)
+        if busca is None:
+            from indice_projetos import obter_indice
+
+            busca = BuscaConteudo(obter_indice(caminho_base))
+            _buscas[caminho_base] = busca
+        return busca
+
+
+def main():
+    import time
+
+    from configuracao import IMAGENS_DIR
+
+    parser = argparse.ArgumentParser(description="Busca no currículo e nos projetos do portfólio.")
+    parser.add_argument("consulta", nargs="*", default=["postgis", "drone", "dengue"])
+    parser.add_argument("--limite", type=int, default=LIMITE_PADRAO)
+    args = parser.parse_args()
+
+    busca = obter_busca(IMAGENS_DIR)
+    inicio = time.perf_counter()
+    resultados = busca.buscar(" ".join(args.consulta), args.limite)
+    print(f"{len(resultados)} resultado(s) em {(time.perf_counter() - inicio) * 1000:.3f} ms")
+    for resultado in resultados:
+        print(f"{resultado.pontuacao:6.2f}  {resultado.pagina:<10} {resultado.titulo}")
+        print(f"        {resultado.trecho}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+Índice de busca de países e agregados dos dados de PIB.
+
+Nomes ("Country Name") e códigos ("Country Code") são normalizados (sem
+acentos, sem caixa) e inseridos em uma trie de prefixos em que cada nó já
+guarda o conjunto de linhas que ele alcança: uma busca por prefixo é só a
+descida pela trie. Termos sem correspondência exata são procurados com
+distância de edição limitada, percorrendo a mesma trie com poda.
+
+Os agregados do Banco Mundial (regiões, faixas de renda, grupos) são
+classificados uma única vez pelo código, para que possam ser retirados das
+buscas e dos rankings.
+"""
+
+import collections
+import re
+import threading
+import unicodedata
+
+# Agregados do Banco Mundial presentes no CSV de PIB, por categoria
+CATEGORIAS_AGREGADOS = {
+    "mundo": ("WLD",),
+    "regiao": (
+        "AFE", "AFW", "ARB", "CEB", "EAP", "EAS", "ECA", "ECS", "LAC", "LCN", "MEA", "MNA",
+        "NAC", "SAS", "SSA", "SSF", "TEA", "TEC", "TLA", "TMN", "TSA", "TSS",
+    ),
+    "renda": ("HIC", "LIC", "LMC", "LMY", "MIC", "UMC"),
+    "financiamento": ("IBD", "IBT", "IDA", "IDB", "IDX"),
+    "grupo": (
+        "CSS", "EAR", "EMU", "EUU", "FCS", "HPC", "INX", "LDC", "LTE", "OED", "OSS", "PRE",
+        "PSS", "PST", "SST",
+    ),
+}
+CATEGORIA_POR_CODIGO = {
+    codigo: categoria for categoria, codigos in CATEGORIAS_AGREGADOS.items() for codigo in codigos
+}
+
+LIMITE_PADRAO = 20
+MAX_CONSULTAS_MEMORIZADAS = 256
+
+Resultado = collections.namedtuple("Resultado", ["codigo", "nome", "categoria", "distancia"])
+
+_separadores = re.compile(r"[^0-9a-z]+")
+
+
+def normalizar(texto: str) -> str:
+    """
+    Remove acentos, converte para minúsculas e troca pontuação por espaço.
+
+    Args:
+        texto: Texto original
+
+    Returns:
+        Texto normalizado
+    """
+    decomposto = unicodedata.normalize("NFKD", texto)
+    sem_acentos = "".join(c for c in decomposto if not unicodedata.combining(c))
+    return _separadores.sub(" ", sem_acentos.casefold()).strip()
+
+
+def categoria(codigo: str) -> str:
+    """
+    Returns:
+        "pais" ou a categoria do agregado ("mundo", "regiao", "renda", ...)
+    """
+    return CATEGORIA_POR_CODIGO.get(codigo, "pais")
+
+
+def eh_agregado(codigo: str) -> bool:
+    return codigo in CATEGORIA_POR_CODIGO
+
+
+def mascara_paises(codigos):
+    """
+    Args:
+        codigos: Códigos na ordem das linhas da matriz
+
+    Returns:
+        numpy.ndarray booleano, True nas linhas que são países
+    """
+    # numpy só é carregado pela página do PIB: busca_conteudo importa este
+    # módulo (normalizar) na inicialização do app
+    import numpy as np
+
+    return np.fromiter((codigo not in CATEGORIA_POR_CODIGO for codigo in codigos), dtype=bool, count=len(codigos))
+
+
+class _No:
+    __slots__ = ("filhos", "alcance")
+
+    def __init__(self):
+        self.filhos = {}
+        self.alcance = set()
+
+
+class IndicePaises:
+    """
+    Busca por prefixo e aproximada sobre nomes e códigos.
+
+    Args:
+        codigos: Códigos dos países/agregados
+        nomes: Nomes, na mesma ordem dos códigos
+    """
+
+    def __init__(self, codigos, nomes):
+        self.codigos = list(codigos)
+        self.nomes = list(nomes)
+        self.categorias = [categoria(codigo) for codigo in self.codigos]
+        self._nomes_normalizados = [normalizar(nome) for nome in self.nomes]
+        self._linha_por_codigo = {codigo.casefold(): i for i, codigo in enumerate(self.codigos)}
+        self._raiz = _No()
+        for i, (codigo, nome) in enumerate(zip(self.codigos, self._nomes_normalizados)):
+            for termo in set(nome.split()) | {codigo.casefold()}:
+                self._inserir(termo, i)
+        self._memoria = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _inserir(self, termo: str, linha: int):
+        no = self._raiz
+        for letra in termo:
+            no = no.filhos.setdefault(letra, _No())
+            no.alcance.add(linha)
+
+    def _prefixo(self, termo: str) -> set:
+        no = self._raiz
+        for letra in termo:
+            no = no.filhos.get(letra)
+            if no is None:
+                return set()
+        return no.alcance
+
+    def _aproximado(self, termo: str, distancia_maxima: int) -> dict:
+        """
+        Linhas cujos termos começam com algo a até `distancia_maxima` edições do termo.
+
+        Como em digitação a primeira letra raramente está errada, só a
+        subárvore da primeira letra é percorrida.
+
+        Returns:
+            Dicionário linha -> menor distância encontrada
+        """
+        encontrados = {}
+        inicial = self._raiz.filhos.get(termo[0])
+        if inicial is None:
+            return encontrados
+        primeira = list(range(len(termo) + 1))
+        pilha = [(inicial, termo[0], primeira)]
+        while pilha:
+            no, letra, anterior = pilha.pop()
+            linha = [anterior[0] + 1]
+            for j in range(1, len(termo) + 1):
+                custo = 0 if termo[j - 1] == letra else 1
+                linha.append(min(linha[j - 1] + 1, anterior[j] + 1, anterior[j - 1] + custo))
+            if linha[-1] <= distancia_maxima:
+                for indice in no.alcance:
+                    if linha[-1] < encontrados.get(indice, distancia_maxima + 1):
+                        encontrados[indice] = linha[-1]
+            if min(linha) <= distancia_maxima:
+                pilha.extend((filho, proxima, linha) for proxima, filho in no.filhos.items())
+        return encontrados
+
+    def _buscar(self, consulta: str) -> list:
+        termos = consulta.split()
+        distancias = None
+        for termo in termos:
+            exatos = self._prefixo(termo)
+            if exatos:
+                candidatos = dict.fromkeys(exatos, 0)
+            else:
+                candidatos = self._aproximado(termo, 1 if len(termo) <= 4 else 2)
+            if distancias is None:
+                distancias = candidatos
+            else:
+                distancias = {i: max(d, candidatos[i]) for i, d in distancias.items() if i in candidatos}
+            if not distancias:
+                return []
+
+        codigo_exato = self._linha_por_codigo.get(consulta)
+
+        def _ordem(i):
+            return (
+                i != codigo_exato,
+                distancias[i],
+                not self._nomes_normalizados[i].startswith(consulta),
+                len(self.nomes[i]),
+                self.nomes[i],
+            )
+
+        return [(i, distancias[i]) for i in sorted(distancias, key=_ordem)]
+
+    def buscar(self, consulta: str, limite: int = LIMITE_PADRAO, incluir_agregados: bool = True) -> list:
+        """
+        Procura países e agregados pelo nome ou código.
+
+        Todos os termos da consulta precisam corresponder (como prefixo de
+        algum termo do nome ou do código); termos sem correspondência são
+        aceitos com até 1 edição (termos curtos) ou 2 edições.
+
+        Args:
+            consulta: Texto digitado
+            limite: Quantidade máxima de resultados
+            incluir_agregados: Inclui regiões, faixas de renda e demais agregados
+
+        Returns:
+            Lista de Resultado ordenada por relevância
+        """
+        consulta = normalizar(consulta)
+        if not consulta:
+            return []
+
+        with self._lock:
+            ordenados = self._memoria.get(consulta)
+            if ordenados is not None:
+                self._memoria.move_to_end(consulta)
+        if ordenados is None:
+            ordenados = self._buscar(consulta)
+            with self._lock:
+                self._memoria[consulta] = ordenados
+                while len(self._memoria) > MAX_CONSULTAS_MEMORIZADAS:
+                    self._memoria.popitem(last=False)
+
+        resultados = []
+        for i, distancia in ordenados:
+            if not incluir_agregados and self.categorias[i] != "pais":
+                continue
+            resultados.append(Resultado(self.codigos[i], self.nomes[i], self.categorias[i], distancia))
+            if len(resultados) >= limite:
+                break
+        return resultados
+
+
+_indices = {}
+_indices_lock = threading.Lock()
+
+
+def obter_indice(dados) -> IndicePaises:
+    """
+    Retorna o índice de busca de um DadosPIB, construído uma vez por versão do CSV.
+
+    Args:
+        dados: DadosPIB
+
+    Returns:
+        IndicePaises
+    """
+    with _indices_lock:
+        indice = _indices.get(dados.digest)
+        if indice is None:
+            _indices.clear()
+            indice = _indices[dados.digest] = IndicePaises(dados.codigos, dados.nomes)
+        return indice
@@ -0,0 +1,142 @@
+"""
+Cache em memória dos bytes das imagens, com orçamento total de bytes.
+
+Guarda o arquivo codificado (JPEG/PNG/WEBP), nunca objetos PIL: o tamanho
+de cada entrada é conhecido e a memória fica limitada ao orçamento, não
+importa quantas imagens existam em Imagem/. Quando o orçamento estoura, as
+imagens usadas há mais tempo são descartadas (LRU). Cada leitura confere
+mtime e tamanho do arquivo, então uma imagem substituída em disco não é
+servida da memória.
+
+Variáveis de ambiente (lidas na primeira leitura de imagem):
+    PORTFOLIO_CACHE_IMAGENS_MB=64   orçamento total do cache
+"""
+
+import collections
+import os
+import threading
+
+import metricas
+from configuracao import ambiente_real
+
+MB_IMAGENS_PADRAO = 64
+
+
+def max_bytes_imagens() -> int:
+    """Orçamento configurado em PORTFOLIO_CACHE_IMAGENS_MB, em bytes (padrão se inválido)."""
+    return int(ambiente_real("PORTFOLIO_CACHE_IMAGENS_MB", MB_IMAGENS_PADRAO) * 1024 * 1024)
+
+
+class CacheImagens:
+    """
+    Cache LRU de arquivos de imagem codificados, limitado por bytes.
+
+    Arquivos maiores que o orçamento inteiro são lidos do disco a cada uso,
+    sem passar pelo cache.
+
+    Args:
+        max_bytes: Soma máxima do tamanho dos arquivos guardados; padrão:
+            max_bytes_imagens()
+    """
+
+    def __init__(self, max_bytes: int = None):
+        self.max_bytes = max_bytes_imagens() if max_bytes is None else max_bytes
+        self._imagens = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+
+    def _remover(self, caminho: str):
+        _, dados = self._imagens.pop(caminho)
+        self._bytes -= len(dados)
+
+    def ler(self, caminho: str) -> bytes:
+        """
+        Retorna o conteúdo do arquivo, da memória quando possível.
+
+        Args:
+            caminho: Caminho da imagem
+
+        Returns:
+            Bytes do arquivo
+
+        Raises:
+            OSError: Se o arquivo não puder ser lido
+        """
+        info = os.stat(caminho)
+        assinatura = (info.st_mtime_ns, info.st_size)
+        with self._lock:
+            entrada = self._imagens.get(caminho)
+            if entrada is not None and entrada[0] == assinatura:
+                self._imagens.move_to_end(caminho)
+                self.acertos += 1
+                return entrada[1]
+            self.falhas += 1
+
+        with open(caminho, "rb") as arquivo:
+            dados = arquivo.read()
+        if len(dados) > self.max_bytes:
+            return dados
+
+        with self._lock:
+            if caminho in self._imagens:
+                self._remover(caminho)
+            self._imagens[caminho] = (assinatura, dados)
+            self._bytes += len(dados)
+            while self._bytes > self.max_bytes:
+                removido = next(iter(self._imagens))
+                self._remover(removido)
+                self.descartes += 1
+        return dados
+
+    def limpar(self):
+        with self._lock:
+            self._imagens.clear()
+            self._bytes = 0
+
+    def estatisticas(self) -> dict:
+        """
+        Returns:
+            Acertos, falhas, descartes por orçamento, imagens e bytes em
+            memória e o orçamento
+        """
+        with self._lock:
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "descartes": self.descartes,
+                "imagens": len(self._imagens),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def obter_cache() -> CacheImagens:
+    """Retorna o cache de imagens do processo (criado na primeira chamada)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CacheImagens()
+                metricas.registrar_coletor("cache_imagens", _cache.estatisticas)
+    return _cache
+
+
+def ler_imagem(caminho: str) -> bytes:
+    """
+    Bytes de uma imagem pelo cache do processo (ver CacheImagens.ler).
+
+    Raises:
+        OSError: Se o arquivo não puder ser lido
+    """
+    return obter_cache().ler(caminho)
+
+
+def estatisticas() -> dict:
+    return obter_cache().estatisticas()
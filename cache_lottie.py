@@ -0,0 +1,237 @@
+"""
+Armazenamento local das animações Lottie.
+
+As animações usadas pelo app são distribuídas junto com o repositório
+(assets/lottie) como semente e copiadas para um cache em disco. O
+carregamento nunca depende da rede: a revalidação com a origem (ETag /
+If-Modified-Since) é opcional e acontece em segundo plano, e a primeira
+revalidação bem-sucedida grava a versão da origem no cache, que passa a ter
+precedência sobre a semente. Sem rede, a semente é exibida desde a primeira
+visita.
+
+Para baixar ou atualizar as cópias distribuídas a partir das URLs originais
+(antes do deploy, comitando os arquivos gerados):
+
+    python cache_lottie.py --atualizar-distribuidas
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from configuracao import BASE_DIR, DIRETORIO_CACHE, ambiente
+
+logger = logging.getLogger(__name__)
+
+URL_LOTTIE_HOME = "https://assets1.lottiefiles.com/packages/lf20_3vbOcw.json"
+URL_LOTTIE_CONTATO = "https://assets2.lottiefiles.com/packages/lf20_SdQJtK.json"
+
+DIRETORIO_DISTRIBUIDAS = os.path.join(BASE_DIR, "assets", "lottie")
+DIRETORIO_LOTTIE = os.path.join(DIRETORIO_CACHE, "lottie")
+
+# Cópias locais distribuídas com o repositório, por URL de origem
+ANIMACOES_DISTRIBUIDAS = {
+    URL_LOTTIE_HOME: "home.json",
+    URL_LOTTIE_CONTATO: "contato.json",
+}
+
+INTERVALO_REVALIDACAO = 24 * 60 * 60
+TIMEOUT_REVALIDACAO = 5
+
+_memoria = {}
+# Momento da última revalidação de cada URL, lido do .meta.json uma única vez
+_verificado_em = {}
+_lock = threading.Lock()
+_revalidando = set()
+_revalidar = None
+
+
+def revalidacao_habilitada() -> bool:
+    """Revalidação em segundo plano; LOTTIE_REVALIDAR=0 a desliga (lida uma vez, sob demanda)."""
+    global _revalidar
+    if _revalidar is None:
+        _revalidar = ambiente("LOTTIE_REVALIDAR", "1") != "0"
+    return _revalidar
+
+
+def _chave(url: str) -> str:
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+
+
+def _caminhos_cache(url: str):
+    chave = _chave(url)
+    return (
+        os.path.join(DIRETORIO_LOTTIE, f"{chave}.json"),
+        os.path.join(DIRETORIO_LOTTIE, f"{chave}.meta.json"),
+    )
+
+
+def _ler_json(caminho: str):
+    try:
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):
+        return None
+
+
+def _gravar_json(caminho: str, dados):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, separators=(",", ":"))
+    os.replace(temporario, caminho)
+
+
+def _animacao_valida(dados) -> bool:
+    return isinstance(dados, dict) and "layers" in dados
+
+
+def carregar_lottie(url: str):
+    """
+    Carrega uma animação Lottie sem acessar a rede.
+
+    Ordem de busca: memória, cache em disco e cópia distribuída com o
+    repositório. Se a revalidação estiver habilitada e a última verificação
+    for antiga, dispara uma revalidação em segundo plano.
+
+    Args:
+        url: URL de origem da animação
+
+    Returns:
+        Dados JSON da animação ou None se não houver cópia local
+    """
+    with _lock:
+        dados = _memoria.get(url)
+
+    if dados is None:
+        caminho_cache, _ = _caminhos_cache(url)
+        dados = _ler_json(caminho_cache)
+        if dados is None and url in ANIMACOES_DISTRIBUIDAS:
+            dados = _ler_json(os.path.join(DIRETORIO_DISTRIBUIDAS, ANIMACOES_DISTRIBUIDAS[url]))
+        if dados is None:
+            logger.warning("Animação Lottie sem cópia local: %s", url)
+        else:
+            with _lock:
+                _memoria[url] = dados
+
+    if revalidacao_habilitada():
+        _agendar_revalidacao(url)
+    return dados
+
+
+def _agendar_revalidacao(url: str):
+    with _lock:
+        verificado_em = _verificado_em.get(url)
+    if verificado_em is None:
+        _, caminho_meta = _caminhos_cache(url)
+        verificado_em = (_ler_json(caminho_meta) or {}).get("verificado_em", 0)
+        with _lock:
+            verificado_em = _verificado_em.setdefault(url, verificado_em)
+    if time.time() - verificado_em < INTERVALO_REVALIDACAO:
+        return
+
+    with _lock:
+        if url in _revalidando:
+            return
+        _revalidando.add(url)
+
+    def _executar():
+        try:
+            revalidar(url)
+        finally:
+            with _lock:
+                _revalidando.discard(url)
+
+    threading.Thread(target=_executar, name="revalidacao-lottie", daemon=True).start()
+
+
+def revalidar(url: str, timeout: float = TIMEOUT_REVALIDACAO) -> bool:
+    """
+    Consulta a origem com requisição condicional e atualiza o cache se mudou.
+
+    Args:
+        url: URL de origem da animação
+        timeout: Tempo máximo da requisição, em segundos
+
+    Returns:
+        True se uma nova versão foi gravada, False caso contrário
+    """
+    import requests
+
+    caminho_cache, caminho_meta = _caminhos_cache(url)
+    meta = _ler_json(caminho_meta) or {}
+    cabecalhos = {}
+    if meta.get("etag") and os.path.exists(caminho_cache):
+        cabecalhos["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified") and os.path.exists(caminho_cache):
+        cabecalhos["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        r = requests.get(url, headers=cabecalhos, timeout=timeout)
+    except requests.exceptions.RequestException as e:
+        logger.info("Revalidação da animação %s indisponível: %s", url, e)
+        meta["verificado_em"] = time.time()
+        _gravar_meta(url, meta)
+        return False
+
+    meta["verificado_em"] = time.time()
+    atualizado = False
+    if r.status_code == 200:
+        try:
+            dados = r.json()
+        except ValueError:
+            dados = None
+        if _animacao_valida(dados):
+            _gravar_json(caminho_cache, dados)
+            meta["etag"] = r.headers.get("ETag")
+            meta["last_modified"] = r.headers.get("Last-Modified")
+            with _lock:
+                _memoria[url] = dados
+            atualizado = True
+        else:
+            logger.warning("Resposta inválida ao revalidar animação %s", url)
+    elif r.status_code != 304:
+        logger.warning("Erro ao revalidar Lottie: Status %s", r.status_code)
+
+    _gravar_meta(url, meta)
+    return atualizado
+
+
+def _gravar_meta(url: str, meta: dict):
+    with _lock:
+        _verificado_em[url] = meta["verificado_em"]
+    _, caminho_meta = _caminhos_cache(url)
+    try:
+        _gravar_json(caminho_meta, meta)
+    except OSError as e:
+        logger.warning("Não foi possível gravar %s: %s", caminho_meta, e)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gerencia as animações Lottie locais.")
+    parser.add_argument(
+        "--atualizar-distribuidas",
+        action="store_true",
+        help="Baixa as animações das URLs de origem para assets/lottie",
+    )
+    args = parser.parse_args()
+
+    if args.atualizar_distribuidas:
+        import requests
+
+        for url, nome in ANIMACOES_DISTRIBUIDAS.items():
+            r = requests.get(url, timeout=30)
+            r.raise_for_status()
+            dados = r.json()
+            if not _animacao_valida(dados):
+                raise SystemExit(f"Resposta inválida para {url}")
+            _gravar_json(os.path.join(DIRETORIO_DISTRIBUIDAS, nome), dados)
+            print(f"{nome}: {len(r.content)} bytes de {url}")
+
+
+if __name__ == "__main__":
+    main()
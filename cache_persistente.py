@@ -0,0 +1,414 @@
+"""
+Cache em dois níveis (memória e SQLite) que sobrevive a reinícios do processo.
+
+Os caches em memória (st.cache_data, dicionários do módulo) se perdem a cada
+hibernação ou novo deploy do Streamlit Cloud, justamente quando o primeiro
+visitante chega. Este cache guarda cada resultado também em
+.cache/cache_persistente.db: um processo recém-iniciado lê do disco o que o
+anterior calculou.
+
+- Valores JSON (str, números, listas, dicionários), nunca pickle
+- TTL por entrada (número de segundos ou função do valor)
+- Limite de bytes em memória e em disco, com descarte LRU
+- Chaves versionadas (nome:vN:hash dos argumentos); ao mudar a versão, as
+  entradas antigas do mesmo nome são removidas
+- Proteção contra estouro de recálculo: chamadas concorrentes para a mesma
+  chave esperam o primeiro cálculo em vez de repeti-lo
+
+Se o disco não puder ser usado, o cache continua apenas em memória.
+
+    @persistente("mx", versao=1, ttl=6 * 60 * 60)
+    def consultar(dominio): ...
+
+Variáveis de ambiente (lidas na criação do cache do processo):
+    PORTFOLIO_CACHE_PERSISTENTE=.cache/cache_persistente.db
+    PORTFOLIO_CACHE_PERSISTENTE_MB=64   limite do arquivo em disco
+"""
+
+import collections
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import metricas
+from configuracao import DIRETORIO_CACHE, ambiente, ambiente_real
+
+logger = logging.getLogger(__name__)
+
+CAMINHO_PADRAO = os.path.join(DIRETORIO_CACHE, "cache_persistente.db")
+MB_DISCO_PADRAO = 64
+MAX_BYTES_MEMORIA = 16 * 1024 * 1024
+# Travas por faixa de chaves: limitam a memória das travas sem serializar chaves distintas
+TRAVAS = 64
+# O horário de acesso (para o descarte LRU em disco) só é regravado quando
+# mais antigo que isto: um acerto no disco não vira uma escrita
+INTERVALO_ACESSO = 5 * 60
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS entradas (
+    chave TEXT PRIMARY KEY,
+    valor TEXT NOT NULL,
+    tamanho INTEGER NOT NULL,
+    expira REAL,
+    acessada REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entradas_acessada ON entradas (acessada);
+"""
+
+
+def limite_disco() -> int:
+    """Limite configurado em PORTFOLIO_CACHE_PERSISTENTE_MB, em bytes (padrão se inválido)."""
+    return int(ambiente_real("PORTFOLIO_CACHE_PERSISTENTE_MB", MB_DISCO_PADRAO) * 1024 * 1024)
+
+
+class CachePersistente:
+    """
+    Cache chave -> valor JSON com nível em memória e nível em SQLite.
+
+    Args:
+        caminho: Arquivo SQLite do nível em disco; padrão:
+            PORTFOLIO_CACHE_PERSISTENTE ou CAMINHO_PADRAO
+        max_bytes_memoria: Soma máxima dos valores serializados em memória
+        max_bytes_disco: Soma máxima dos valores serializados em disco;
+            padrão: limite_disco()
+    """
+
+    def __init__(self, caminho: str = None, max_bytes_memoria: int = MAX_BYTES_MEMORIA,
+                 max_bytes_disco: int = None):
+        self.caminho = ambiente("PORTFOLIO_CACHE_PERSISTENTE", CAMINHO_PADRAO) if caminho is None else caminho
+        self.max_bytes_memoria = max_bytes_memoria
+        self.max_bytes_disco = limite_disco() if max_bytes_disco is None else max_bytes_disco
+        self._memoria = collections.OrderedDict()
+        self._bytes_memoria = 0
+        self._lock = threading.Lock()
+        self._lock_disco = threading.Lock()
+        self._travas = [threading.Lock() for _ in range(TRAVAS)]
+        self._conexao = None
+        self._disco_indisponivel = False
+        self._prefixos_verificados = set()
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.falhas = 0
+        self.esperas = 0
+        self.descartes_memoria = 0
+        self.descartes_disco = 0
+
+    # ============= DISCO =============
+
+    def _executar(self, funcao):
+        """Executa funcao(conexao) sob a trava do disco; None se o disco estiver indisponível."""
+        with self._lock_disco:
+            if self._disco_indisponivel:
+                return None
+            try:
+                if self._conexao is None:
+                    os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+                    conexao = sqlite3.connect(self.caminho, timeout=10, check_same_thread=False)
+                    conexao.execute("PRAGMA journal_mode=WAL")
+                    conexao.execute("PRAGMA synchronous=NORMAL")
+                    conexao.executescript(_ESQUEMA)
+                    self._conexao = conexao
+                with self._conexao:
+                    return funcao(self._conexao)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Cache persistente em %s indisponível; usando apenas memória: %s", self.caminho, e)
+                self._disco_indisponivel = True
+                return None
+
+    def _ler_disco(self, chave: str):
+        def ler(conexao):
+            linha = conexao.execute(
+                "SELECT valor, expira, acessada FROM entradas WHERE chave = ?", (chave,)
+            ).fetchone()
+            if linha is None:
+                return None
+            agora = time.time()
+            if linha[1] is not None and linha[1] <= agora:
+                conexao.execute("DELETE FROM entradas WHERE chave = ?", (chave,))
+                return None
+            if agora - linha[2] > INTERVALO_ACESSO:
+                conexao.execute("UPDATE entradas SET acessada = ? WHERE chave = ?", (agora, chave))
+            return linha[:2]
+
+        return self._executar(ler)
+
+    def _gravar_disco(self, chave: str, texto: str, expira):
+        def gravar(conexao):
+            conexao.execute(
+                "INSERT OR REPLACE INTO entradas (chave, valor, tamanho, expira, acessada) VALUES (?, ?, ?, ?, ?)",
+                (chave, texto, len(texto), expira, time.time()),
+            )
+            total = conexao.execute("SELECT COALESCE(SUM(tamanho), 0) FROM entradas").fetchone()[0]
+            descartes = 0
+            while total > self.max_bytes_disco:
+                linha = conexao.execute(
+                    "SELECT chave, tamanho FROM entradas ORDER BY (expira IS NOT NULL AND expira <= ?) DESC, "
+                    "acessada LIMIT 1", (time.time(),)
+                ).fetchone()
+                if linha is None:
+                    break
+                conexao.execute("DELETE FROM entradas WHERE chave = ?", (linha[0],))
+                total -= linha[1]
+                descartes += 1
+            return descartes
+
+        descartes = self._executar(gravar)
+        if descartes:
+            with self._lock:
+                self.descartes_disco += descartes
+
+    # ============= MEMÓRIA =============
+
+    def _guardar_memoria(self, chave: str, valor, tamanho: int, expira):
+        with self._lock:
+            antiga = self._memoria.pop(chave, None)
+            if antiga is not None:
+                self._bytes_memoria -= antiga[1]
+            if tamanho > self.max_bytes_memoria:
+                return
+            self._memoria[chave] = (expira, tamanho, valor)
+            self._bytes_memoria += tamanho
+            while self._bytes_memoria > self.max_bytes_memoria:
+                _, (_, removido, _) = self._memoria.popitem(last=False)
+                self._bytes_memoria -= removido
+                self.descartes_memoria += 1
+
+    # ============= API =============
+
+    def _buscar(self, chave: str, memoria: bool):
+        """Tupla (nível, valor), com nível "memoria", "disco" ou None se ausente."""
+        if memoria:
+            with self._lock:
+                entrada = self._memoria.get(chave)
+                if entrada is not None:
+                    if entrada[0] is None or entrada[0] > time.time():
+                        self._memoria.move_to_end(chave)
+                        return "memoria", entrada[2]
+                    self._bytes_memoria -= entrada[1]
+                    del self._memoria[chave]
+
+        linha = self._ler_disco(chave)
+        if linha is None:
+            return None, None
+        texto, expira = linha
+        valor = json.loads(texto)
+        if memoria:
+            self._guardar_memoria(chave, valor, len(texto), expira)
+        return "disco", valor
+
+    def _contar(self, nivel):
+        with self._lock:
+            if nivel == "memoria":
+                self.acertos_memoria += 1
+            elif nivel == "disco":
+                self.acertos_disco += 1
+            else:
+                self.falhas += 1
+
+    def obter(self, chave: str, memoria: bool = True):
+        """
+        Args:
+            chave: Chave da entrada
+            memoria: Consulta e preenche também o nível em memória
+
+        Returns:
+            Tupla (encontrado, valor)
+        """
+        nivel, valor = self._buscar(chave, memoria)
+        self._contar(nivel)
+        return nivel is not None, valor
+
+    def definir(self, chave: str, valor, ttl: float = None, memoria: bool = True):
+        """
+        Grava a entrada nos dois níveis.
+
+        Args:
+            chave: Chave da entrada
+            valor: Valor serializável em JSON
+            ttl: Tempo de vida em segundos (None: sem expiração)
+            memoria: Grava também no nível em memória
+        """
+        texto = json.dumps(valor, ensure_ascii=False, separators=(",", ":"))
+        expira = None if ttl is None else time.time() + ttl
+        if memoria:
+            self._guardar_memoria(chave, valor, len(texto), expira)
+        self._gravar_disco(chave, texto, expira)
+
+    def obter_ou_calcular(self, chave: str, calcular, ttl=None, memoria: bool = True):
+        """
+        Retorna a entrada ou a calcula, uma única vez mesmo com chamadas concorrentes.
+
+        Args:
+            chave: Chave da entrada
+            calcular: Função sem argumentos que produz o valor
+            ttl: Segundos, None ou função valor -> segundos/None
+            memoria: Ver obter()
+
+        Returns:
+            Valor em cache ou recém-calculado (exceções de `calcular` não são cacheadas)
+        """
+        encontrado, valor = self.obter(chave, memoria)
+        if encontrado:
+            return valor
+
+        trava = self._travas[hash(chave) % TRAVAS]
+        if not trava.acquire(blocking=False):
+            with self._lock:
+                self.esperas += 1
+            trava.acquire()
+        try:
+            # Outra thread pode ter calculado enquanto esta esperava
+            nivel, valor = self._buscar(chave, memoria)
+            if nivel is not None:
+                return valor
+            valor = calcular()
+            self.definir(chave, valor, ttl(valor) if callable(ttl) else ttl, memoria)
+            return valor
+        finally:
+            trava.release()
+
+    def prefixo_versionado(self, nome: str, versao: int) -> str:
+        """
+        Prefixo das chaves de `nome` na versão atual.
+
+        Na primeira chamada para o nome, remove as entradas de outras versões,
+        que nunca mais seriam lidas.
+
+        Args:
+            nome: Nome do grupo de chaves (único por função ou tipo de valor)
+            versao: Versão atual do formato ou do cálculo
+
+        Returns:
+            Prefixo no formato "nome:vN:"
+        """
+        prefixo = f"{nome}:v{versao}:"
+        # Verificar e marcar sob a trava: só a primeira chamada faz a limpeza
+        with self._lock:
+            primeira = prefixo not in self._prefixos_verificados
+            self._prefixos_verificados.add(prefixo)
+        if primeira:
+            removidas = self.remover_prefixo(f"{nome}:", exceto=prefixo)
+            if removidas:
+                logger.info("Cache %s: %d entrada(s) de versões anteriores removida(s)", nome, removidas)
+        return prefixo
+
+    def remover_prefixo(self, prefixo: str, exceto: str = None) -> int:
+        """
+        Remove dos dois níveis as entradas cuja chave começa com `prefixo`.
+
+        Args:
+            prefixo: Início das chaves a remover
+            exceto: Início das chaves que devem ser mantidas (ex.: a versão atual)
+
+        Returns:
+            Quantidade de entradas removidas do disco
+        """
+        def remover_chave(chave):
+            return chave.startswith(prefixo) and not (exceto and chave.startswith(exceto))
+
+        with self._lock:
+            for chave in [c for c in self._memoria if remover_chave(c)]:
+                self._bytes_memoria -= self._memoria.pop(chave)[1]
+
+        def remover(conexao):
+            return conexao.execute(
+                "DELETE FROM entradas WHERE substr(chave, 1, ?) = ? AND substr(chave, 1, ?) != ?",
+                (len(prefixo), prefixo, len(exceto or ""), exceto or "\0"),
+            ).rowcount
+
+        return self._executar(remover) or 0
+
+    def limpar(self):
+        with self._lock:
+            self._memoria.clear()
+            self._bytes_memoria = 0
+        self._executar(lambda conexao: conexao.execute("DELETE FROM entradas"))
+
+    def estatisticas(self) -> dict:
+        """
+        Returns:
+            Acertos por nível, falhas, esperas por cálculo em andamento,
+            descartes e ocupação de cada nível
+        """
+        def ocupacao(conexao):
+            return conexao.execute("SELECT COUNT(*), COALESCE(SUM(tamanho), 0) FROM entradas").fetchone()
+
+        entradas_disco, bytes_disco = self._executar(ocupacao) or (0, 0)
+        with self._lock:
+            return {
+                "acertos_memoria": self.acertos_memoria,
+                "acertos_disco": self.acertos_disco,
+                "falhas": self.falhas,
+                "esperas": self.esperas,
+                "descartes_memoria": self.descartes_memoria,
+                "descartes_disco": self.descartes_disco,
+                "entradas_memoria": len(self._memoria),
+                "bytes_memoria": self._bytes_memoria,
+                "entradas_disco": entradas_disco,
+                "bytes_disco": bytes_disco,
+                "disco_disponivel": int(not self._disco_indisponivel),
+            }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def obter_cache() -> CachePersistente:
+    """Retorna o cache persistente do processo (criado na primeira chamada)."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CachePersistente()
+                metricas.registrar_coletor("cache_persistente", _cache.estatisticas)
+    return _cache
+
+
+def chave_argumentos(*partes) -> str:
+    """Hash estável de valores serializáveis em JSON (tuplas viram listas)."""
+    texto = json.dumps(partes, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+
+def persistente(nome: str, versao: int = 1, ttl=None, chave=None, memoria: bool = True):
+    """
+    Decorador que guarda o resultado da função no cache persistente do processo.
+
+    Args:
+        nome: Prefixo das chaves (único por função)
+        versao: Aumente quando o formato ou o cálculo do resultado mudar
+        ttl: Segundos, None (sem expiração) ou função resultado -> segundos
+        chave: Função (*args, **kwargs) -> valor JSON que identifica a
+            chamada; padrão: todos os argumentos
+        memoria: Usa também o nível em memória
+
+    Returns:
+        Decorador; a função decorada ganha o atributo `invalidar()`
+    """
+    prefixo = f"{nome}:v{versao}:"
+
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def chamada(*args, **kwargs):
+            cache = obter_cache()
+            identificador = chave(*args, **kwargs) if chave is not None else [args, kwargs]
+            return cache.obter_ou_calcular(
+                cache.prefixo_versionado(nome, versao) + chave_argumentos(identificador),
+                lambda: funcao(*args, **kwargs),
+                ttl,
+                memoria,
+            )
+
+        def invalidar():
+            obter_cache().remover_prefixo(prefixo)
+
+        chamada.invalidar = invalidar
+        return chamada
+
+    return decorador
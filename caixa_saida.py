@@ -0,0 +1,416 @@
+"""
+Caixa de saída durável para as mensagens do formulário de contato.
+
+As mensagens são gravadas em um banco SQLite (modo WAL) e confirmadas
+imediatamente ao visitante. Uma thread de entrega envia as pendentes por
+SMTP em segundo plano, com novas tentativas e backoff exponencial, de modo
+que as mensagens sobrevivem a quedas do servidor SMTP e a reinícios do app.
+No modo resumo (EMAIL_RESUMO_JANELA > 0), as mensagens que chegam dentro da
+janela são agrupadas em um único e-mail.
+
+O servidor SMTP é configurado por variáveis de ambiente (SMTP_SERVER,
+SMTP_PORT, SMTP_TLS), o que permite testar a entrega contra um servidor
+local como o aiosmtpd:
+
+    python -m aiosmtpd -n -l localhost:8025
+    SMTP_SERVER=localhost SMTP_PORT=8025 SMTP_TLS=none streamlit run streamlit_app.py
+"""
+
+import contextlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from email.message import EmailMessage
+
+import metricas
+from configuracao import DIRETORIO_CACHE, ambiente, ambiente_inteiro, ambiente_real
+
+logger = logging.getLogger(__name__)
+
+CAMINHO_CAIXA_SAIDA = ambiente("PORTFOLIO_CAIXA_SAIDA", os.path.join(DIRETORIO_CACHE, "caixa_saida.db"))
+
+MAX_TENTATIVAS = 8
+BACKOFF_BASE = 30
+BACKOFF_MAXIMO = 60 * 60
+INTERVALO_VERIFICACAO = 15
+
+PENDENTE = "pendente"
+ENVIADA = "enviada"
+FALHOU = "falhou"
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS mensagens (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nome TEXT NOT NULL,
+    email_remetente TEXT NOT NULL,
+    mensagem TEXT NOT NULL,
+    criada_em REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pendente',
+    tentativas INTEGER NOT NULL DEFAULT 0,
+    proxima_tentativa REAL NOT NULL,
+    ultimo_erro TEXT,
+    enviada_em REAL
+);
+CREATE INDEX IF NOT EXISTS idx_mensagens_fila ON mensagens (status, proxima_tentativa);
+"""
+
+
+def janela_resumo() -> float:
+    """
+    Janela do modo resumo, lida de EMAIL_RESUMO_JANELA a cada chamada.
+
+    Mensagens que chegam dentro da janela (segundos) são entregues juntas em
+    um único e-mail; 0 (padrão) ou um valor inválido desativam o agrupamento.
+    """
+    return max(0.0, ambiente_real("EMAIL_RESUMO_JANELA", 0.0))
+
+
+def configuracao_smtp() -> dict:
+    """
+    Lê a configuração de envio das variáveis de ambiente.
+
+    Returns:
+        Dicionário com servidor, porta, tls ("ssl", "starttls" ou "none"),
+        usuario, senha e destino
+    """
+    porta = ambiente_inteiro("SMTP_PORT", 465)
+    return {
+        "servidor": ambiente("SMTP_SERVER", "smtp.gmail.com"),
+        "porta": porta,
+        "tls": ambiente("SMTP_TLS", "ssl" if porta == 465 else "starttls").lower(),
+        "usuario": ambiente("EMAIL_USUARIO"),
+        "senha": ambiente("EMAIL_SENHA"),
+        "destino": ambiente("EMAIL_DESTINO"),
+    }
+
+
+def configuracao_completa(config: dict = None) -> bool:
+    """Indica se as variáveis necessárias para a entrega estão definidas."""
+    config = config or configuracao_smtp()
+    return all([config["destino"], config["usuario"], config["senha"]])
+
+
+def montar_mensagem(registro: dict, config: dict) -> EmailMessage:
+    """
+    Monta o e-mail de uma mensagem da caixa de saída.
+
+    Args:
+        registro: Linha da tabela mensagens
+        config: Configuração retornada por configuracao_smtp()
+
+    Returns:
+        Mensagem pronta para envio
+    """
+    msg = EmailMessage()
+    msg.set_content(f"Nome: {registro['nome']}\nE-mail: {registro['email_remetente']}\n\nMensagem:\n{registro['mensagem']}")
+    msg['Subject'] = f"Contato do Portfólio - {registro['nome']}"
+    msg['From'] = config["usuario"]
+    msg['To'] = config["destino"]
+    msg['Reply-To'] = registro['email_remetente']
+    return msg
+
+
+def montar_resumo(registros: list, config: dict) -> EmailMessage:
+    """
+    Monta um único e-mail agrupando várias mensagens da caixa de saída.
+
+    Args:
+        registros: Linhas da tabela mensagens
+        config: Configuração retornada por configuracao_smtp()
+
+    Returns:
+        Mensagem pronta para envio
+    """
+    if len(registros) == 1:
+        return montar_mensagem(registros[0], config)
+
+    blocos = [
+        f"[{indice}] Nome: {registro['nome']}\nE-mail: {registro['email_remetente']}\n"
+        f"Recebida em: {time.strftime('%d/%m/%Y %H:%M:%S', time.localtime(registro['criada_em']))}\n\n"
+        f"Mensagem:\n{registro['mensagem']}"
+        for indice, registro in enumerate(registros, start=1)
+    ]
+    msg = EmailMessage()
+    msg.set_content(("\n\n" + "-" * 40 + "\n\n").join(blocos))
+    msg['Subject'] = f"Contato do Portfólio - {len(registros)} mensagens"
+    msg['From'] = config["usuario"]
+    msg['To'] = config["destino"]
+    return msg
+
+
+def conectar_smtp(config: dict):
+    """
+    Abre e autentica uma conexão SMTP conforme a configuração.
+
+    Args:
+        config: Configuração retornada por configuracao_smtp()
+
+    Returns:
+        Conexão smtplib pronta para envio
+    """
+    import smtplib
+
+    if config["tls"] == "ssl":
+        servidor = smtplib.SMTP_SSL(config["servidor"], config["porta"], timeout=30)
+    else:
+        servidor = smtplib.SMTP(config["servidor"], config["porta"], timeout=30)
+        if config["tls"] == "starttls":
+            servidor.starttls()
+    if config["tls"] != "none" and config["usuario"] and config["senha"]:
+        servidor.login(config["usuario"], config["senha"])
+    return servidor
+
+
+def enviar_smtp(mensagens: list, config: dict):
+    """
+    Envia as mensagens em uma única conexão SMTP.
+
+    Args:
+        mensagens: Lista de EmailMessage
+        config: Configuração retornada por configuracao_smtp()
+    """
+    servidor = conectar_smtp(config)
+    try:
+        for msg in mensagens:
+            servidor.send_message(msg)
+    finally:
+        try:
+            servidor.quit()
+        except Exception:
+            servidor.close()
+
+
+class CaixaSaida:
+    """
+    Fila durável de mensagens de contato em SQLite.
+
+    Args:
+        caminho: Arquivo do banco de dados
+    """
+
+    def __init__(self, caminho: str = CAMINHO_CAIXA_SAIDA):
+        self.caminho = caminho
+        os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+        with self._conectar() as conexao:
+            conexao.execute("PRAGMA journal_mode=WAL")
+            conexao.executescript(_ESQUEMA)
+
+    @contextlib.contextmanager
+    def _conectar(self):
+        """Conexão em uma transação (commit ao sair sem erro), sempre fechada ao final."""
+        with contextlib.closing(sqlite3.connect(self.caminho, timeout=10)) as conexao:
+            conexao.row_factory = sqlite3.Row
+            conexao.execute("PRAGMA synchronous=NORMAL")
+            with conexao:
+                yield conexao
+
+    def enfileirar(self, nome: str, email_remetente: str, mensagem: str, atraso: float = 0) -> int:
+        """
+        Grava uma nova mensagem pendente.
+
+        Args:
+            atraso: Segundos até a primeira tentativa de entrega
+
+        Returns:
+            Identificador da mensagem
+        """
+        agora = time.time()
+        with self._conectar() as conexao:
+            cursor = conexao.execute(
+                "INSERT INTO mensagens (nome, email_remetente, mensagem, criada_em, proxima_tentativa) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (nome, email_remetente, mensagem, agora, agora + atraso),
+            )
+            return cursor.lastrowid
+
+    def pendentes(self, limite: int = 50, antecedencia: float = 0) -> list:
+        """
+        Retorna as mensagens pendentes cuja próxima tentativa já venceu.
+
+        Args:
+            limite: Quantidade máxima de mensagens
+            antecedencia: Inclui também as que vencem nos próximos segundos
+
+        Returns:
+            Lista de dicionários com as colunas da tabela
+        """
+        with self._conectar() as conexao:
+            linhas = conexao.execute(
+                "SELECT * FROM mensagens WHERE status = ? AND proxima_tentativa <= ? "
+                "ORDER BY id LIMIT ?",
+                (PENDENTE, time.time() + antecedencia, limite),
+            ).fetchall()
+        return [dict(linha) for linha in linhas]
+
+    def proxima_tentativa(self):
+        """Retorna o horário da próxima tentativa agendada, ou None se a fila estiver vazia."""
+        with self._conectar() as conexao:
+            linha = conexao.execute(
+                "SELECT MIN(proxima_tentativa) FROM mensagens WHERE status = ?", (PENDENTE,)
+            ).fetchone()
+        return linha[0]
+
+    def marcar_enviadas(self, ids: list):
+        agora = time.time()
+        with self._conectar() as conexao:
+            conexao.executemany(
+                "UPDATE mensagens SET status = ?, enviada_em = ?, tentativas = tentativas + 1 WHERE id = ?",
+                [(ENVIADA, agora, id_mensagem) for id_mensagem in ids],
+            )
+
+    def registrar_falha(self, ids: list, erro: str):
+        """
+        Agenda nova tentativa com backoff exponencial ou marca como falha definitiva.
+        """
+        agora = time.time()
+        with self._conectar() as conexao:
+            for id_mensagem in ids:
+                linha = conexao.execute("SELECT tentativas FROM mensagens WHERE id = ?", (id_mensagem,)).fetchone()
+                if linha is None:
+                    continue
+                tentativas = linha["tentativas"] + 1
+                status = FALHOU if tentativas >= MAX_TENTATIVAS else PENDENTE
+                espera = min(BACKOFF_MAXIMO, BACKOFF_BASE * 2 ** (tentativas - 1))
+                conexao.execute(
+                    "UPDATE mensagens SET status = ?, tentativas = ?, proxima_tentativa = ?, ultimo_erro = ? WHERE id = ?",
+                    (status, tentativas, agora + espera, erro, id_mensagem),
+                )
+
+    def contagem(self) -> dict:
+        """Quantidade de mensagens por status."""
+        with self._conectar() as conexao:
+            linhas = conexao.execute("SELECT status, COUNT(*) FROM mensagens GROUP BY status").fetchall()
+        return {status: total for status, total in linhas}
+
+
+class TrabalhadorEntrega:
+    """
+    Thread que entrega as mensagens pendentes da caixa de saída.
+
+    Args:
+        caixa: Caixa de saída a ser esvaziada
+        enviar: Função (mensagens, config) usada para a entrega
+        intervalo: Tempo máximo entre verificações da fila, em segundos
+        janela_resumo: Janela de agrupamento do modo resumo (0 desativa);
+            None lê EMAIL_RESUMO_JANELA a cada verificação
+    """
+
+    def __init__(self, caixa: CaixaSaida, enviar=enviar_smtp, intervalo: float = INTERVALO_VERIFICACAO,
+                 janela_resumo: float = None):
+        self.caixa = caixa
+        self.enviar = enviar
+        self.intervalo = intervalo
+        self.janela_resumo = janela_resumo
+        self._acordar = threading.Event()
+        self._parar = threading.Event()
+        self._thread = None
+
+    def iniciar(self):
+        self._thread = threading.Thread(target=self._executar, name="entrega-contato", daemon=True)
+        self._thread.start()
+        return self
+
+    def notificar(self):
+        """Acorda a thread para entregar imediatamente uma mensagem recém-enfileirada."""
+        self._acordar.set()
+
+    def parar(self, timeout: float = None):
+        self._parar.set()
+        self._acordar.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _executar(self):
+        while not self._parar.is_set():
+            try:
+                self.processar_pendentes()
+            except Exception as e:
+                logger.error("Erro na entrega de mensagens de contato: %s", e)
+
+            espera = self.intervalo
+            proxima = self.caixa.proxima_tentativa()
+            if proxima is not None:
+                espera = min(espera, max(0.0, proxima - time.time()))
+            self._acordar.wait(espera)
+            self._acordar.clear()
+
+    def janela(self) -> float:
+        """Janela de agrupamento em vigor, em segundos."""
+        return janela_resumo() if self.janela_resumo is None else self.janela_resumo
+
+    def processar_pendentes(self) -> int:
+        """
+        Tenta entregar todas as mensagens vencidas.
+
+        Returns:
+            Quantidade de mensagens entregues
+        """
+        config = configuracao_smtp()
+        janela = self.janela()
+        if janela > 0:
+            return self._processar_resumo(config, janela)
+
+        entregues = 0
+        for registro in self.caixa.pendentes():
+            try:
+                self.enviar([montar_mensagem(registro, config)], config)
+            except Exception as e:
+                logger.warning("Falha ao entregar mensagem %s: %s", registro["id"], e)
+                self.caixa.registrar_falha([registro["id"]], str(e))
+                continue
+            self.caixa.marcar_enviadas([registro["id"]])
+            entregues += 1
+            logger.info("Mensagem de contato %s entregue (%s)", registro["id"], registro["email_remetente"])
+        return entregues
+
+    def _processar_resumo(self, config: dict, janela: float) -> int:
+        vencidas = self.caixa.pendentes()
+        if not vencidas:
+            return 0
+
+        # Quando a mais antiga vence, as que ainda aguardam a janela vão junto
+        registros = self.caixa.pendentes(antecedencia=janela)
+        ids = [registro["id"] for registro in registros]
+        try:
+            self.enviar([montar_resumo(registros, config)], config)
+        except Exception as e:
+            logger.warning("Falha ao entregar resumo com %d mensagem(ns): %s", len(ids), e)
+            self.caixa.registrar_falha(ids, str(e))
+            return 0
+        self.caixa.marcar_enviadas(ids)
+        logger.info("Resumo com %d mensagem(ns) de contato entregue", len(ids))
+        return len(ids)
+
+
+_trabalhador = None
+_trabalhador_lock = threading.Lock()
+
+
+def obter_trabalhador() -> TrabalhadorEntrega:
+    """
+    Retorna o trabalhador de entrega do processo, iniciando-o na primeira chamada.
+    """
+    global _trabalhador
+    with _trabalhador_lock:
+        if _trabalhador is None:
+            from pool_smtp import enviar_com_pool
+
+            enviar = metricas.instrumentar("smtp_envio")(enviar_com_pool)
+            _trabalhador = TrabalhadorEntrega(CaixaSaida(), enviar=enviar).iniciar()
+            metricas.registrar_coletor("caixa_saida", _trabalhador.caixa.contagem)
+        return _trabalhador
+
+
+def enfileirar_contato(nome: str, email_remetente: str, mensagem: str) -> int:
+    """
+    Grava a mensagem na caixa de saída e acorda o trabalhador de entrega.
+
+    Returns:
+        Identificador da mensagem na caixa de saída
+    """
+    trabalhador = obter_trabalhador()
+    id_mensagem = trabalhador.caixa.enfileirar(nome, email_remetente, mensagem, atraso=trabalhador.janela())
+    trabalhador.notificar()
+    return id_mensagem
@@ -0,0 +1,89 @@
+"""
+Caminhos e configurações compartilhadas entre os módulos do portfólio
+"""
+
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGENS_DIR = os.path.join(BASE_DIR, "Imagem")
+
+# Diretório de caches em disco (miniaturas, índices etc.). Pode ser
+# redirecionado para um volume persistente via variável de ambiente do
+# processo (não é lida do .env, que só é carregado sob demanda).
+DIRETORIO_CACHE = os.environ.get("PORTFOLIO_CACHE_DIR", os.path.join(BASE_DIR, ".cache"))
+
+_ambiente_carregado = False
+_ambiente_lock = threading.Lock()
+
+
+def carregar_ambiente():
+    """
+    Carrega o arquivo .env uma única vez, na primeira vez em que for necessário.
+    """
+    global _ambiente_carregado
+    if _ambiente_carregado:
+        return
+    with _ambiente_lock:
+        if not _ambiente_carregado:
+            from dotenv import load_dotenv
+
+            load_dotenv(os.path.join(BASE_DIR, ".env"))
+            _ambiente_carregado = True
+
+
+def ambiente(nome: str, padrao: str = None):
+    """
+    Lê uma variável de ambiente, carregando o .env sob demanda.
+
+    Args:
+        nome: Nome da variável
+        padrao: Valor retornado se a variável não existir
+
+    Returns:
+        Valor da variável ou o padrão
+    """
+    carregar_ambiente()
+    return os.environ.get(nome, padrao)
+
+
+def _ambiente_numerico(nome: str, padrao, tipo, descricao: str):
+    valor = ambiente(nome)
+    if valor is None:
+        return padrao
+    try:
+        return tipo(valor)
+    except ValueError:
+        logger.warning("%s=%r não é um %s; usando %s", nome, valor, descricao, padrao)
+        return padrao
+
+
+def ambiente_inteiro(nome: str, padrao: int) -> int:
+    """
+    Lê uma variável de ambiente inteira, voltando ao padrão se for inválida.
+
+    Args:
+        nome: Nome da variável
+        padrao: Valor usado se a variável não existir ou não for um inteiro
+
+    Returns:
+        Valor da variável ou o padrão
+    """
+    return _ambiente_numerico(nome, padrao, int, "inteiro")
+
+
+def ambiente_real(nome: str, padrao: float) -> float:
+    """
+    Lê uma variável de ambiente numérica (ex.: "0.5", "1e3"), voltando ao padrão se for inválida.
+
+    Args:
+        nome: Nome da variável
+        padrao: Valor usado se a variável não existir ou não for um número
+
+    Returns:
+        Valor da variável ou o padrão
+    """
+    return _ambiente_numerico(nome, padrao, float, "número")
@@ -0,0 +1,188 @@
+"""
+Conteúdo estruturado do portfólio (links profissionais e currículo).
+
+Os fragmentos HTML das páginas são gerados a partir destes dados por
+fragmentos_html, uma única vez por processo.
+"""
+
+NOME = "Tiago Holanda"
+FOTO_PERFIL = "https://avatars.githubusercontent.com/u/111590174?v=4"
+EMAILS_CONTATO = ["tfholanda@gmail.com", "tiagofholanda@hotmail.com"]
+
+# "icone" é a origem do ícone; a cópia servida ao visitante fica em
+# assets/icones/<id>.* e é compilada em data URI por icones.py
+LINKS_PROFISSIONAIS = [
+    {"id": "google_academico", "label": "Google Acadêmico", "url": "https://scholar.google.com.br/citations?user=XLu_qAIAAAAJ&hl=pt-BR", "icone": "https://cdn-icons-png.flaticon.com/512/300/300221.png", "largura": 40},
+    {"id": "linkedin", "label": "LinkedIn", "url": "https://www.linkedin.com/in/tiago-holanda-082928141/", "icone": "https://cdn-icons-png.flaticon.com/512/174/174857.png", "largura": 40},
+    {"id": "github", "label": "GitHub", "url": "https://github.com/tiagofholanda", "icone": "https://cdn-icons-png.flaticon.com/512/25/25231.png", "largura": 40},
+    {"id": "lattes", "label": "Lattes", "url": "http://lattes.cnpq.br/4969639760120080", "icone": "https://lattes.cnpq.br/image/layout_set_logo?img_id=1311768&t=1729293336662", "largura": 40},
+    {"id": "researchgate", "label": "ResearchGate", "url": "https://www.researchgate.net/profile/Tiago_Holanda", "icone": "https://c5.rgstatic.net/m/419438641133902/images/icons/svgicons/new-index-logo.svg", "largura": 40},
+    {"id": "publons", "label": "Publons", "url": "https://publons.com/researcher/3962699/tiago-holanda/", "icone": "https://www.pikpng.com/pngl/m/424-4243430_reviewers-for-these-journals-can-track-verify-and.png", "largura": 80},
+    {"id": "orcid", "label": "ORCID", "url": "https://orcid.org/0000-0001-6898-5027", "icone": "https://upload.wikimedia.org/wikipedia/commons/0/06/ORCID_iD.svg", "largura": 40},
+    {"id": "scopus", "label": "Scopus", "url": "https://www.scopus.com/authid/detail.uri?authorId=57376293300", "icone": "https://www.elsevier.com/images/elsevier-logo.svg", "largura": 80},
+]
+
+INTRODUCAO_HOME = (
+    "Olá! Sou Tiago Holanda, um profissional dedicado nas áreas de Geografia e Geoinformação. "
+    "Navegue pelo meu portfólio para conhecer mais sobre minha trajetória acadêmica, projetos "
+    "desenvolvidos e como entrar em contato."
+)
+
+RESUMO_PROFISSIONAL = (
+    "Especialista em Geoprocessamento, Sistemas WebGIS e Análise de Dados, com atuação em "
+    "desenvolvimento de soluções espaciais, automação de processos com Python e R, integração de "
+    "bancos PostGIS e visualização de dados em plataformas como Streamlit, Power BI e React/Mapbox. "
+    "Experiência comprovada em projetos para setores público e privado, além de sólida produção "
+    "acadêmica e atividades de docência."
+)
+
+# Cada seção do currículo tem itens que podem ser:
+#   "texto"                        -> item simples
+#   ("Rótulo", "texto")            -> item com rótulo em negrito
+#   {"titulo": ..., "campos": [...]} -> experiência com campos rotulados
+SECOES_CURRICULO = [
+    {
+        "id": "dados_pessoais",
+        "titulo": "Dados Pessoais",
+        "itens": [
+            ("Nome", "Tiago Fernando de Holanda"),
+            ("Endereço", "Rua Rio Grande do Sul, n.º 711, Barro Preto – Belo Horizonte/MG"),
+            ("Telefones", "(81) 99667-4681"),
+            ("E-mails", "tfholanda@gmail.com / tiagofholanda@hotmail.com"),
+            ("Estado Civil", "Solteiro"),
+            ("Data de Nascimento", "08/07/1995"),
+            ("Nacionalidade", "Brasileiro"),
+            ("Naturalidade", "Cabo de Santo Agostinho/PE"),
+            ("CNH", "Categoria B"),
+        ],
+    },
+    {
+        "id": "formacao",
+        "titulo": "Formação Acadêmica e Técnica",
+        "itens": [
+            "Graduando em Análise e Desenvolvimento de Sistemas – Estácio",
+            "Graduado em Geografia – UFPE (2018)",
+            "Mestre em Ciências Geodésicas e Tecnologia da Geoinformação – UFPE (2020)",
+            "Técnico em Geoprocessamento – IF Sul de Minas",
+            "Técnico em Agrimensura – Especialista em Georreferenciamento",
+        ],
+    },
+    {
+        "id": "experiencias",
+        "titulo": "Experiências Profissionais",
+        "itens": [
+            {
+                "titulo": "UFABC",
+                "campos": [
+                    ("Função", "Tutor e Professor da Especialização em Geoprocessamento"),
+                    ("Atuação", "Orientação de TCC, tutoria em disciplinas específicas e acompanhamento pedagógico da pós-graduação."),
+                    ("Período", "10/07/2023 – 01/08/2025"),
+                ],
+            },
+            {
+                "titulo": "DEVGIS",
+                "campos": [
+                    ("Função", "Desenvolvedor WebGIS / Especialista de Geoprocessamento"),
+                    ("Atuação", "React + Mapbox GL JS, APIs REST, dashboards em tempo real, otimização de performance com grandes volumes de dados, integração PostGIS/frontend e bibliotecas internas de mapeamento."),
+                    ("Período", "10/02/2024 – 01/10/2025"),
+                ],
+            },
+            {
+                "titulo": "AERO Engenharia",
+                "campos": [
+                    ("Função", "Especialista de Geoprocessamento"),
+                    ("Atuação", "Estruturação de dados GIS, automações com Python e R, dashboards em R/Python, IA para detecção de focos de dengue e implantação de WebGIS com Geoserver/Geonode em nuvem."),
+                    ("Período", "10/02/2025 – 01/10/2025"),
+                ],
+            },
+            {
+                "titulo": "NMC Integrativa",
+                "campos": [
+                    ("Função", "Especialista de Geoprocessamento / Coordenação de Projetos"),
+                    ("Atuação", "Estruturação de dados, automação com Python e R, dashboards para gestão e planejamento de tarefas internas."),
+                    ("Período", "04/06/2024 – 15/12/2024"),
+                ],
+            },
+            {
+                "titulo": "RAC Soluções Ambientais (Fundação Renova)",
+                "campos": [
+                    ("Função", "Analista de Planejamento / Geoprocessamento"),
+                    ("Atuação", "Automação, mapeamento aerofotogramétrico com drones, dashboards, sensoriamento remoto e supervisão de contratos nos programas 07 e 08 de reassentamento."),
+                    ("Período", "10/03/2023 – 27/05/2024"),
+                ],
+            },
+            {
+                "titulo": "Empresa Caroá Topografia e Agrimensura",
+                "campos": [
+                    ("Função", "Prestador de serviço técnico-científico"),
+                    ("Atuação", "Planejamento e execução de mapeamentos aerofotogramétricos e implantação de GIS."),
+                    ("Período", "30/06/2021 – 10/03/2023"),
+                ],
+            },
+            {
+                "titulo": "Corpo Técnico de Perícia Ambiental – Ipojuca/PE",
+                "campos": [
+                    ("Função", "Consultor Técnico"),
+                    ("Atuação", "Estruturação de mapeamentos aerofotogramétricos e GIS para perícias ambientais."),
+                    ("Período", "03/2021 – 04/2021"),
+                ],
+            },
+            {
+                "titulo": "Professor do Departamento de Geografia – UPE",
+                "campos": [
+                    ("Disciplinas", "Cartografia Básica, Cartografia Temática, Estatística Aplicada, Geotecnologias e Afins."),
+                    ("Período", "01/2020 – 07/2021"),
+                ],
+            },
+        ],
+    },
+    {
+        "id": "projetos_academicos",
+        "titulo": "Projetos, Pesquisas e Atuação Acadêmica",
+        "itens": [
+            "Projeto PELDTAMS (UFPE): monitoramento anual de praia com Drone e GNSS (2017 – atual).",
+            "Doutorado em Ponta de Pedra – PE: monitoramento costeiro com Drone e GNSS (2017 – 2018).",
+            "Monitoramento da Caatinga em Itacuruba/PE com Drone (fev/2019).",
+            "Mestrado – Monitoramento da Praia do Paiva/PE com GNSS e Drone.",
+            "Monitoramento com Drone na Reserva Biológica Ilha Atol das Rocas (2020 – atual).",
+        ],
+    },
+    {
+        "id": "competencias",
+        "titulo": "Competências Técnicas",
+        "itens": [
+            ("Softwares de processamento e modelagem", "Agisoft Photoscan/Metashape, Pix4D Mapper, Bentley, Trimble Business Center, GTR Processor, TOPCOM."),
+            ("GIS", "ArcGIS Desktop/Online/Pro/Server, ArcGIS Apps, QGIS, Global Mapper e manipulação de bancos PostGIS."),
+            ("Modelagem Costeira", "DELFT 3D, XBEACH, SMC."),
+            ("Programação", "Python, R (incluindo IA), HTML5, JavaScript, desenvolvimento Streamlit, React, Mapbox GL JS."),
+            ("Sensoriamento e Topografia", "Operação de drones (RPAS), GNSS, aerofotogrametria, geração de dashboards e análises em Power BI."),
+        ],
+    },
+    {
+        "id": "cursos",
+        "titulo": "Cursos e Capacitações",
+        "itens": [
+            "R para geoprocessamento de dados espaciais – UFF (20h)",
+            "Python para geoprocessamento de dados espaciais",
+            "Capacitação ET-EDGV – UFPE (4h)",
+            "Disseminação do banco de dados do IBGE – UFPE (4h)",
+            "Análises de qualidade de dados espaciais – Graltec (2h)",
+            "Introdução ao AutoCAD 3D – Graltec (2h)",
+            "Banco de Dados Espaciais – Graltec (1h)",
+            "VANTs na Topografia – Graltec (2h)",
+            "Mapeamento Aéreo Express – Droneng (2h)",
+            "Google Earth no Geoprocessamento – Graltec (2h)",
+        ],
+    },
+    {
+        "id": "conteudos",
+        "titulo": "Conteúdos e Palestras Elaboradas",
+        "itens": [
+            "Palestra/curso sobre drones aplicados à climatologia (UFPE).",
+            "Curso ministrado no Encontro do Pensamento Geográfico – EPG/UFPE (2019).",
+            "Curso para o LACCOST/Departamento de Oceanografia da UFPE (2020).",
+            "Curso no Departamento de Geografia da UFPE – AMPLAGEO (2020).",
+            "Curso no Departamento de Oceanografia da UFPE – LABOGEO (2020).",
+        ],
+    },
+]
@@ -0,0 +1,215 @@
+"""
+Cache colunar dos dados de PIB (data/gdp_data.csv).
+
+O CSV do Banco Mundial (formato largo, um país/região por linha e um ano
+por coluna) é convertido uma única vez em uma matriz float32
+países × anos (NaN onde não há dado) e um índice de países. Os arquivos do
+cache são nomeados pelo hash do CSV e só são reconstruídos quando ele muda;
+o carregamento da página lê apenas a matriz binária, sem interpretar o CSV
+nem importar o pandas.
+"""
+
+import csv
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+
+from configuracao import BASE_DIR, DIRETORIO_CACHE
+from miniaturas import hash_conteudo
+
+logger = logging.getLogger(__name__)
+
+CAMINHO_CSV = os.path.join(BASE_DIR, "data", "gdp_data.csv")
+DIRETORIO_PIB = os.path.join(DIRETORIO_CACHE, "pib")
+
+# Colunas de identificação antes das colunas de ano no CSV do Banco Mundial
+COLUNAS_FIXAS = ("Country Name", "Country Code", "Indicator Name", "Indicator Code")
+
+_lock = threading.Lock()
+
+
+class DadosPIB:
+    """
+    Matriz de PIB (US$ correntes) por país e ano.
+
+    Args:
+        nomes: Nomes dos países/regiões, na ordem das linhas
+        codigos: Códigos ISO3 / Banco Mundial, na ordem das linhas
+        anos: Vetor int16 com os anos das colunas
+        valores: Matriz float32 (países × anos), NaN onde não há dado
+        digest: Hash do CSV de origem
+    """
+
+    def __init__(self, nomes, codigos, anos, valores, digest: str = None):
+        self.nomes = list(nomes)
+        self.codigos = list(codigos)
+        self.anos = np.asarray(anos, dtype=np.int16)
+        self.valores = np.asarray(valores, dtype=np.float32)
+        self.digest = digest
+        self.linha_por_codigo = {codigo: i for i, codigo in enumerate(self.codigos)}
+
+    def __len__(self):
+        return len(self.codigos)
+
+    @property
+    def nbytes(self) -> int:
+        """Memória ocupada pela matriz e pelo vetor de anos, em bytes."""
+        return self.valores.nbytes + self.anos.nbytes
+
+    def linhas(self, codigos) -> np.ndarray:
+        """
+        Args:
+            codigos: Códigos dos países
+
+        Returns:
+            Índices das linhas correspondentes (códigos desconhecidos são ignorados)
+        """
+        return np.fromiter(
+            (self.linha_por_codigo[codigo] for codigo in codigos if codigo in self.linha_por_codigo),
+            dtype=np.intp,
+        )
+
+    def colunas(self, ano_inicial: int, ano_final: int) -> slice:
+        """
+        Args:
+            ano_inicial: Primeiro ano (inclusive)
+            ano_final: Último ano (inclusive)
+
+        Returns:
+            Fatia das colunas da matriz no intervalo de anos
+        """
+        inicio = int(np.searchsorted(self.anos, ano_inicial, side="left"))
+        fim = int(np.searchsorted(self.anos, ano_final, side="right"))
+        return slice(inicio, fim)
+
+    def series(self, codigos, ano_inicial: int = None, ano_final: int = None, matriz: np.ndarray = None):
+        """
+        Recorta a matriz para os países e o intervalo de anos pedidos.
+
+        Args:
+            codigos: Códigos dos países
+            ano_inicial: Primeiro ano; padrão: o primeiro disponível
+            ano_final: Último ano; padrão: o último disponível
+            matriz: Matriz países × anos alinhada a estes dados (ex.: um
+                indicador derivado); padrão: os valores do PIB
+
+        Returns:
+            Tupla (codigos_encontrados, anos, matriz) com uma linha por país
+        """
+        linhas = self.linhas(codigos)
+        fatia = self.colunas(
+            int(self.anos[0]) if ano_inicial is None else ano_inicial,
+            int(self.anos[-1]) if ano_final is None else ano_final,
+        )
+        matriz = self.valores if matriz is None else matriz
+        return [self.codigos[i] for i in linhas], self.anos[fatia], matriz[linhas, fatia]
+
+
+def ler_csv(caminho: str = CAMINHO_CSV) -> DadosPIB:
+    """
+    Interpreta o CSV largo do Banco Mundial.
+
+    Colunas vazias (como a vírgula final de cada linha) são descartadas e
+    células vazias viram NaN.
+
+    Args:
+        caminho: Caminho do CSV
+
+    Returns:
+        DadosPIB com os valores do arquivo
+    """
+    with open(caminho, "r", encoding="utf-8-sig", newline="") as arquivo:
+        leitor = csv.reader(arquivo)
+        cabecalho = next(leitor)
+        colunas_ano = [(i, int(nome)) for i, nome in enumerate(cabecalho) if nome.strip().isdigit()]
+        posicao = {nome: i for i, nome in enumerate(cabecalho)}
+        i_nome, i_codigo = posicao[COLUNAS_FIXAS[0]], posicao[COLUNAS_FIXAS[1]]
+
+        nomes, codigos, linhas = [], [], []
+        for linha in leitor:
+            if len(linha) <= i_codigo or not linha[i_codigo]:
+                continue
+            nomes.append(linha[i_nome])
+            codigos.append(linha[i_codigo])
+            linhas.append([linha[i] if i < len(linha) else "" for i, _ in colunas_ano])
+
+    valores = np.full((len(linhas), len(colunas_ano)), np.nan, dtype=np.float32)
+    if linhas:
+        texto = np.array(linhas, dtype=object)
+        preenchidas = texto != ""
+        valores[preenchidas] = texto[preenchidas].astype(np.float64)
+    return DadosPIB(nomes, codigos, [ano for _, ano in colunas_ano], valores)
+
+
+def _caminhos_cache(digest: str):
+    return (
+        os.path.join(DIRETORIO_PIB, f"{digest}.valores.npy"),
+        os.path.join(DIRETORIO_PIB, f"{digest}.indice.json"),
+    )
+
+
+def _gravar_cache(dados: DadosPIB, digest: str):
+    caminho_valores, caminho_indice = _caminhos_cache(digest)
+    os.makedirs(DIRETORIO_PIB, exist_ok=True)
+    sufixo = f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+    with open(caminho_valores + sufixo, "wb") as arquivo:
+        np.save(arquivo, dados.valores)
+    with open(caminho_indice + sufixo, "w", encoding="utf-8") as arquivo:
+        json.dump({"nomes": dados.nomes, "codigos": dados.codigos, "anos": dados.anos.tolist()},
+                  arquivo, ensure_ascii=False)
+    # O índice é publicado por último: sem ele, o cache é considerado ausente
+    os.replace(caminho_valores + sufixo, caminho_valores)
+    os.replace(caminho_indice + sufixo, caminho_indice)
+
+    # Remove caches de versões anteriores do CSV
+    for nome in os.listdir(DIRETORIO_PIB):
+        if not nome.startswith(digest) and not nome.endswith(".tmp"):
+            try:
+                os.remove(os.path.join(DIRETORIO_PIB, nome))
+            except OSError:
+                pass
+
+
+def _ler_cache(digest: str):
+    caminho_valores, caminho_indice = _caminhos_cache(digest)
+    try:
+        with open(caminho_indice, "r", encoding="utf-8") as arquivo:
+            indice = json.load(arquivo)
+        valores = np.load(caminho_valores, allow_pickle=False)
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.warning("Cache de PIB %s inválido: %s", digest, e)
+        return None
+    if valores.shape != (len(indice["codigos"]), len(indice["anos"])):
+        logger.warning("Cache de PIB %s com dimensões inconsistentes", digest)
+        return None
+    return DadosPIB(indice["nomes"], indice["codigos"], indice["anos"], valores, digest)
+
+
+def carregar_pib(caminho: str = CAMINHO_CSV) -> DadosPIB:
+    """
+    Carrega os dados de PIB do cache colunar, reconstruindo-o se o CSV mudou.
+
+    Args:
+        caminho: Caminho do CSV de origem
+
+    Returns:
+        DadosPIB
+    """
+    digest = hash_conteudo(caminho)
+    dados = _ler_cache(digest)
+    if dados is not None:
+        return dados
+
+    with _lock:
+        dados = _ler_cache(digest)
+        if dados is None:
+            dados = ler_csv(caminho)
+            dados.digest = digest
+            _gravar_cache(dados, digest)
+            logger.info("Cache de PIB reconstruído: %d países x %d anos", len(dados), len(dados.anos))
+    return dados
@@ -0,0 +1,342 @@
+"""
+Exportação do portfólio para um site estático.
+
+Renderiza Home, Currículo, Portfólio e Contato em HTML a partir dos mesmos
+dados do app (conteudo, fragmentos_html e o índice de projetos com os
+TITULOS_CUSTOMIZADOS). O CSS é minificado e as imagens da galeria são
+exportadas a partir das miniaturas otimizadas; todos os ativos recebem o
+hash do conteúdo no nome, de modo que podem ser servidos com cache
+imutável por qualquer servidor de arquivos estáticos. O formulário de
+contato continua no app ao vivo, aberto por um link com ?pagina=Contato.
+
+    python exportacao_estatica.py [--destino dist] [--url-app URL] [--workers N]
+
+Variáveis de ambiente:
+    PORTFOLIO_URL_APP   endereço do app usado pelo link do formulário de contato
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import time
+from html import escape
+
+import miniaturas
+from configuracao import BASE_DIR, IMAGENS_DIR, ambiente
+from conteudo import FOTO_PERFIL, NOME, SECOES_CURRICULO
+from fragmentos_html import ler_css_app, obter as obter_fragmento
+
+logger = logging.getLogger(__name__)
+
+DESTINO_PADRAO = os.path.join(BASE_DIR, "dist")
+URL_APP_PADRAO = "https://tiagoportfolio.streamlit.app/"
+CAMINHO_CSS_ESTATICO = os.path.join(BASE_DIR, "assets", "estatico.css")
+
+# Arquivo gerado -> rótulo do menu (mesma ordem do app, sem a página do PIB)
+PAGINAS = [
+    ("index.html", "Home"),
+    ("curriculo.html", "Currículo"),
+    ("portfolio.html", "Portfólio"),
+    ("contato.html", "Contato"),
+]
+
+TAMANHOS_GALERIA = "(max-width: 720px) 100vw, 540px"
+TAMANHOS_CAPA = "(max-width: 720px) 100vw, 1060px"
+
+_TEMPLATE = """<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{titulo} · Portfólio de {nome}</title>
+<link rel="stylesheet" href="{css}">
+</head>
+<body>
+<main class="pagina-estatica">
+<h1 class="titulo-principal">Portfólio de {nome}</h1>
+<nav class="menu-estatico">{menu}</nav>
+{conteudo}
+</main>
+</body>
+</html>
+"""
+
+
+def minificar_css(css: str) -> str:
+    """
+    Remove comentários e espaços desnecessários de uma folha de estilos.
+
+    Args:
+        css: Conteúdo CSS
+
+    Returns:
+        CSS minificado
+    """
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def _nome_seguro(texto: str) -> str:
+    return re.sub(r"[^0-9a-z]+", "-", texto.lower()).strip("-") or "ativo"
+
+
+def _gravar_texto(caminho: str, texto: str):
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        arquivo.write(texto)
+    os.replace(temporario, caminho)
+
+
+class ExportadorEstatico:
+    """
+    Gera as páginas e os ativos com hash no nome em uma pasta de destino.
+
+    Args:
+        destino: Pasta do site gerado
+        url_app: Endereço do app ao vivo (formulário de contato)
+    """
+
+    def __init__(self, destino: str = DESTINO_PADRAO, url_app: str = None):
+        self.destino = destino
+        self.url_app = url_app or ambiente("PORTFOLIO_URL_APP", URL_APP_PADRAO)
+        self.diretorio_ativos = os.path.join(destino, "assets")
+        # Nome lógico -> caminho relativo do ativo com hash
+        self.manifesto = {}
+        self.bytes_ativos = 0
+
+    # ============= ATIVOS =============
+
+    def _registrar_ativo(self, logico: str, nome: str, extensao: str, digest: str) -> tuple:
+        relativo = f"assets/{nome}.{digest[:12]}.{extensao}"
+        self.manifesto[logico] = relativo
+        return relativo, os.path.join(self.destino, relativo)
+
+    def ativo_texto(self, logico: str, nome: str, extensao: str, conteudo: str) -> str:
+        """
+        Grava um ativo textual com o hash do conteúdo no nome.
+
+        Returns:
+            Caminho relativo do ativo, para uso no HTML
+        """
+        dados = conteudo.encode("utf-8")
+        relativo, caminho = self._registrar_ativo(logico, nome, extensao, hashlib.sha256(dados).hexdigest())
+        if not os.path.exists(caminho):
+            with open(caminho, "wb") as arquivo:
+                arquivo.write(dados)
+        self.bytes_ativos += len(dados)
+        return relativo
+
+    def ativo_arquivo(self, logico: str, nome: str, origem: str) -> str:
+        """
+        Copia um arquivo para os ativos com o hash do conteúdo no nome.
+
+        Returns:
+            Caminho relativo do ativo, para uso no HTML
+        """
+        extensao = os.path.splitext(origem)[1].lstrip(".").lower()
+        relativo, caminho = self._registrar_ativo(logico, nome, extensao, miniaturas.hash_conteudo(origem))
+        if not os.path.exists(caminho):
+            shutil.copyfile(origem, caminho)
+        self.bytes_ativos += os.path.getsize(caminho)
+        return relativo
+
+    def _imagem(self, imagem: str, nome: str, marcador: dict = None) -> dict:
+        """
+        Exporta as miniaturas de uma imagem da galeria.
+
+        Args:
+            imagem: Caminho da imagem original
+            nome: Nome base dos arquivos exportados
+            marcador: Marcador do manifesto (ver miniaturas.gerar_marcador),
+                exibido como fundo até a imagem carregar
+
+        Returns:
+            Dicionário com 'src', 'srcset', 'largura', 'altura' e 'fundo'
+        """
+        from PIL import Image
+
+        variantes = []
+        for largura in sorted(miniaturas.LARGURAS_MINIATURA):
+            derivada = miniaturas.gerar_miniatura(imagem, largura)
+            relativo = self.ativo_arquivo(f"{imagem}@{largura}", f"{nome}-{largura}", derivada)
+            with Image.open(derivada) as aberta:
+                variantes.append((relativo, aberta.size))
+
+        maior, (largura, altura) = variantes[-1]
+        return {
+            "src": maior,
+            "srcset": ", ".join(f"{relativo} {tamanho[0]}w" for relativo, tamanho in variantes),
+            "largura": largura,
+            "altura": altura,
+            "fundo": (
+                f"background:{marcador['cor']} url('{marcador['lqip']}') center/cover no-repeat"
+                if marcador else None
+            ),
+        }
+
+    def _limpar_obsoletos(self):
+        em_uso = {os.path.basename(relativo) for relativo in self.manifesto.values()}
+        for nome in os.listdir(self.diretorio_ativos):
+            if nome not in em_uso and nome != "manifest.json":
+                os.remove(os.path.join(self.diretorio_ativos, nome))
+
+    # ============= PÁGINAS =============
+
+    def _html_imagem(self, imagem: dict, legenda: str, tamanhos: str) -> str:
+        return (
+            f'<figure><img src="{escape(imagem["src"])}" srcset="{escape(imagem["srcset"])}" '
+            f'sizes="{tamanhos}" width="{imagem["largura"]}" height="{imagem["altura"]}" '
+            + (f'style="{imagem["fundo"]}" ' if imagem["fundo"] else "") +
+            f'alt="{escape(legenda)}" loading="lazy" decoding="async">'
+            f"<figcaption>{escape(legenda)}</figcaption></figure>"
+        )
+
+    def _home(self) -> str:
+        return obter_fragmento("home_intro") + obter_fragmento("links_sociais")
+
+    def _curriculo(self) -> str:
+        topo = (
+            '<div class="curriculo-topo">'
+            f'<div><img class="foto-perfil" src="{escape(FOTO_PERFIL)}" alt="{escape(NOME)}" width="460" height="460">'
+            f'{obter_fragmento("links_sociais")}</div>'
+            f'<div>{obter_fragmento("resumo_profissional")}</div>'
+            "</div>"
+        )
+        return topo + "".join(obter_fragmento(f"curriculo_{secao['id']}") for secao in SECOES_CURRICULO)
+
+    def _portfolio(self, projetos: list) -> str:
+        partes = [
+            '<h1 class="titulo-principal">Portfólio de Projetos</h1>',
+            '<p class="texto">Abaixo estão alguns dos projetos mais relevantes que desenvolvi ao longo da minha carreira:</p>',
+        ]
+        for projeto in projetos:
+            slug = _nome_seguro(projeto["slug"])
+            marcadores = projeto.get("marcadores") or [None] * len(projeto["imagens"])
+            imagens = [
+                self._imagem(imagem, f"{slug}-{indice + 1}", marcadores[indice])
+                for indice, imagem in enumerate(projeto["imagens"])
+            ]
+            paragrafos = "".join(
+                f'<p class="texto">{escape(paragrafo.strip())}</p>'
+                for paragrafo in projeto["descricao"].split("\n\n") if paragrafo.strip()
+            )
+            galeria = "".join(
+                self._html_imagem(imagem, f"Imagem {indice + 1}", TAMANHOS_GALERIA)
+                for indice, imagem in enumerate(imagens[1:], start=1)
+            )
+            partes.append(
+                f'<section class="projeto" id="{slug}">'
+                f'<h2 class="subtitulo" style="margin-top:0">{escape(projeto["titulo"])}</h2>{paragrafos}'
+                f'<p class="total-imagens">Total de imagens: {len(imagens)}</p>'
+                + self._html_imagem(imagens[0], "Imagem 1", TAMANHOS_CAPA)
+                + (f"<details><summary>Mostrar imagens</summary><div class=\"galeria\">{galeria}</div></details>"
+                   if galeria else "")
+                + "</section>"
+            )
+        return "".join(partes)
+
+    def _contato(self) -> str:
+        formulario = f"{self.url_app.rstrip('/')}/?pagina=Contato"
+        return (
+            '<h1 class="titulo-principal">Contato</h1>'
+            '<p class="texto">Fique à vontade para entrar em contato comigo através dos seguintes canais:</p>'
+            + obter_fragmento("contato_info")
+            + '<h2 class="subtitulo">Redes e Plataformas</h2>'
+            + obter_fragmento("links_sociais")
+            + '<h2 class="subtitulo">Enviar uma Mensagem</h2>'
+            f'<p class="texto"><a class="btn-primary" href="{escape(formulario)}">Abrir o formulário de contato</a></p>'
+        )
+
+    def _pagina(self, arquivo: str, titulo: str, conteudo: str, css: str) -> str:
+        menu = "".join(
+            f'<a href="{destino}" aria-current="page">{escape(rotulo)}</a>' if destino == arquivo
+            else f'<a href="{destino}">{escape(rotulo)}</a>'
+            for destino, rotulo in PAGINAS
+        )
+        return _TEMPLATE.format(titulo=escape(titulo), nome=escape(NOME), css=css, menu=menu, conteudo=conteudo)
+
+    # ============= EXPORTAÇÃO =============
+
+    def exportar(self, projetos: list) -> dict:
+        """
+        Gera o site completo na pasta de destino.
+
+        Ativos com o mesmo conteúdo mantêm o nome e não são regravados;
+        ativos que deixaram de ser usados são removidos.
+
+        Args:
+            projetos: Projetos no formato de IndiceProjetos.projetos()
+
+        Returns:
+            Dicionário com páginas, ativos, bytes dos ativos e duração
+        """
+        inicio = time.perf_counter()
+        os.makedirs(self.diretorio_ativos, exist_ok=True)
+        self.manifesto = {}
+        self.bytes_ativos = 0
+
+        with open(CAMINHO_CSS_ESTATICO, encoding="utf-8") as arquivo:
+            css = self.ativo_texto("estilo.css", "estilo", "css", minificar_css(ler_css_app() + arquivo.read()))
+
+        conteudos = {
+            "index.html": self._home(),
+            "curriculo.html": self._curriculo(),
+            "portfolio.html": self._portfolio(projetos),
+            "contato.html": self._contato(),
+        }
+        for arquivo, titulo in PAGINAS:
+            _gravar_texto(os.path.join(self.destino, arquivo), self._pagina(arquivo, titulo, conteudos[arquivo], css))
+
+        _gravar_texto(
+            os.path.join(self.diretorio_ativos, "manifest.json"),
+            json.dumps(self.manifesto, ensure_ascii=False, indent=1, sort_keys=True),
+        )
+        self._limpar_obsoletos()
+        return {
+            "paginas": len(PAGINAS),
+            "ativos": len(self.manifesto),
+            "bytes_ativos": self.bytes_ativos,
+            "duracao": time.perf_counter() - inicio,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exporta o portfólio como site estático.")
+    parser.add_argument("--destino", default=DESTINO_PADRAO, help="Pasta do site gerado")
+    parser.add_argument("--url-app", default=None, help="Endereço do app ao vivo (padrão: PORTFOLIO_URL_APP)")
+    parser.add_argument("--base", default=IMAGENS_DIR, help="Pasta com as imagens dos projetos")
+    parser.add_argument("--workers", type=int, default=None, help="Processos para gerar as miniaturas pendentes")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    from indice_projetos import IndiceProjetos
+    from preprocessamento import AquecimentoMiniaturas
+
+    indice = IndiceProjetos(args.base)
+    indice.atualizar()
+    projetos = indice.projetos()
+
+    # Miniaturas pendentes geradas em paralelo antes da exportação
+    AquecimentoMiniaturas(
+        [imagem for projeto in projetos for imagem in projeto["imagens"]], max_workers=args.workers,
+    ).executar()
+
+    exportador = ExportadorEstatico(args.destino, args.url_app)
+    relatorio = exportador.exportar(projetos)
+    print(
+        f"{relatorio['paginas']} página(s) e {relatorio['ativos']} ativo(s) "
+        f"({relatorio['bytes_ativos'] / 1024 / 1024:.1f} MiB) em {args.destino} "
+        f"em {relatorio['duracao']:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""
+Cache de fragmentos HTML estáticos do portfólio.
+
+Os blocos HTML que não dependem da interação do visitante (barra de links
+profissionais, seções do currículo, textos fixos e CSS) são montados uma
+única vez por processo a partir de conteudo.py e indexados pelo hash do
+conteúdo. Cada rerun reutiliza exatamente as mesmas strings.
+"""
+
+import collections
+import hashlib
+import os
+import threading
+from html import escape
+
+import icones
+from configuracao import BASE_DIR
+from conteudo import (
+    EMAILS_CONTATO,
+    INTRODUCAO_HOME,
+    LINKS_PROFISSIONAIS,
+    RESUMO_PROFISSIONAL,
+    SECOES_CURRICULO,
+)
+
+Fragmento = collections.namedtuple("Fragmento", ["nome", "html", "hash"])
+
+# Folha de estilos do app, também usada pela exportação estática
+CAMINHO_CSS_APP = os.path.join(BASE_DIR, "assets", "app.css")
+
+_fragmentos = {}
+_por_hash = {}
+_lock = threading.Lock()
+
+
+def _hash(html: str) -> str:
+    return hashlib.sha1(html.encode("utf-8")).hexdigest()[:16]
+
+
+def registrar(nome: str, html: str) -> str:
+    """
+    Registra um fragmento e devolve a string canônica para o seu conteúdo.
+
+    Conteúdos idênticos registrados com nomes diferentes compartilham a
+    mesma string.
+
+    Args:
+        nome: Nome do fragmento
+        html: Conteúdo HTML
+
+    Returns:
+        A string HTML armazenada no cache
+    """
+    with _lock:
+        atual = _fragmentos.get(nome)
+        if atual is not None and (atual.html is html or atual.html == html):
+            return atual.html
+        digest = _hash(html)
+        html = _por_hash.setdefault(digest, html)
+        _fragmentos[nome] = Fragmento(nome, html, digest)
+        return html
+
+
+def obter(nome: str) -> str:
+    """
+    Retorna o HTML de um fragmento registrado.
+
+    Args:
+        nome: Nome do fragmento
+
+    Returns:
+        String HTML; KeyError se o fragmento não existir
+    """
+    return _fragmentos[nome].html
+
+
+def fragmentos() -> dict:
+    """Retorna uma cópia do registro de fragmentos (nome -> Fragmento)."""
+    with _lock:
+        return dict(_fragmentos)
+
+
+# ============= CONSTRUÇÃO A PARTIR DOS DADOS =============
+
+def html_icone(link: dict) -> str:
+    """
+    Ícone do link como data URI com dimensões fixas (sem requisição externa).
+
+    Links sem cópia local em assets/icones usam a URL de origem.
+    """
+    icone = icones.obter(link["id"]) if "id" in link else None
+    if icone is None:
+        return f'<img src="{escape(link["icone"])}" width="{link["largura"]}" height="{icones.ALTURA}" alt="{escape(link["label"])}"/>'
+    # A data URI não contém aspas duplas; escapar as simples só aumentaria o HTML
+    return f'<img src="{escape(icone.uri, quote=False)}" width="{icone.largura}" height="{icone.altura}" alt="{escape(link["label"])}"/>'
+
+
+def links_com_icone(links=LINKS_PROFISSIONAIS) -> list:
+    """
+    Converte os links estruturados para o formato {'icon', 'label', 'url'}.
+    """
+    return [{"icon": html_icone(link), "label": link["label"], "url": link["url"]} for link in links]
+
+
+def construir_links_sociais(links) -> str:
+    """
+    Monta a barra de links profissionais.
+
+    Args:
+        links: Lista de dicionários com 'icon', 'label' e 'url'
+
+    Returns:
+        String HTML da barra
+    """
+    partes = [
+        f'<a href="{escape(link["url"])}" target="_blank" title="{escape(link["label"])}">{link["icon"]}</a>'
+        for link in links
+    ]
+    return '<div class="icone-rede">' + " ".join(partes) + "</div>"
+
+
+def _html_item(item) -> str:
+    if isinstance(item, dict):
+        campos = "".join(f"<br><strong>{escape(rotulo)}:</strong> {escape(valor)}" for rotulo, valor in item["campos"])
+        return f"<li><strong>{escape(item['titulo'])}</strong>{campos}</li>"
+    if isinstance(item, tuple):
+        rotulo, valor = item
+        return f"<li><strong>{escape(rotulo)}:</strong> {escape(valor)}</li>"
+    return f"<li>{escape(item)}</li>"
+
+
+def construir_secao(secao: dict) -> str:
+    """
+    Monta o título e a lista de uma seção do currículo.
+
+    Args:
+        secao: Elemento de conteudo.SECOES_CURRICULO
+
+    Returns:
+        String HTML da seção
+    """
+    itens = "".join(_html_item(item) for item in secao["itens"])
+    return f'<h2 class="subtitulo">{escape(secao["titulo"])}</h2><ul class="texto">{itens}</ul>'
+
+
+def ler_css_app() -> str:
+    """Retorna o conteúdo de assets/app.css."""
+    with open(CAMINHO_CSS_APP, encoding="utf-8") as arquivo:
+        return arquivo.read()
+
+
+def _construir_todos():
+    registrar("css_app", f"<style>\n{ler_css_app()}</style>")
+    registrar("links_sociais", construir_links_sociais(links_com_icone()))
+    registrar("home_intro", f'<p class="texto">{escape(INTRODUCAO_HOME)}</p>')
+    registrar(
+        "resumo_profissional",
+        '<h2 class="subtitulo">Resumo Profissional</h2>'
+        f'<p class="texto" style="color:#000000;">{escape(RESUMO_PROFISSIONAL)}</p>',
+    )
+    registrar(
+        "contato_info",
+        '<ul class="texto"><li><strong>E-mail:</strong> ' + " / ".join(EMAILS_CONTATO) + "</li></ul>",
+    )
+    for secao in SECOES_CURRICULO:
+        registrar(f"curriculo_{secao['id']}", construir_secao(secao))
+
+
+_construir_todos()
+
+_links_personalizados = {}
+
+
+def links_sociais(links=None) -> str:
+    """
+    Retorna a barra de links profissionais, montada uma única vez por conteúdo.
+
+    Args:
+        links: Lista de dicionários com 'icon', 'label' e 'url'; None usa os
+            links profissionais padrão
+
+    Returns:
+        String HTML da barra
+    """
+    if links is None:
+        return obter("links_sociais")
+
+    chave = _hash(repr([(link["icon"], link["label"], link["url"]) for link in links]))
+    html = _links_personalizados.get(chave)
+    if html is None:
+        html = registrar(f"links_sociais_{chave}", construir_links_sociais(links))
+        _links_personalizados[chave] = html
+    return html
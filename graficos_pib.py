@@ -0,0 +1,320 @@
+"""
+Gráficos do explorador do PIB com decimação e cache de figuras.
+
+Séries acima do orçamento de pontos da figura são reduzidas com o algoritmo
+LTTB (largest-triangle-three-buckets), que preserva picos e vales. As
+figuras prontas são guardadas já serializadas em JSON em um cache LRU
+limitado por quantidade e por bytes, com chave na seleção (dados, países,
+período, indicador): uma visualização repetida não constrói a figura de
+novo, apenas reenvia o JSON guardado. As figuras também vão para o cache
+persistente em disco, de modo que um processo reiniciado não as reconstrói.
+
+Variáveis de ambiente:
+    PORTFOLIO_PIB_ORCAMENTO_PONTOS=1500   pontos por figura antes da decimação
+"""
+
+import collections
+import json
+import threading
+
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+
+import metricas
+from cache_persistente import chave_argumentos, obter_cache as obter_cache_persistente
+from configuracao import ambiente_inteiro
+from busca_paises import mascara_paises
+from indicadores_pib import INDICADORES
+
+ORCAMENTO_PONTOS = ambiente_inteiro("PORTFOLIO_PIB_ORCAMENTO_PONTOS", 1500)
+# Nenhuma série é reduzida abaixo deste número de pontos
+PONTOS_MINIMOS = 16
+
+MAX_FIGURAS = 64
+MAX_BYTES_FIGURAS = 8 * 1024 * 1024
+AMOSTRAS_PAYLOAD = 512
+# Aumente ao mudar a construção das figuras: descarta as gravadas em disco
+VERSAO_FIGURAS = 1
+
+
+# ============= DECIMAÇÃO =============
+
+def lttb(x: np.ndarray, y: np.ndarray, limite: int) -> np.ndarray:
+    """
+    Seleciona os pontos de uma série com o algoritmo LTTB.
+
+    Args:
+        x: Abscissas em ordem crescente
+        y: Ordenadas (sem NaN)
+        limite: Quantidade de pontos desejada (mínimo 3)
+
+    Returns:
+        Índices dos pontos escolhidos, em ordem crescente
+    """
+    n = len(x)
+    if limite >= n or limite < 3:
+        return np.arange(n)
+
+    x = x.astype(np.float64, copy=False)
+    y = y.astype(np.float64, copy=False)
+    # Primeiro e último pontos fixos; os demais divididos em limite - 2 baldes
+    bordas = np.linspace(1, n - 1, limite - 1).astype(np.intp)
+    escolhidos = np.empty(limite, dtype=np.intp)
+    escolhidos[0], escolhidos[-1] = 0, n - 1
+
+    anterior = 0
+    for balde in range(limite - 2):
+        inicio, fim = bordas[balde], bordas[balde + 1]
+        # Média do próximo balde (ou o último ponto) como terceiro vértice
+        proximo_fim = bordas[balde + 2] if balde + 2 < len(bordas) else n
+        if balde + 2 < len(bordas):
+            media_x = x[fim:proximo_fim].mean()
+            media_y = y[fim:proximo_fim].mean()
+        else:
+            media_x, media_y = x[-1], y[-1]
+
+        areas = np.abs(
+            (x[anterior] - media_x) * (y[inicio:fim] - y[anterior])
+            - (x[anterior] - x[inicio:fim]) * (media_y - y[anterior])
+        )
+        anterior = inicio + int(np.argmax(areas))
+        escolhidos[balde + 1] = anterior
+    return escolhidos
+
+
+def decimar(x: np.ndarray, y: np.ndarray, limite: int):
+    """
+    Reduz uma série ao limite de pontos, ignorando os anos sem dado.
+
+    Args:
+        x: Abscissas
+        y: Ordenadas, com NaN onde não há dado
+        limite: Quantidade máxima de pontos
+
+    Returns:
+        Tupla (x, y) possivelmente reduzida; séries dentro do limite voltam intactas
+    """
+    validos = ~np.isnan(y)
+    if np.count_nonzero(validos) <= limite:
+        return x, y
+    x, y = x[validos], y[validos]
+    indices = lttb(x, y, limite)
+    return x[indices], y[indices]
+
+
+def limite_por_serie(quantidade_series: int, orcamento: int = None) -> int:
+    """
+    Divide o orçamento de pontos da figura entre as séries.
+
+    Args:
+        quantidade_series: Número de séries na figura
+        orcamento: Pontos por figura; padrão: ORCAMENTO_PONTOS
+
+    Returns:
+        Pontos permitidos por série
+    """
+    orcamento = ORCAMENTO_PONTOS if orcamento is None else orcamento
+    return max(PONTOS_MINIMOS, orcamento // max(1, quantidade_series))
+
+
+# ============= CACHE DE FIGURAS =============
+
+class CacheFiguras:
+    """
+    Cache LRU de figuras serializadas, limitado por quantidade e por bytes.
+
+    Args:
+        max_figuras: Quantidade máxima de figuras
+        max_bytes: Soma máxima do tamanho dos JSON guardados
+    """
+
+    def __init__(self, max_figuras: int = MAX_FIGURAS, max_bytes: int = MAX_BYTES_FIGURAS):
+        self.max_figuras = max_figuras
+        self.max_bytes = max_bytes
+        self._figuras = collections.OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._payloads = collections.deque(maxlen=AMOSTRAS_PAYLOAD)
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, chave):
+        with self._lock:
+            especificacao = self._figuras.get(chave)
+            if especificacao is None:
+                self.falhas += 1
+                return None
+            self._figuras.move_to_end(chave)
+            self.acertos += 1
+            self._payloads.append(len(especificacao))
+            return especificacao
+
+    def definir(self, chave, especificacao: str):
+        with self._lock:
+            antiga = self._figuras.pop(chave, None)
+            if antiga is not None:
+                self._bytes -= len(antiga)
+            self._figuras[chave] = especificacao
+            self._bytes += len(especificacao)
+            self._payloads.append(len(especificacao))
+            while self._figuras and (len(self._figuras) > self.max_figuras or self._bytes > self.max_bytes):
+                _, removida = self._figuras.popitem(last=False)
+                self._bytes -= len(removida)
+
+    def estatisticas(self) -> dict:
+        """
+        Returns:
+            Acertos, falhas, figuras e bytes em cache e tamanho do payload
+            enviado por interação (mediana e máximo, em bytes)
+        """
+        with self._lock:
+            payloads = sorted(self._payloads)
+            estatisticas = {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "figuras": len(self._figuras),
+                "bytes": self._bytes,
+            }
+        if payloads:
+            estatisticas["payload_mediana_bytes"] = payloads[len(payloads) // 2]
+            estatisticas["payload_max_bytes"] = payloads[-1]
+        return estatisticas
+
+
+_cache = CacheFiguras()
+metricas.registrar_coletor("graficos_pib", _cache.estatisticas)
+
+
+def figura_serializada(chave, construir) -> str:
+    """
+    Retorna o JSON da figura da seleção, construindo-a apenas na primeira vez.
+
+    Args:
+        chave: Tupla que identifica a seleção (dados, países, período, indicador)
+        construir: Função sem argumentos que devolve a go.Figure
+
+    Returns:
+        Especificação Plotly serializada em JSON
+    """
+    especificacao = _cache.obter(chave)
+    if especificacao is None:
+        def serializar():
+            with metricas.medir("construir_figura_pib"):
+                return pio.to_json(construir(), validate=False)
+
+        # O nível em memória do cache persistente é dispensado: _cache já
+        # guarda a figura neste processo. Figuras de outras versões
+        # (VERSAO_FIGURAS) são removidas do disco no primeiro uso.
+        cache = obter_cache_persistente()
+        prefixo = cache.prefixo_versionado("figura_pib", VERSAO_FIGURAS)
+        especificacao = cache.obter_ou_calcular(prefixo + chave_argumentos(chave), serializar, memoria=False)
+        _cache.definir(chave, especificacao)
+    return especificacao
+
+
+class _FiguraPronta(go.Figure):
+    """Figura que devolve uma especificação já validada sem reconstruir os traços."""
+
+    def __init__(self, especificacao: dict):
+        super().__init__()
+        self._especificacao = especificacao
+
+    def to_dict(self):
+        return self._especificacao
+
+
+def exibir(destino, especificacao: str):
+    """
+    Exibe uma figura serializada por figura_serializada().
+
+    Args:
+        destino: st ou um container do Streamlit
+        especificacao: JSON da figura
+    """
+    destino.plotly_chart(_FiguraPronta(json.loads(especificacao)), width="stretch")
+
+
+# ============= FIGURAS DO EXPLORADOR =============
+
+def _serie_exibida(serie: np.ndarray, indicador: str) -> np.ndarray:
+    if indicador == "pib":
+        return serie / np.float32(1e9)
+    if indicador in ("crescimento", "participacao"):
+        return serie * np.float32(100)
+    if indicador == "ranking":
+        return np.where(serie > 0, serie, np.nan).astype(np.float32)
+    return serie
+
+
+def figura_evolucao(dados, indicadores, codigos, ano_inicial: int, ano_final: int, indicador: str) -> str:
+    """
+    Figura de linhas do indicador para os países e o período escolhidos.
+
+    Args:
+        dados: DadosPIB
+        indicadores: IndicadoresPIB alinhado a `dados`
+        codigos: Códigos dos países selecionados
+        ano_inicial: Primeiro ano
+        ano_final: Último ano
+        indicador: Chave de indicadores_pib.INDICADORES
+
+    Returns:
+        JSON da figura
+    """
+    chave = ("evolucao", dados.digest, tuple(codigos), ano_inicial, ano_final, indicador, ORCAMENTO_PONTOS)
+
+    def construir():
+        encontrados, anos, serie = dados.series(codigos, ano_inicial, ano_final, indicadores.matriz(indicador))
+        serie = _serie_exibida(serie, indicador)
+        limite = limite_por_serie(len(encontrados))
+        figura = go.Figure()
+        for codigo, valores in zip(encontrados, serie):
+            x, y = decimar(anos, valores, limite)
+            nome = dados.nomes[dados.linha_por_codigo[codigo]]
+            figura.add_trace(go.Scatter(x=x, y=y, mode="lines", name=nome))
+        figura.update_layout(yaxis_title=INDICADORES[indicador], hovermode="x unified", margin=dict(t=30, b=30))
+        if indicador == "ranking":
+            figura.update_yaxes(autorange="reversed")
+        return figura
+
+    return figura_serializada(chave, construir)
+
+
+def figura_ranking(dados, ano: int, quantidade: int = 15, incluir_agregados: bool = False) -> str:
+    """
+    Figura de barras com os maiores PIBs de um ano.
+
+    Args:
+        dados: DadosPIB
+        ano: Ano do ranking
+        quantidade: Quantidade de barras
+        incluir_agregados: Inclui regiões, faixas de renda e demais agregados
+
+    Returns:
+        JSON da figura
+    """
+    chave = ("ranking", dados.digest, ano, quantidade, incluir_agregados)
+
+    def construir():
+        coluna = dados.valores[:, dados.colunas(ano, ano)].ravel()
+        participa = ~np.isnan(coluna)
+        if not incluir_agregados:
+            participa &= mascara_paises(dados.codigos)
+        validos = np.flatnonzero(participa)
+        maiores = validos[np.argsort(coluna[validos])[::-1][:quantidade]][::-1]
+        figura = go.Figure(go.Bar(
+            x=coluna[maiores] / 1e9,
+            y=[dados.nomes[i] for i in maiores],
+            orientation="h",
+        ))
+        figura.update_layout(title=f"Maiores PIBs em {ano}", xaxis_title="US$ bilhões",
+                             margin=dict(t=40, b=30), height=480)
+        return figura
+
+    return figura_serializada(chave, construir)
+
+
+def estatisticas() -> dict:
+    """Estatísticas do cache de figuras do processo."""
+    return _cache.estatisticas()
@@ -0,0 +1,228 @@
+"""
+Ícones dos links profissionais servidos sem requisições externas.
+
+Os ícones dos links de conteudo.LINKS_PROFISSIONAIS são versionados em
+assets/icones/<id>.svg (ou .png/.jpg/.webp): SVGs das marcas do Simple Icons
+(CC0) e um monograma local para o Lattes; --baixar os substitui pelos
+arquivos das URLs de origem. A compilação
+transforma cada ícone em uma data URI otimizada (SVG minificado; imagens
+raster reduzidas a 2x o tamanho exibido) com largura e altura fixas e grava
+o resultado em assets/icones/icones.json. A barra de links é montada a partir
+desse arquivo: nenhum DNS, TLS ou download de terceiros e nenhum
+deslocamento de layout.
+
+    python icones.py --compilar   # recompila assets/icones/icones.json
+    python icones.py --baixar     # baixa os ícones das URLs de origem e recompila
+"""
+
+import argparse
+import base64
+import collections
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+from urllib.parse import quote
+
+from configuracao import BASE_DIR
+from conteudo import LINKS_PROFISSIONAIS
+
+logger = logging.getLogger(__name__)
+
+DIRETORIO_ICONES = os.path.join(BASE_DIR, "assets", "icones")
+CAMINHO_COMPILADO = os.path.join(DIRETORIO_ICONES, "icones.json")
+
+ALTURA = 40
+# Imagens raster são gravadas com o dobro da resolução exibida (telas HiDPI)
+ESCALA_RASTER = 2
+EXTENSOES = (".svg", ".png", ".jpg", ".jpeg", ".webp")
+TIPOS_EXTENSAO = {
+    "image/svg+xml": ".svg",
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+}
+
+Icone = collections.namedtuple("Icone", ["uri", "largura", "altura"])
+
+_icones = None
+_lock = threading.Lock()
+
+
+def _fonte(identificador: str):
+    """Caminho do ícone versionado de um link, ou None se não houver cópia local."""
+    for extensao in EXTENSOES:
+        caminho = os.path.join(DIRETORIO_ICONES, identificador + extensao)
+        if os.path.isfile(caminho):
+            return caminho
+    return None
+
+
+def minificar_svg(svg: str) -> str:
+    """
+    Remove declaração XML, comentários e espaços entre elementos de um SVG.
+
+    Args:
+        svg: Conteúdo SVG
+
+    Returns:
+        SVG minificado
+    """
+    svg = re.sub(r"<\?xml.*?\?>", "", svg, flags=re.S)
+    svg = re.sub(r"<!--.*?-->", "", svg, flags=re.S)
+    svg = re.sub(r">\s+<", "><", svg)
+    return re.sub(r"\s+", " ", svg).strip()
+
+
+def _uri_svg(dados: bytes) -> str:
+    # Percent-encoding com aspas simples fica menor que base64 para SVG
+    svg = minificar_svg(dados.decode("utf-8")).replace('"', "'")
+    return "data:image/svg+xml," + quote(svg, safe=" /=:;,'()!*-._~")
+
+
+def _uri_raster(dados: bytes, largura: int, altura: int) -> str:
+    from PIL import Image
+
+    with Image.open(io.BytesIO(dados)) as imagem:
+        imagem = imagem.convert("RGBA")
+        imagem.thumbnail((largura * ESCALA_RASTER, altura * ESCALA_RASTER), Image.LANCZOS)
+        saida = io.BytesIO()
+        imagem.save(saida, format="PNG", optimize=True)
+    return "data:image/png;base64," + base64.b64encode(saida.getvalue()).decode("ascii")
+
+
+def compilar(links=LINKS_PROFISSIONAIS) -> dict:
+    """
+    Converte os ícones versionados em data URIs com dimensões fixas.
+
+    Args:
+        links: Links no formato de conteudo.LINKS_PROFISSIONAIS
+
+    Returns:
+        Dicionário id -> {'uri', 'largura', 'altura', 'fonte', 'hash'};
+        links sem cópia local ficam de fora
+    """
+    compilados = {}
+    for link in links:
+        caminho = _fonte(link["id"])
+        if caminho is None:
+            logger.warning("Ícone %s sem cópia local em %s", link["id"], DIRETORIO_ICONES)
+            continue
+        with open(caminho, "rb") as arquivo:
+            dados = arquivo.read()
+        largura = link["largura"]
+        if caminho.endswith(".svg"):
+            uri = _uri_svg(dados)
+        else:
+            uri = _uri_raster(dados, largura, ALTURA)
+        compilados[link["id"]] = {
+            "uri": uri,
+            "largura": largura,
+            "altura": ALTURA,
+            "fonte": os.path.basename(caminho),
+            "hash": hashlib.sha1(dados).hexdigest()[:16],
+        }
+    return compilados
+
+
+def gravar_compilado(compilados: dict):
+    temporario = f"{CAMINHO_COMPILADO}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        json.dump(compilados, arquivo, ensure_ascii=False, indent=1, sort_keys=True)
+    os.replace(temporario, CAMINHO_COMPILADO)
+
+
+def _compilado_atual():
+    """Lê o arquivo compilado; None se não existir ou se algum ícone for mais novo."""
+    try:
+        mtime_compilado = os.path.getmtime(CAMINHO_COMPILADO)
+        with open(CAMINHO_COMPILADO, encoding="utf-8") as arquivo:
+            compilados = json.load(arquivo)
+    except (OSError, ValueError):
+        return None
+    for link in LINKS_PROFISSIONAIS:
+        caminho = _fonte(link["id"])
+        if caminho is not None and (
+            link["id"] not in compilados or os.path.getmtime(caminho) > mtime_compilado
+        ):
+            return None
+    return compilados
+
+
+def carregar() -> dict:
+    """
+    Retorna os ícones compilados (id -> Icone), lidos uma única vez por processo.
+
+    Se o arquivo compilado estiver ausente ou desatualizado, os ícones são
+    compilados em memória.
+    """
+    global _icones
+    if _icones is None:
+        with _lock:
+            if _icones is None:
+                compilados = _compilado_atual()
+                if compilados is None:
+                    logger.warning("%s ausente ou desatualizado; compilando os ícones em memória", CAMINHO_COMPILADO)
+                    compilados = compilar()
+                _icones = {
+                    identificador: Icone(dados["uri"], dados["largura"], dados["altura"])
+                    for identificador, dados in compilados.items()
+                }
+    return _icones
+
+
+def obter(identificador: str):
+    """
+    Args:
+        identificador: Valor de "id" do link
+
+    Returns:
+        Icone ou None se o link não tiver cópia local
+    """
+    return carregar().get(identificador)
+
+
+def baixar(links=LINKS_PROFISSIONAIS):
+    """Baixa os ícones das URLs de origem para assets/icones."""
+    import requests
+
+    for link in links:
+        r = requests.get(link["icone"], timeout=30, headers={"User-Agent": "Mozilla/5.0"})
+        r.raise_for_status()
+        tipo = r.headers.get("Content-Type", "").split(";")[0].strip()
+        extensao = TIPOS_EXTENSAO.get(tipo) or os.path.splitext(link["icone"].split("?")[0])[1].lower()
+        if extensao not in EXTENSOES:
+            raise SystemExit(f"Tipo de ícone não suportado para {link['id']}: {tipo or extensao}")
+        for antiga in EXTENSOES:
+            caminho_antigo = os.path.join(DIRETORIO_ICONES, link["id"] + antiga)
+            if antiga != extensao and os.path.exists(caminho_antigo):
+                os.remove(caminho_antigo)
+        with open(os.path.join(DIRETORIO_ICONES, link["id"] + extensao), "wb") as arquivo:
+            arquivo.write(r.content)
+        print(f"{link['id']}{extensao}: {len(r.content)} bytes de {link['icone']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compila os ícones dos links profissionais em data URIs.")
+    parser.add_argument("--compilar", action="store_true", help="Recompila assets/icones/icones.json")
+    parser.add_argument("--baixar", action="store_true", help="Baixa os ícones das URLs de origem e recompila")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.baixar:
+        baixar()
+    if args.baixar or args.compilar:
+        compilados = compilar()
+        gravar_compilado(compilados)
+        total = sum(len(dados["uri"]) for dados in compilados.values())
+        print(f"{len(compilados)} ícone(s) compilado(s) em {CAMINHO_COMPILADO} ({total} bytes de data URI)")
+    else:
+        parser.print_help()
+
+
+if __name__ == "__main__":
+    main()
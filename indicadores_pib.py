@@ -0,0 +1,254 @@
+"""
+Indicadores derivados do PIB calculados sobre a matriz países × anos.
+
+Crescimento anual, CAGR em janelas arbitrárias, ranking por ano e
+participação no PIB mundial são calculados com operações vetorizadas do
+NumPy sobre a matriz inteira de dados_pib.DadosPIB. Quando o CSV ganha um
+novo ano, apenas a coluna nova de cada indicador (e o ranking desse ano) é
+calculada; as demais são reaproveitadas.
+"""
+
+import logging
+import threading
+
+import numpy as np
+
+from busca_paises import mascara_paises
+from dados_pib import DadosPIB
+
+logger = logging.getLogger(__name__)
+
+# Código da linha "World" no CSV do Banco Mundial
+CODIGO_MUNDO = "WLD"
+
+# Janelas de CAGR mantidas pré-calculadas para todos os anos
+JANELAS_CAGR = (5, 10)
+
+INDICADORES = {
+    "pib": "PIB (US$ bilhões)",
+    "crescimento": "Crescimento anual (%)",
+    "participacao": "Participação no PIB mundial (%)",
+    "ranking": "Posição no ranking",
+}
+
+
+def _razao(numerador: np.ndarray, denominador: np.ndarray) -> np.ndarray:
+    """Divide em float64 devolvendo NaN onde o denominador é zero, negativo ou ausente."""
+    numerador = numerador.astype(np.float64, copy=False)
+    denominador = denominador.astype(np.float64, copy=False)
+    resultado = np.full(np.broadcast(numerador, denominador).shape, np.nan)
+    np.divide(numerador, denominador, out=resultado, where=denominador > 0)
+    return resultado
+
+
+def crescimento_anual(valores: np.ndarray) -> np.ndarray:
+    """
+    Crescimento ano a ano (fração) de cada país.
+
+    Args:
+        valores: Matriz países × anos
+
+    Returns:
+        Matriz float32 do mesmo formato; a primeira coluna é NaN
+    """
+    crescimento = np.full(valores.shape, np.nan, dtype=np.float32)
+    if valores.shape[1] > 1:
+        crescimento[:, 1:] = _razao(valores[:, 1:], valores[:, :-1]) - 1
+    return crescimento
+
+
+def cagr_janela(valores: np.ndarray, janela: int) -> np.ndarray:
+    """
+    CAGR móvel: taxa anual composta dos `janela` anos que terminam em cada coluna.
+
+    Args:
+        valores: Matriz países × anos
+        janela: Quantidade de anos da janela
+
+    Returns:
+        Matriz float32 do mesmo formato; as primeiras `janela` colunas são NaN
+    """
+    cagr = np.full(valores.shape, np.nan, dtype=np.float32)
+    if valores.shape[1] > janela:
+        razao = _razao(valores[:, janela:], valores[:, :-janela])
+        with np.errstate(invalid="ignore"):
+            cagr[:, janela:] = np.power(razao, 1.0 / janela) - 1
+    return cagr
+
+
+def rankings(valores: np.ndarray, mascara: np.ndarray = None) -> np.ndarray:
+    """
+    Posição de cada linha no ranking de cada ano (1 = maior PIB).
+
+    Args:
+        valores: Matriz países × anos
+        mascara: Vetor booleano das linhas que participam; None usa todas
+
+    Returns:
+        Matriz int16; 0 onde a linha não tem dado ou não participa
+    """
+    participa = ~np.isnan(valores)
+    if mascara is not None:
+        participa &= mascara[:, None]
+    chaves = np.where(participa, valores, -np.inf)
+    ordem = np.argsort(-chaves, axis=0, kind="stable")
+    posicoes = np.empty(valores.shape, dtype=np.int16)
+    np.put_along_axis(posicoes, ordem, np.arange(1, valores.shape[0] + 1, dtype=np.int16)[:, None], axis=0)
+    posicoes[~participa] = 0
+    return posicoes
+
+
+class IndicadoresPIB:
+    """
+    Indicadores derivados de uma matriz de PIB, com atualização incremental.
+
+    Args:
+        dados: DadosPIB de origem
+        mascara_ranking: Vetor booleano das linhas consideradas nos rankings
+            (ex.: apenas países, sem agregados regionais); None usa todas
+    """
+
+    def __init__(self, dados: DadosPIB, mascara_ranking: np.ndarray = None):
+        self.mascara_ranking = mascara_ranking
+        self._construir(dados)
+
+    def _construir(self, dados: DadosPIB):
+        self.dados = dados
+        valores = dados.valores
+        self.crescimento = crescimento_anual(valores)
+        self.participacao = self._participacao(valores)
+        self.ranking = rankings(valores, self.mascara_ranking)
+        self.cagr = {janela: cagr_janela(valores, janela) for janela in JANELAS_CAGR}
+
+    def _participacao(self, valores: np.ndarray) -> np.ndarray:
+        linha_mundo = self.dados.linha_por_codigo.get(CODIGO_MUNDO)
+        if linha_mundo is None:
+            mundo = np.nansum(valores if self.mascara_ranking is None else valores[self.mascara_ranking], axis=0)
+        else:
+            mundo = valores[linha_mundo]
+        return _razao(valores, mundo[None, :]).astype(np.float32)
+
+    def cagr_periodo(self, ano_inicial: int, ano_final: int) -> np.ndarray:
+        """
+        CAGR de todos os países entre dois anos quaisquer.
+
+        Args:
+            ano_inicial: Ano de partida
+            ano_final: Ano de chegada (maior que o de partida)
+
+        Returns:
+            Vetor float32 (um valor por país), NaN onde não há dado
+        """
+        anos = self.dados.anos
+        i = int(np.searchsorted(anos, ano_inicial))
+        j = int(np.searchsorted(anos, ano_final))
+        if not (i < j < len(anos)) or anos[i] != ano_inicial or anos[j] != ano_final:
+            raise ValueError(f"Período inválido: {ano_inicial}-{ano_final}")
+        razao = _razao(self.dados.valores[:, j], self.dados.valores[:, i])
+        with np.errstate(invalid="ignore"):
+            return (np.power(razao, 1.0 / (ano_final - ano_inicial)) - 1).astype(np.float32)
+
+    def matriz(self, indicador: str) -> np.ndarray:
+        """
+        Args:
+            indicador: Uma das chaves de INDICADORES ou "cagr_<janela>"
+
+        Returns:
+            Matriz países × anos do indicador
+        """
+        if indicador == "pib":
+            return self.dados.valores
+        if indicador == "crescimento":
+            return self.crescimento
+        if indicador == "participacao":
+            return self.participacao
+        if indicador == "ranking":
+            return self.ranking
+        if indicador.startswith("cagr_"):
+            return self.cagr[int(indicador[5:])]
+        raise KeyError(indicador)
+
+    def _colunas_novas(self, dados: DadosPIB):
+        """
+        Returns:
+            Quantidade de anos acrescentados ao final, ou None se os dados
+            antigos mudaram (exige reconstrução completa)
+        """
+        antigos = self.dados
+        n = len(antigos.anos)
+        if (
+            antigos.codigos != dados.codigos
+            or len(dados.anos) < n
+            or not np.array_equal(antigos.anos, dados.anos[:n])
+            or not np.array_equal(antigos.valores, dados.valores[:, :n], equal_nan=True)
+        ):
+            return None
+        return len(dados.anos) - n
+
+    def atualizar(self, dados: DadosPIB) -> str:
+        """
+        Atualiza os indicadores para uma nova versão dos dados.
+
+        Se a nova versão apenas acrescenta anos ao final, só as colunas novas
+        são calculadas; caso contrário, tudo é reconstruído.
+
+        Args:
+            dados: Nova versão do DadosPIB
+
+        Returns:
+            "inalterado", "incremental" ou "completo"
+        """
+        novos = self._colunas_novas(dados)
+        if novos == 0:
+            self.dados = dados
+            return "inalterado"
+        if novos is None:
+            self._construir(dados)
+            return "completo"
+
+        valores = dados.valores
+        n = valores.shape[1] - novos
+        # Cada indicador da coluna k depende no máximo de k - janela; basta
+        # calcular sobre a janela final e anexar as colunas novas
+        contexto = max((1,) + JANELAS_CAGR)
+        inicio = max(0, n - contexto)
+        recorte = valores[:, inicio:]
+
+        self.crescimento = np.concatenate([self.crescimento, crescimento_anual(recorte)[:, -novos:]], axis=1)
+        self.cagr = {
+            janela: np.concatenate([matriz, cagr_janela(recorte, janela)[:, -novos:]], axis=1)
+            for janela, matriz in self.cagr.items()
+        }
+        self.dados = dados
+        self.participacao = np.concatenate([self.participacao, self._participacao(valores[:, n:])], axis=1)
+        self.ranking = np.concatenate([self.ranking, rankings(valores[:, n:], self.mascara_ranking)], axis=1)
+        return "incremental"
+
+
+_motor = None
+_motor_lock = threading.Lock()
+
+
+def obter_indicadores(dados: DadosPIB) -> IndicadoresPIB:
+    """
+    Retorna os indicadores do processo, atualizados para `dados`.
+
+    Uma nova versão do CSV que só acrescenta anos é aplicada de forma
+    incremental sobre os indicadores já calculados. Os rankings consideram
+    apenas países (sem regiões e demais agregados).
+
+    Args:
+        dados: DadosPIB atual
+
+    Returns:
+        IndicadoresPIB
+    """
+    global _motor
+    with _motor_lock:
+        if _motor is None or _motor.dados.codigos != dados.codigos:
+            _motor = IndicadoresPIB(dados, mascara_paises(dados.codigos))
+        elif _motor.dados is not dados:
+            modo = _motor.atualizar(dados)
+            if modo != "inalterado":
+                logger.info("Indicadores de PIB atualizados (%s)", modo)
+        return _motor
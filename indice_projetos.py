@@ -0,0 +1,374 @@
+"""
+Índice persistente e incremental dos projetos da pasta Imagem.
+
+O índice mantém um manifesto em disco com mtime, tamanho e hash de cada pasta
+e arquivo. Uma nova varredura só relê as pastas que mudaram, e um observador
+do sistema de arquivos (watchdog, com fallback para polling) atualiza apenas
+os projetos afetados em segundo plano. Para cada imagem o manifesto guarda
+também as dimensões, a cor dominante e um marcador borrado em base64
+(miniaturas.gerar_marcador), calculados só quando o arquivo muda.
+"""
+
+import json
+import logging
+import os
+import threading
+
+import miniaturas
+from configuracao import DIRETORIO_CACHE
+
+logger = logging.getLogger(__name__)
+
+EXTENSOES_IMAGEM = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp")
+ARQUIVOS_DESCRICAO = ["descricao.txt", "descricao.md", "README.md", "readme.md"]
+
+TITULOS_CUSTOMIZADOS = {
+    "agisoft": "Aerofotogrametria de Alta Precisão",
+    "artigos": "Publicações e Pesquisas Costeiras",
+    "gerenciamento de banco de dados espacial": "Sistema de Gestão de Atividades e Quadras",
+    "inconsistencias em banco de dados espacial": "Relatório de Inconsistências no Banco Espacial",
+    "topografia": "Gestão Topográfica e Plantio",
+    "webgis_2": "WebGIS de Auditoria de Aerolevantamentos",
+    "webgis_3": "WebGIS de Vigilância Epidemiológica",
+    "webgis_4": "WebGIS Municipal (600+ Prefeituras)",
+    "webgis_devgis": "Geoportal Corporativo DEVGIS",
+}
+
+CAMINHO_MANIFESTO = os.path.join(DIRETORIO_CACHE, "indice_projetos.json")
+VERSAO_MANIFESTO = 2
+
+# Intervalo de agrupamento de eventos do observador e de polling (segundos)
+ATRASO_OBSERVADOR = 0.5
+INTERVALO_POLLING = 5.0
+# Só eventos que alteram o conteúdo; aberturas e fechamentos sem escrita vêm
+# das próprias leituras da varredura e a reativariam indefinidamente
+EVENTOS_RELEVANTES = frozenset({"created", "modified", "deleted", "moved"})
+
+
+def _gerar_descricao_projeto(caminho_projeto: str, titulo: str, total_imagens: int) -> str:
+    for nome_arquivo in ARQUIVOS_DESCRICAO:
+        caminho_arquivo = os.path.join(caminho_projeto, nome_arquivo)
+        if os.path.isfile(caminho_arquivo):
+            try:
+                with open(caminho_arquivo, "r", encoding="utf-8") as arquivo:
+                    conteudo = arquivo.read().strip()
+                    if conteudo:
+                        return conteudo
+            except OSError as erro:
+                logger.warning("Não foi possível ler %s: %s", caminho_arquivo, erro)
+
+    return f"Projeto {titulo} com {total_imagens} imagem(ns) demonstrando atividades realizadas nesta frente de trabalho."
+
+
+def _relevante(nome_arquivo: str) -> bool:
+    return nome_arquivo.lower().endswith(EXTENSOES_IMAGEM) or nome_arquivo in ARQUIVOS_DESCRICAO
+
+
+def _marcador(caminho: str):
+    try:
+        return miniaturas.gerar_marcador(caminho)
+    except Exception as erro:
+        logger.warning("Não foi possível gerar o marcador de %s: %s", caminho, erro)
+        return None
+
+
+class IndiceProjetos:
+    """
+    Índice dos projetos de uma pasta base, persistido em um manifesto JSON.
+
+    Args:
+        caminho_base: Pasta que contém uma subpasta por projeto
+        caminho_manifesto: Arquivo JSON onde o manifesto é persistido
+    """
+
+    def __init__(self, caminho_base: str, caminho_manifesto: str = CAMINHO_MANIFESTO):
+        self.caminho_base = caminho_base
+        self.caminho_manifesto = caminho_manifesto
+        self.versao = 0
+        self._lock = threading.RLock()
+        self._pastas = {}
+        self._projetos = None
+        self._carregar_manifesto()
+
+    # ------------------------------------------------------------------ manifesto
+
+    def _carregar_manifesto(self):
+        try:
+            with open(self.caminho_manifesto, "r", encoding="utf-8") as arquivo:
+                dados = json.load(arquivo)
+        except (OSError, ValueError):
+            return
+
+        if dados.get("versao") != VERSAO_MANIFESTO or dados.get("caminho_base") != self.caminho_base:
+            return
+        self._pastas = dados.get("pastas", {})
+
+    def _salvar_manifesto(self):
+        dados = {
+            "versao": VERSAO_MANIFESTO,
+            "caminho_base": self.caminho_base,
+            "pastas": self._pastas,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.caminho_manifesto), exist_ok=True)
+            temporario = f"{self.caminho_manifesto}.{os.getpid()}.tmp"
+            with open(temporario, "w", encoding="utf-8") as arquivo:
+                json.dump(dados, arquivo, ensure_ascii=False)
+            os.replace(temporario, self.caminho_manifesto)
+        except OSError as e:
+            logger.warning("Não foi possível salvar o manifesto %s: %s", self.caminho_manifesto, e)
+
+    # ------------------------------------------------------------------ varredura
+
+    def _varrer_pasta(self, pasta: str, anterior: dict):
+        """Relê uma pasta de projeto, reaproveitando hashes de arquivos inalterados."""
+        caminho_projeto = os.path.join(self.caminho_base, pasta)
+        if not os.path.isdir(caminho_projeto):
+            return None
+
+        arquivos_anteriores = (anterior or {}).get("arquivos", {})
+        arquivos = {}
+        for nome in sorted(os.listdir(caminho_projeto)):
+            if not _relevante(nome):
+                continue
+            caminho = os.path.join(caminho_projeto, nome)
+            try:
+                info = os.stat(caminho)
+            except OSError:
+                continue
+
+            registro = arquivos_anteriores.get(nome)
+            if not registro or registro["mtime_ns"] != info.st_mtime_ns or registro["tamanho"] != info.st_size:
+                registro = {
+                    "mtime_ns": info.st_mtime_ns,
+                    "tamanho": info.st_size,
+                    "hash": miniaturas.hash_conteudo(caminho),
+                }
+                if nome.lower().endswith(EXTENSOES_IMAGEM):
+                    registro["marcador"] = _marcador(caminho)
+            arquivos[nome] = registro
+
+        imagens = [nome for nome in arquivos if nome.lower().endswith(EXTENSOES_IMAGEM)]
+        slug = pasta.lower()
+        titulo = TITULOS_CUSTOMIZADOS.get(slug, pasta.replace("_", " ").title())
+
+        return {
+            "mtime_ns": os.stat(caminho_projeto).st_mtime_ns,
+            "arquivos": arquivos,
+            "projeto": {
+                "slug": slug,
+                "titulo": titulo,
+                "descricao": _gerar_descricao_projeto(caminho_projeto, titulo, len(imagens)),
+                "imagens": imagens,
+            },
+        }
+
+    def _pasta_mudou(self, pasta: str, registro: dict) -> bool:
+        """Compara apenas metadados (stat), sem ler o conteúdo dos arquivos."""
+        caminho_projeto = os.path.join(self.caminho_base, pasta)
+        try:
+            if os.stat(caminho_projeto).st_mtime_ns != registro["mtime_ns"]:
+                return True
+            for nome, arquivo in registro["arquivos"].items():
+                info = os.stat(os.path.join(caminho_projeto, nome))
+                if info.st_mtime_ns != arquivo["mtime_ns"] or info.st_size != arquivo["tamanho"]:
+                    return True
+        except OSError:
+            return True
+        return False
+
+    def atualizar(self, pastas=None) -> set:
+        """
+        Sincroniza o índice com o disco.
+
+        Args:
+            pastas: Nomes das pastas a reavaliar; None reavalia todas,
+                relendo somente as que mudaram desde o manifesto
+
+        Returns:
+            Conjunto com os nomes das pastas cujo projeto mudou
+        """
+        with self._lock:
+            if pastas is None:
+                if os.path.isdir(self.caminho_base):
+                    existentes = {
+                        nome for nome in os.listdir(self.caminho_base)
+                        if os.path.isdir(os.path.join(self.caminho_base, nome))
+                    }
+                else:
+                    existentes = set()
+                candidatas = existentes | set(self._pastas)
+                pastas = {
+                    pasta for pasta in candidatas
+                    if pasta not in existentes
+                    or pasta not in self._pastas
+                    or self._pasta_mudou(pasta, self._pastas[pasta])
+                }
+
+            alteradas = set()
+            for pasta in pastas:
+                anterior = self._pastas.get(pasta)
+                registro = self._varrer_pasta(pasta, anterior)
+                if registro is None:
+                    if self._pastas.pop(pasta, None) is not None:
+                        alteradas.add(pasta)
+                elif registro != anterior:
+                    self._pastas[pasta] = registro
+                    alteradas.add(pasta)
+
+            if alteradas:
+                self.versao += 1
+                self._projetos = None
+                self._salvar_manifesto()
+                logger.info("Índice de projetos atualizado: %s", ", ".join(sorted(alteradas)))
+            return alteradas
+
+    def projetos(self) -> list:
+        """
+        Retorna a lista de projetos no formato usado pela galeria.
+
+        Returns:
+            Lista de dicionários com slug, titulo, descricao, imagens e
+            marcadores (um por imagem: largura, altura, cor e lqip, ou None)
+        """
+        with self._lock:
+            if self._projetos is None:
+                projetos = []
+                for pasta in sorted(self._pastas):
+                    registro = self._pastas[pasta]
+                    projeto = registro["projeto"]
+                    if not projeto["imagens"]:
+                        continue
+
+                    caminho_projeto = os.path.join(self.caminho_base, pasta)
+                    imagens = []
+                    marcadores = []
+                    for nome in projeto["imagens"]:
+                        caminho = os.path.join(caminho_projeto, nome)
+                        arquivo = registro["arquivos"][nome]
+                        miniaturas.registrar_hash(caminho, arquivo["mtime_ns"], arquivo["tamanho"], arquivo["hash"])
+                        imagens.append(caminho)
+                        marcadores.append(arquivo.get("marcador"))
+
+                    projetos.append(dict(projeto, imagens=imagens, marcadores=marcadores))
+                self._projetos = projetos
+            return self._projetos
+
+    # ------------------------------------------------------------------ observação
+
+    def observar(self):
+        """
+        Inicia a observação da pasta base em segundo plano.
+
+        Usa watchdog (inotify no Linux) quando instalado; caso contrário, faz
+        polling leve baseado apenas em stat.
+
+        Returns:
+            O observador iniciado
+        """
+        observador = ObservadorProjetos(self)
+        observador.iniciar()
+        return observador
+
+
+class ObservadorProjetos:
+    """
+    Observa a pasta base e reindexa apenas os projetos afetados.
+
+    Args:
+        indice: Índice a ser mantido atualizado
+    """
+
+    def __init__(self, indice: IndiceProjetos):
+        self.indice = indice
+        self._pendentes = set()
+        self._lock = threading.Lock()
+        self._temporizador = None
+        self._observer = None
+
+    def iniciar(self):
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info("watchdog não instalado; usando polling a cada %.0fs", INTERVALO_POLLING)
+            threading.Thread(target=self._polling, name="indice-projetos-polling", daemon=True).start()
+            return
+
+        observador = self
+
+        class _Manipulador(FileSystemEventHandler):
+            def on_any_event(self, evento):
+                if evento.event_type not in EVENTOS_RELEVANTES:
+                    return
+                for caminho in (evento.src_path, getattr(evento, "dest_path", "")):
+                    if caminho:
+                        observador._registrar(os.fsdecode(caminho))
+
+        os.makedirs(self.indice.caminho_base, exist_ok=True)
+        self._observer = Observer()
+        self._observer.daemon = True
+        self._observer.schedule(_Manipulador(), self.indice.caminho_base, recursive=True)
+        self._observer.start()
+
+    def _registrar(self, caminho: str):
+        relativo = os.path.relpath(caminho, self.indice.caminho_base)
+        if relativo.startswith(os.pardir) or relativo == os.curdir:
+            return
+        pasta = relativo.split(os.sep, 1)[0]
+
+        # Agrupa rajadas de eventos (ex.: cópia de várias imagens) em uma atualização
+        with self._lock:
+            self._pendentes.add(pasta)
+            if self._temporizador is None:
+                self._temporizador = threading.Timer(ATRASO_OBSERVADOR, self._processar)
+                self._temporizador.daemon = True
+                self._temporizador.start()
+
+    def _processar(self):
+        with self._lock:
+            pastas, self._pendentes = self._pendentes, set()
+            self._temporizador = None
+        try:
+            self.indice.atualizar(pastas)
+        except Exception as e:
+            logger.error("Erro ao atualizar índice de projetos: %s", e)
+
+    def _polling(self):
+        evento = threading.Event()
+        while not evento.wait(INTERVALO_POLLING):
+            try:
+                self.indice.atualizar()
+            except Exception as e:
+                logger.error("Erro ao atualizar índice de projetos: %s", e)
+
+    def parar(self):
+        if self._observer is not None:
+            self._observer.stop()
+
+
+_indices = {}
+_indices_lock = threading.Lock()
+
+
+def obter_indice(caminho_base: str) -> IndiceProjetos:
+    """
+    Retorna o índice do processo para a pasta base, atualizado e observado.
+
+    A primeira chamada varre a pasta (reaproveitando o manifesto) e inicia o
+    observador; as seguintes devolvem a mesma instância.
+
+    Args:
+        caminho_base: Pasta que contém uma subpasta por projeto
+
+    Returns:
+        IndiceProjetos
+    """
+    with _indices_lock:
+        indice = _indices.get(caminho_base)
+        if indice is None:
+            indice = IndiceProjetos(caminho_base)
+            indice.atualizar()
+            indice.observar()
+            _indices[caminho_base] = indice
+        return indice
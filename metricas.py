@@ -0,0 +1,396 @@
+"""
+Instrumentação leve dos caminhos quentes do app.
+
+Mede a duração das funções de página e dos carregadores em cache, conta
+acertos e falhas de cada função com st.cache_data / st.cache_resource e os
+reruns por sessão. Os dados são exportados em formato texto do Prometheus
+(arquivo para o textfile collector e, opcionalmente, um endpoint HTTP) e
+exibidos na página administrativa oculta do app.
+
+Desligada (padrão), a instrumentação custa apenas a verificação de um
+booleano por chamada. A variável é lida na primeira medição, e não na
+importação, para que importar o módulo não carregue o .env.
+
+Variáveis de ambiente:
+    PORTFOLIO_METRICAS=1                 habilita a coleta
+    PORTFOLIO_METRICAS_ARQUIVO=...       arquivo .prom (padrão: .cache/metricas.prom)
+    PORTFOLIO_METRICAS_PORTA=9464        expõe /metrics em HTTP local
+    PORTFOLIO_METRICAS_TOKEN=segredo     valor de ?metricas= que abre a página administrativa
+                                         (sem token, a página fica fechada)
+"""
+
+import collections
+import contextlib
+import functools
+import hmac
+import logging
+import os
+import threading
+import time
+
+from configuracao import DIRETORIO_CACHE, ambiente
+
+logger = logging.getLogger(__name__)
+
+AMOSTRAS_POR_TRECHO = 2048
+MAX_SESSOES = 1000
+INTERVALO_EXPORTACAO = 15
+QUANTIS = (0.5, 0.95, 0.99)
+
+_NULO = contextlib.nullcontext()
+
+_lock = threading.Lock()
+_duracoes = {}
+_totais = {}
+_cache = collections.defaultdict(lambda: {"chamadas": 0, "falhas": 0})
+_reruns_por_sessao = collections.OrderedDict()
+_coletores = {}
+_reruns = 0
+_exportacao_iniciada = False
+_habilitado = None
+
+
+def habilitado() -> bool:
+    """Indica se PORTFOLIO_METRICAS=1; a variável é lida uma única vez, sob demanda."""
+    global _habilitado
+    if _habilitado is None:
+        _habilitado = ambiente("PORTFOLIO_METRICAS", "0") == "1"
+    return _habilitado
+
+
+# ============= COLETA =============
+
+def registrar_duracao(nome: str, segundos: float):
+    """
+    Registra a duração de uma execução de um trecho instrumentado.
+
+    Args:
+        nome: Nome do trecho (ex.: "pagina:home")
+        segundos: Duração medida
+    """
+    with _lock:
+        amostras = _duracoes.get(nome)
+        if amostras is None:
+            amostras = _duracoes[nome] = collections.deque(maxlen=AMOSTRAS_POR_TRECHO)
+            _totais[nome] = [0, 0.0]
+        amostras.append(segundos)
+        total = _totais[nome]
+        total[0] += 1
+        total[1] += segundos
+
+
+@contextlib.contextmanager
+def _medir(nome: str):
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar_duracao(nome, time.perf_counter() - inicio)
+
+
+def medir(nome: str):
+    """
+    Context manager que mede o bloco como um trecho nomeado.
+
+    Args:
+        nome: Nome do trecho
+    """
+    return _medir(nome) if habilitado() else _NULO
+
+
+def instrumentar(nome: str = None):
+    """
+    Decorador que mede cada chamada da função.
+
+    Args:
+        nome: Nome do trecho; padrão: nome da função
+    """
+    def decorador(funcao):
+        trecho = nome or funcao.__name__
+
+        @functools.wraps(funcao)
+        def medida(*args, **kwargs):
+            if not habilitado():
+                return funcao(*args, **kwargs)
+            with _medir(trecho):
+                return funcao(*args, **kwargs)
+
+        return medida
+
+    return decorador
+
+
+def _instrumentar_cache(decorador_streamlit, nome, opcoes):
+    def decorador(funcao):
+        chave = nome or funcao.__name__
+
+        # O corpo só executa quando o Streamlit não encontra o valor em cache
+        @functools.wraps(funcao)
+        def calcular(*args, **kwargs):
+            if habilitado():
+                with _lock:
+                    _cache[chave]["falhas"] += 1
+            return funcao(*args, **kwargs)
+
+        em_cache = decorador_streamlit(**opcoes)(calcular)
+
+        @functools.wraps(funcao)
+        def chamada(*args, **kwargs):
+            if not habilitado():
+                return em_cache(*args, **kwargs)
+            with _lock:
+                _cache[chave]["chamadas"] += 1
+            with _medir(f"cache:{chave}"):
+                return em_cache(*args, **kwargs)
+
+        chamada.clear = em_cache.clear
+        return chamada
+
+    return decorador
+
+
+def cache_data(nome: str = None, **opcoes):
+    """
+    Equivalente a st.cache_data(**opcoes) com contagem de acertos e falhas.
+
+    Args:
+        nome: Nome da função nas métricas; padrão: nome da função
+        **opcoes: Argumentos repassados para st.cache_data
+    """
+    import streamlit as st
+
+    return _instrumentar_cache(st.cache_data, nome, opcoes)
+
+
+def cache_resource(nome: str = None, **opcoes):
+    """
+    Equivalente a st.cache_resource(**opcoes) com contagem de acertos e falhas.
+
+    Args:
+        nome: Nome da função nas métricas; padrão: nome da função
+        **opcoes: Argumentos repassados para st.cache_resource
+    """
+    import streamlit as st
+
+    return _instrumentar_cache(st.cache_resource, nome, opcoes)
+
+
+def registrar_rerun():
+    """Conta um rerun da sessão atual e inicia a exportação na primeira chamada."""
+    global _reruns
+    if not habilitado():
+        return
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    contexto = get_script_run_ctx()
+    sessao = contexto.session_id if contexto is not None else "sem-sessao"
+    with _lock:
+        _reruns += 1
+        _reruns_por_sessao[sessao] = _reruns_por_sessao.get(sessao, 0) + 1
+        _reruns_por_sessao.move_to_end(sessao)
+        while len(_reruns_por_sessao) > MAX_SESSOES:
+            _reruns_por_sessao.popitem(last=False)
+    iniciar_exportacao()
+
+
+def registrar_coletor(nome: str, funcao):
+    """
+    Registra uma função que devolve métricas numéricas de um componente.
+
+    Args:
+        nome: Nome do componente (ex.: "pool_smtp")
+        funcao: Função sem argumentos que retorna um dicionário nome -> número
+    """
+    if habilitado():
+        with _lock:
+            _coletores[nome] = funcao
+
+
+# ============= CONSULTA =============
+
+def _quantil(ordenadas: list, q: float) -> float:
+    return ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))]
+
+
+def resumo() -> dict:
+    """
+    Resume as métricas coletadas.
+
+    Returns:
+        Dicionário com "trechos" (contagem, total e p50/p95/p99 em segundos),
+        "caches" (chamadas, acertos e falhas), "reruns", "sessoes" e
+        "coletores"
+    """
+    with _lock:
+        amostras = {nome: sorted(valores) for nome, valores in _duracoes.items()}
+        totais = {nome: tuple(total) for nome, total in _totais.items()}
+        caches = {nome: dict(valores) for nome, valores in _cache.items()}
+        reruns_por_sessao = list(_reruns_por_sessao.values())
+        reruns = _reruns
+        coletores = dict(_coletores)
+
+    trechos = {}
+    for nome, ordenadas in amostras.items():
+        contagem, total = totais[nome]
+        trechos[nome] = {"contagem": contagem, "total": total}
+        for q in QUANTIS:
+            trechos[nome][f"p{int(q * 100)}"] = _quantil(ordenadas, q)
+
+    for valores in caches.values():
+        valores["acertos"] = valores["chamadas"] - valores["falhas"]
+
+    valores_coletores = {}
+    for nome, funcao in coletores.items():
+        try:
+            valores_coletores[nome] = {
+                chave: valor for chave, valor in funcao().items() if isinstance(valor, (int, float))
+            }
+        except Exception as e:
+            logger.warning("Coletor de métricas %s falhou: %s", nome, e)
+
+    return {
+        "trechos": trechos,
+        "caches": caches,
+        "reruns": reruns,
+        "sessoes": {
+            "ativas": len(reruns_por_sessao),
+            "reruns_max": max(reruns_por_sessao, default=0),
+            "reruns_media": sum(reruns_por_sessao) / len(reruns_por_sessao) if reruns_por_sessao else 0,
+        },
+        "coletores": valores_coletores,
+    }
+
+
+def _rotulo(valor: str) -> str:
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def texto_prometheus() -> str:
+    """
+    Returns:
+        Métricas no formato de exposição em texto do Prometheus
+    """
+    dados = resumo()
+    linhas = [
+        "# HELP portfolio_duracao_segundos Duração dos trechos instrumentados",
+        "# TYPE portfolio_duracao_segundos summary",
+    ]
+    for nome, trecho in sorted(dados["trechos"].items()):
+        rotulo = _rotulo(nome)
+        for q in QUANTIS:
+            linhas.append(f'portfolio_duracao_segundos{{trecho="{rotulo}",quantile="{q}"}} '
+                          f'{trecho[f"p{int(q * 100)}"]:.6f}')
+        linhas.append(f'portfolio_duracao_segundos_sum{{trecho="{rotulo}"}} {trecho["total"]:.6f}')
+        linhas.append(f'portfolio_duracao_segundos_count{{trecho="{rotulo}"}} {trecho["contagem"]}')
+
+    linhas += [
+        "# HELP portfolio_cache_total Chamadas de funções em cache por resultado",
+        "# TYPE portfolio_cache_total counter",
+    ]
+    for nome, cache in sorted(dados["caches"].items()):
+        for resultado, chave in (("acerto", "acertos"), ("falha", "falhas")):
+            linhas.append(f'portfolio_cache_total{{funcao="{_rotulo(nome)}",resultado="{resultado}"}} {cache[chave]}')
+
+    linhas += [
+        "# HELP portfolio_reruns_total Reruns do script desde o início do processo",
+        "# TYPE portfolio_reruns_total counter",
+        f"portfolio_reruns_total {dados['reruns']}",
+        "# HELP portfolio_sessoes Sessões com reruns registrados",
+        "# TYPE portfolio_sessoes gauge",
+        f"portfolio_sessoes {dados['sessoes']['ativas']}",
+        "# HELP portfolio_componente Métricas reportadas pelos componentes do app",
+        "# TYPE portfolio_componente gauge",
+    ]
+    for nome, valores in sorted(dados["coletores"].items()):
+        for chave, valor in sorted(valores.items()):
+            linhas.append(f'portfolio_componente{{componente="{_rotulo(nome)}",metrica="{_rotulo(chave)}"}} {valor}')
+    return "\n".join(linhas) + "\n"
+
+
+# ============= EXPORTAÇÃO =============
+
+def exportar_arquivo(caminho: str = None):
+    """
+    Grava as métricas em um arquivo .prom de forma atômica.
+
+    Args:
+        caminho: Destino; padrão: PORTFOLIO_METRICAS_ARQUIVO ou .cache/metricas.prom
+    """
+    caminho = caminho or ambiente("PORTFOLIO_METRICAS_ARQUIVO", os.path.join(DIRETORIO_CACHE, "metricas.prom"))
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        arquivo.write(texto_prometheus())
+    os.replace(temporario, caminho)
+
+
+def _servir_http(porta: int):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class _Metricas(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            corpo = texto_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def log_message(self, *args):
+            pass
+
+    servidor = ThreadingHTTPServer(("127.0.0.1", porta), _Metricas)
+    threading.Thread(target=servidor.serve_forever, name="metricas-http", daemon=True).start()
+    logger.info("Métricas disponíveis em http://127.0.0.1:%s/metrics", porta)
+    return servidor
+
+
+def _exportar_periodicamente():
+    while True:
+        time.sleep(INTERVALO_EXPORTACAO)
+        try:
+            exportar_arquivo()
+        except OSError as e:
+            logger.warning("Não foi possível exportar as métricas: %s", e)
+
+
+def iniciar_exportacao():
+    """Inicia, uma vez por processo, a gravação periódica do arquivo e o endpoint HTTP."""
+    global _exportacao_iniciada
+    if not habilitado() or _exportacao_iniciada:
+        return
+    with _lock:
+        if _exportacao_iniciada:
+            return
+        _exportacao_iniciada = True
+
+    threading.Thread(target=_exportar_periodicamente, name="metricas-arquivo", daemon=True).start()
+    porta = ambiente("PORTFOLIO_METRICAS_PORTA")
+    if porta:
+        try:
+            _servir_http(int(porta))
+        except (OSError, ValueError) as e:
+            logger.warning("Endpoint de métricas indisponível na porta %s: %s", porta, e)
+
+
+def acesso_administrativo(parametros) -> bool:
+    """
+    Indica se a página de métricas foi solicitada pelos parâmetros da URL.
+
+    Args:
+        parametros: st.query_params
+
+    Returns:
+        True se a coleta estiver habilitada, houver token configurado e
+        ?metricas= corresponder a ele
+    """
+    if not habilitado() or "metricas" not in parametros:
+        return False
+    token = ambiente("PORTFOLIO_METRICAS_TOKEN")
+    if not token:
+        return False
+    # Comparação em tempo constante: o tempo de resposta não revela o prefixo correto
+    return hmac.compare_digest(parametros["metricas"].encode("utf-8"), token.encode("utf-8"))
@@ -0,0 +1,251 @@
+"""
+Geração de miniaturas (derivados) das imagens da galeria do portfólio.
+
+As miniaturas são gravadas em um cache em disco com nome derivado do hash do
+conteúdo da imagem original, de modo que só são regeneradas quando o arquivo
+de origem muda.
+"""
+
+import hashlib
+import importlib.util
+import logging
+import os
+import threading
+
+from configuracao import DIRETORIO_CACHE
+
+logger = logging.getLogger(__name__)
+
+DIRETORIO_MINIATURAS = os.path.join(DIRETORIO_CACHE, "miniaturas")
+
+# Larguras fixas geradas para cada imagem (em pixels)
+LARGURAS_MINIATURA = (480, 960)
+LARGURA_GALERIA = 960
+
+QUALIDADE = 80
+COR_FUNDO = (255, 255, 255)
+
+# Marcadores de baixa qualidade (LQIP) exibidos enquanto a imagem carrega
+LARGURA_MARCADOR = 24
+QUALIDADE_MARCADOR = 40
+CORES_DOMINANTES = 5
+
+# Hash de conteúdo memorizado por (mtime, tamanho) para não reler os arquivos
+_hashes = {}
+_hashes_lock = threading.Lock()
+
+
+def formato_padrao() -> str:
+    """
+    Retorna o formato de miniatura suportado pelo Pillow instalado.
+
+    Returns:
+        "webp" quando disponível, caso contrário "jpeg"
+    """
+    # Procura a extensão WebP do Pillow sem importá-la: PIL.features carrega
+    # PIL.Image, que só as páginas que exibem imagens precisam
+    try:
+        webp = importlib.util.find_spec("PIL._webp") is not None
+    except ImportError:
+        webp = False
+    return "webp" if webp else "jpeg"
+
+
+def registrar_hash(caminho: str, mtime_ns: int, tamanho: int, digest: str):
+    """
+    Registra um hash já conhecido (ex.: pelo índice de projetos) para evitar reler o arquivo.
+
+    Args:
+        caminho: Caminho do arquivo
+        mtime_ns: mtime do arquivo quando o hash foi calculado
+        tamanho: Tamanho do arquivo quando o hash foi calculado
+        digest: Hash no mesmo formato de hash_conteudo
+    """
+    with _hashes_lock:
+        _hashes[caminho] = ((mtime_ns, tamanho), digest)
+
+
+def hash_conteudo(caminho: str) -> str:
+    """
+    Calcula o hash SHA-256 (abreviado) do conteúdo de um arquivo.
+
+    Args:
+        caminho: Caminho do arquivo
+
+    Returns:
+        Os 20 primeiros caracteres hexadecimais do hash
+    """
+    info = os.stat(caminho)
+    assinatura = (info.st_mtime_ns, info.st_size)
+
+    with _hashes_lock:
+        memorizado = _hashes.get(caminho)
+    if memorizado and memorizado[0] == assinatura:
+        return memorizado[1]
+
+    sha = hashlib.sha256()
+    with open(caminho, "rb") as arquivo:
+        for bloco in iter(lambda: arquivo.read(1 << 20), b""):
+            sha.update(bloco)
+    digest = sha.hexdigest()[:20]
+
+    with _hashes_lock:
+        _hashes[caminho] = (assinatura, digest)
+    return digest
+
+
+def caminho_miniatura(digest: str, largura: int, formato: str) -> str:
+    """
+    Monta o caminho da miniatura no cache em disco.
+
+    Args:
+        digest: Hash do conteúdo da imagem original
+        largura: Largura da miniatura
+        formato: "webp" ou "jpeg"
+
+    Returns:
+        Caminho absoluto do arquivo derivado
+    """
+    extensao = "jpg" if formato == "jpeg" else formato
+    return os.path.join(DIRETORIO_MINIATURAS, f"{digest}_{largura}.{extensao}")
+
+
+def gerar_derivados(caminho: str, digest: str, larguras=LARGURAS_MINIATURA, formato: str = None) -> list:
+    """
+    Decodifica a imagem uma única vez e grava as miniaturas nas larguras pedidas.
+
+    Imagens com transparência são achatadas sobre fundo branco e nunca são
+    ampliadas além da largura original.
+
+    Args:
+        caminho: Caminho da imagem original
+        digest: Hash do conteúdo da imagem original
+        larguras: Larguras desejadas
+        formato: "webp" ou "jpeg" (padrão: o melhor disponível)
+
+    Returns:
+        Lista com os caminhos das miniaturas geradas
+    """
+    from PIL import Image
+
+    formato = formato or formato_padrao()
+    os.makedirs(DIRETORIO_MINIATURAS, exist_ok=True)
+
+    with Image.open(caminho) as original:
+        original.load()
+        imagem = _achatar(original)
+
+    gerados = []
+    for largura in sorted(larguras, reverse=True):
+        destino = caminho_miniatura(digest, largura, formato)
+        if not os.path.exists(destino):
+            if imagem.width > largura:
+                altura = round(imagem.height * largura / imagem.width)
+                derivada = imagem.resize((largura, altura), Image.LANCZOS)
+            else:
+                derivada = imagem
+
+            # Grava em arquivo temporário e renomeia para evitar leituras parciais
+            temporario = f"{destino}.{os.getpid()}.{threading.get_ident()}.tmp"
+            derivada.save(temporario, format=formato.upper(), quality=QUALIDADE, optimize=True)
+            os.replace(temporario, destino)
+        gerados.append(destino)
+
+    return gerados
+
+
+def _achatar(original):
+    """Converte para RGB, achatando a transparência sobre COR_FUNDO."""
+    from PIL import Image
+
+    if original.mode in ("RGBA", "LA", "P"):
+        rgba = original.convert("RGBA")
+        imagem = Image.new("RGB", rgba.size, COR_FUNDO)
+        imagem.paste(rgba, mask=rgba.getchannel("A"))
+        return imagem
+    return original.convert("RGB")
+
+
+def gerar_marcador(caminho: str) -> dict:
+    """
+    Calcula as dimensões, a cor dominante e um marcador borrado da imagem.
+
+    O marcador é uma miniatura de LARGURA_MARCADOR pixels, levemente
+    borrada, codificada em base64 (algumas centenas de bytes): exibido
+    ampliado, ocupa o espaço exato da imagem até ela chegar.
+
+    Args:
+        caminho: Caminho da imagem original
+
+    Returns:
+        Dicionário com 'largura', 'altura', 'cor' (#rrggbb) e 'lqip' (data URI)
+    """
+    import base64
+    import io
+
+    from PIL import Image, ImageFilter
+
+    with Image.open(caminho) as original:
+        largura, altura = original.size
+        # JPEG decodifica direto em escala reduzida
+        original.draft("RGB", (LARGURA_MARCADOR * 4, LARGURA_MARCADOR * 4))
+        reduzida = _achatar(original)
+    reduzida.thumbnail((64, 64), Image.BILINEAR)
+
+    paleta = reduzida.quantize(colors=CORES_DOMINANTES, method=Image.Quantize.MEDIANCUT)
+    _, indice = max(paleta.getcolors())
+    cor = "#{:02x}{:02x}{:02x}".format(*paleta.getpalette()[indice * 3:indice * 3 + 3])
+
+    marcador = reduzida.resize(
+        (LARGURA_MARCADOR, max(1, round(LARGURA_MARCADOR * altura / largura))), Image.LANCZOS,
+    ).filter(ImageFilter.GaussianBlur(0.8))
+    formato = formato_padrao()
+    saida = io.BytesIO()
+    marcador.save(saida, format=formato.upper(), quality=QUALIDADE_MARCADOR)
+    lqip = f"data:image/{formato};base64," + base64.b64encode(saida.getvalue()).decode("ascii")
+
+    return {"largura": largura, "altura": altura, "cor": cor, "lqip": lqip}
+
+
+def miniatura_existente(caminho: str, largura: int = LARGURA_GALERIA):
+    """
+    Retorna a miniatura apenas se ela já estiver no cache, sem gerá-la.
+
+    Args:
+        caminho: Caminho da imagem original
+        largura: Uma das larguras de LARGURAS_MINIATURA
+
+    Returns:
+        Caminho da miniatura ou None se ainda não existir
+    """
+    try:
+        destino = caminho_miniatura(hash_conteudo(caminho), largura, formato_padrao())
+    except OSError:
+        return None
+    return destino if os.path.exists(destino) else None
+
+
+def gerar_miniatura(caminho: str, largura: int = LARGURA_GALERIA) -> str:
+    """
+    Retorna a miniatura da imagem, gerando-a apenas se ainda não existir.
+
+    Args:
+        caminho: Caminho da imagem original
+        largura: Uma das larguras de LARGURAS_MINIATURA
+
+    Returns:
+        Caminho da miniatura ou o caminho original se a geração falhar
+    """
+    try:
+        formato = formato_padrao()
+        digest = hash_conteudo(caminho)
+        destino = caminho_miniatura(digest, largura, formato)
+        if os.path.exists(destino):
+            return destino
+
+        larguras = set(LARGURAS_MINIATURA) | {largura}
+        gerar_derivados(caminho, digest, larguras, formato)
+        return destino
+    except Exception as e:
+        logger.warning("Não foi possível gerar miniatura de %s: %s", caminho, e)
+        return caminho
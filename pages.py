@@ -3,8 +3,8 @@ Módulo contendo as páginas do portfólio
 """
 
 import streamlit as st
-from streamlit_lottie import st_lottie
-import time
+import metricas
+from cache_lottie import URL_LOTTIE_HOME, URL_LOTTIE_CONTATO
 from utils import (
     load_lottie_url, 
     validar_email, 
@@ -14,6 +14,7 @@ from utils import (
 )
 
 
+@metricas.instrumentar("pagina:home")
 def pagina_home():
     """Exibe a página inicial."""
     st.markdown('<h1 class="titulo-principal">Portfólio de Tiago Holanda</h1>', unsafe_allow_html=True)
@@ -28,7 +29,9 @@ def pagina_home():
     """, unsafe_allow_html=True)
     
     # Animação Lottie
-    lottie_animation = load_lottie_url("https://assets1.lottiefiles.com/packages/lf20_3vbOcw.json")
+    from streamlit_lottie import st_lottie
+
+    lottie_animation = load_lottie_url(URL_LOTTIE_HOME)
     if lottie_animation:
         st_lottie(lottie_animation, height=300)
     
@@ -45,6 +48,7 @@ def pagina_home():
         st.metric("🔧 Tecnologias", "20+", "Dominadas")
 
 
+@metricas.instrumentar("pagina:curriculo")
 def pagina_curriculo():
     """Exibe o currículo profissional e acadêmico."""
     st.markdown('<h1 class="titulo-principal">Currículo Profissional e Acadêmico</h1>', unsafe_allow_html=True)
@@ -53,7 +57,7 @@ def pagina_curriculo():
     col1, col2 = st.columns([1, 2], gap="large")
     
     with col1:
-        st.image("https://avatars.githubusercontent.com/u/111590174?v=4", use_column_width=True)
+        st.image("https://avatars.githubusercontent.com/u/111590174?v=4", width="stretch")
         st.markdown(render_social_links(), unsafe_allow_html=True)
     
     with col2:
@@ -111,6 +115,7 @@ def pagina_curriculo():
         st.write("• Delft 3D • XBeach")
 
 
+@metricas.instrumentar("pagina:portfolio")
 def pagina_portfolio():
     """Exibe o portfólio de projetos."""
     st.markdown('<h1 class="titulo-principal">Portfólio de Projetos</h1>', unsafe_allow_html=True)
@@ -146,6 +151,7 @@ def pagina_portfolio():
                 col.write(f"```\n{tech}\n```")
 
 
+@metricas.instrumentar("pagina:contato")
 def pagina_contato():
     """Exibe página de contato com formulário."""
     st.markdown('<h1 class="titulo-principal">Contato</h1>', unsafe_allow_html=True)
@@ -171,7 +177,9 @@ def pagina_contato():
     st.markdown(render_social_links(), unsafe_allow_html=True)
     
     # Animação Lottie
-    lottie_contact = load_lottie_url("https://assets2.lottiefiles.com/packages/lf20_SdQJtK.json")
+    from streamlit_lottie import st_lottie
+
+    lottie_contact = load_lottie_url(URL_LOTTIE_CONTATO)
     if lottie_contact:
         st_lottie(lottie_contact, height=300)
     
@@ -187,7 +195,7 @@ def pagina_contato():
         
         col1, col2 = st.columns([3, 1])
         with col2:
-            submit_button = st.form_submit_button(label="📤 Enviar", use_container_width=True)
+            submit_button = st.form_submit_button(label="📤 Enviar", width="stretch")
         
         st.markdown('</div>', unsafe_allow_html=True)
 
@@ -197,8 +205,6 @@ def pagina_contato():
             elif not validar_email(email_remetente):
                 st.error("❌ Por favor, insira um endereço de e-mail válido.")
             else:
-                with st.spinner('📤 Enviando mensagem...'):
-                    time.sleep(1)  # Simular processamento
-                    sucesso = enviar_email(nome, email_remetente, mensagem)
-                    if sucesso:
-                        st.success("✅ Mensagem enviada com sucesso! Obrigado pelo contato.")
+                sucesso = enviar_email(nome, email_remetente, mensagem)
+                if sucesso:
+                    st.success("✅ Mensagem enviada com sucesso! Obrigado pelo contato.")
@@ -0,0 +1,214 @@
+"""
+Pool de conexões SMTP autenticadas e de longa duração.
+
+Evita um handshake TCP + TLS + login por mensagem: conexões ociosas são
+reutilizadas, verificadas com NOOP antes do uso e recriadas de forma
+transparente quando o servidor as derruba. Contadores de handshakes e a
+latência de cada envio ficam disponíveis em estatisticas().
+"""
+
+import collections
+import contextlib
+import logging
+import threading
+import time
+
+import metricas
+from caixa_saida import conectar_smtp
+
+logger = logging.getLogger(__name__)
+
+TAMANHO_POOL = 2
+# Conexões ociosas por mais tempo que isso são verificadas com NOOP antes do uso
+INTERVALO_NOOP = 30
+# Conexões mais antigas que isso são descartadas (o Gmail encerra sessões longas)
+VIDA_MAXIMA = 10 * 60
+AMOSTRAS_LATENCIA = 1000
+
+
+class PoolSMTP:
+    """
+    Pool de conexões SMTP para uma configuração de servidor.
+
+    Args:
+        conectar: Função (config) que abre e autentica uma conexão
+        tamanho: Máximo de conexões abertas simultaneamente
+    """
+
+    def __init__(self, conectar=conectar_smtp, tamanho: int = TAMANHO_POOL):
+        self.conectar = conectar
+        self.tamanho = tamanho
+        self._livres = collections.deque()
+        self._config = None
+        self._lock = threading.Lock()
+        self._vagas = threading.BoundedSemaphore(tamanho)
+        self._latencias = collections.deque(maxlen=AMOSTRAS_LATENCIA)
+        self.handshakes = 0
+        self.reconexoes = 0
+        self.envios = 0
+        self.falhas = 0
+
+    @staticmethod
+    def _chave(config: dict):
+        return (config["servidor"], config["porta"], config["tls"], config["usuario"])
+
+    def _fechar(self, conexao):
+        try:
+            conexao.quit()
+        except Exception:
+            try:
+                conexao.close()
+            except Exception:
+                pass
+
+    def _nova_conexao(self, config: dict):
+        conexao = self.conectar(config)
+        with self._lock:
+            self.handshakes += 1
+        agora = time.monotonic()
+        return [conexao, agora, agora]
+
+    def _obter(self, config: dict):
+        with self._lock:
+            if self._config is not None and self._chave(config) != self._config:
+                antigas, self._livres = list(self._livres), collections.deque()
+            else:
+                antigas = []
+            self._config = self._chave(config)
+        for entrada in antigas:
+            self._fechar(entrada[0])
+
+        agora = time.monotonic()
+        while True:
+            with self._lock:
+                entrada = self._livres.pop() if self._livres else None
+            if entrada is None:
+                return self._nova_conexao(config)
+
+            conexao, criada_em, ultimo_uso = entrada
+            if agora - criada_em > VIDA_MAXIMA:
+                self._fechar(conexao)
+                continue
+            if agora - ultimo_uso > INTERVALO_NOOP:
+                try:
+                    codigo, _ = conexao.noop()
+                except Exception:
+                    codigo = None
+                if codigo != 250:
+                    with self._lock:
+                        self.reconexoes += 1
+                    self._fechar(conexao)
+                    continue
+            return entrada
+
+    @contextlib.contextmanager
+    def conexao(self, config: dict):
+        """
+        Empresta uma conexão pronta para envio e a devolve ao pool ao final.
+
+        Se ocorrer um erro durante o uso, a conexão é descartada.
+
+        Args:
+            config: Configuração retornada por caixa_saida.configuracao_smtp()
+        """
+        self._vagas.acquire()
+        entrada = None
+        try:
+            entrada = self._obter(config)
+            yield entrada[0]
+        except Exception:
+            if entrada is not None:
+                self._fechar(entrada[0])
+                entrada = None
+            raise
+        finally:
+            if entrada is not None:
+                entrada[2] = time.monotonic()
+                with self._lock:
+                    self._livres.append(entrada)
+            self._vagas.release()
+
+    def enviar(self, mensagens: list, config: dict):
+        """
+        Envia as mensagens reutilizando uma conexão do pool.
+
+        Uma conexão derrubada pelo servidor antes do primeiro envio é
+        substituída uma vez de forma transparente.
+
+        Args:
+            mensagens: Lista de EmailMessage
+            config: Configuração retornada por caixa_saida.configuracao_smtp()
+        """
+        import smtplib
+
+        pendentes = list(mensagens)
+        for tentativa in range(2):
+            try:
+                with self.conexao(config) as conexao:
+                    while pendentes:
+                        inicio = time.perf_counter()
+                        conexao.send_message(pendentes[0])
+                        with self._lock:
+                            self._latencias.append(time.perf_counter() - inicio)
+                            self.envios += 1
+                        pendentes.pop(0)
+                return
+            except smtplib.SMTPServerDisconnected:
+                with self._lock:
+                    self.reconexoes += 1
+                if tentativa:
+                    with self._lock:
+                        self.falhas += 1
+                    raise
+            except Exception:
+                with self._lock:
+                    self.falhas += 1
+                raise
+
+    def estatisticas(self) -> dict:
+        """
+        Resume o uso do pool.
+
+        Returns:
+            Dicionário com handshakes, reconexoes, envios, falhas, conexões
+            ociosas e latência de envio (média e p95, em milissegundos)
+        """
+        with self._lock:
+            latencias = sorted(self._latencias)
+            estatisticas = {
+                "handshakes": self.handshakes,
+                "reconexoes": self.reconexoes,
+                "envios": self.envios,
+                "falhas": self.falhas,
+                "ociosas": len(self._livres),
+            }
+        if latencias:
+            estatisticas["latencia_media_ms"] = 1000 * sum(latencias) / len(latencias)
+            estatisticas["latencia_p95_ms"] = 1000 * latencias[min(len(latencias) - 1, int(0.95 * len(latencias)))]
+        return estatisticas
+
+    def fechar(self):
+        """Encerra todas as conexões ociosas."""
+        with self._lock:
+            livres, self._livres = list(self._livres), collections.deque()
+        for entrada in livres:
+            self._fechar(entrada[0])
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def obter_pool() -> PoolSMTP:
+    """Retorna o pool SMTP do processo, criando-o na primeira chamada."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = PoolSMTP()
+            metricas.registrar_coletor("pool_smtp", _pool.estatisticas)
+        return _pool
+
+
+def enviar_com_pool(mensagens: list, config: dict):
+    """Função de entrega para caixa_saida.TrabalhadorEntrega usando o pool do processo."""
+    obter_pool().enviar(mensagens, config)
@@ -0,0 +1,283 @@
+"""
+Pré-processamento paralelo das miniaturas da galeria.
+
+Distribui a decodificação, o achatamento RGBA, o redimensionamento e a
+codificação das imagens em um ProcessPoolExecutor dimensionado para os
+núcleos disponíveis, criado em um processo dedicado
+(trabalhador_miniaturas). Pode ser executado em segundo plano pelo app ou
+pela linha de comando:
+
+    python preprocessamento.py [--workers N]
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import miniaturas
+from configuracao import BASE_DIR, IMAGENS_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def nucleos_disponiveis() -> int:
+    """
+    Retorna a quantidade de núcleos que o processo pode usar.
+
+    Returns:
+        Número de núcleos (respeitando a afinidade de CPU quando disponível)
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def _gerar_em_processo_dedicado(pendentes: list, workers: int, larguras: tuple, formato: str):
+    """
+    Gera os derivados em `python -m trabalhador_miniaturas`.
+
+    Produz (caminho, segundos, erro) à medida que cada imagem termina.
+
+    Raises:
+        RuntimeError: Se o processo dedicado terminar com erro
+    """
+    tarefa = {
+        "workers": workers,
+        "larguras": list(larguras),
+        "formato": formato,
+        "imagens": [list(pendente) for pendente in pendentes],
+    }
+    with subprocess.Popen(
+        [sys.executable, "-m", "trabalhador_miniaturas"],
+        cwd=BASE_DIR,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+    ) as processo:
+        processo.stdin.write(json.dumps(tarefa))
+        processo.stdin.close()
+        for linha in processo.stdout:
+            resultado = json.loads(linha)
+            yield resultado["caminho"], resultado["segundos"], resultado["erro"]
+    if processo.returncode:
+        raise RuntimeError(f"trabalhador_miniaturas terminou com código {processo.returncode}")
+
+
+def _processar_imagem(caminho: str, digest: str, larguras: tuple, formato: str):
+    """Executado nos processos filhos: gera os derivados e mede o tempo gasto."""
+    inicio = time.perf_counter()
+    try:
+        miniaturas.gerar_derivados(caminho, digest, larguras, formato)
+        erro = None
+    except Exception as e:
+        erro = str(e)
+    return caminho, time.perf_counter() - inicio, erro
+
+
+class AquecimentoMiniaturas:
+    """
+    Gera as miniaturas pendentes de uma lista de imagens em processos paralelos.
+
+    Args:
+        caminhos: Caminhos das imagens originais
+        max_workers: Quantidade de processos (padrão: núcleos disponíveis)
+        larguras: Larguras a gerar para cada imagem
+    """
+
+    def __init__(self, caminhos, max_workers: int = None, larguras=miniaturas.LARGURAS_MINIATURA):
+        self.caminhos = list(caminhos)
+        self.max_workers = max_workers or nucleos_disponiveis()
+        self.larguras = tuple(larguras)
+        self.total = len(self.caminhos)
+        self.concluidos = 0
+        self.tempos = {}
+        self.erros = {}
+        self.duracao = None
+        self.em_andamento = False
+        self._lock = threading.Lock()
+        self._concluido = threading.Event()
+
+    @property
+    def progresso(self) -> float:
+        """Fração concluída, entre 0 e 1."""
+        return self.concluidos / self.total if self.total else 1.0
+
+    def _pendentes(self, formato: str) -> list:
+        pendentes = []
+        for caminho in self.caminhos:
+            try:
+                digest = miniaturas.hash_conteudo(caminho)
+            except OSError as e:
+                self.erros[caminho] = str(e)
+                continue
+            faltando = [
+                largura for largura in self.larguras
+                if not os.path.exists(miniaturas.caminho_miniatura(digest, largura, formato))
+            ]
+            if faltando:
+                pendentes.append((caminho, digest))
+        return pendentes
+
+    def executar(self, ao_progredir=None) -> dict:
+        """
+        Processa as imagens pendentes e bloqueia até terminar.
+
+        Args:
+            ao_progredir: Função opcional chamada com (caminho, segundos, concluidos, total)
+
+        Returns:
+            Relatório com os tempos por arquivo (ver relatorio())
+        """
+        self.em_andamento = True
+        inicio = time.perf_counter()
+        try:
+            formato = miniaturas.formato_padrao()
+            pendentes = self._pendentes(formato)
+            with self._lock:
+                self.concluidos = self.total - len(pendentes)
+
+            if pendentes:
+                # O pool roda em um processo à parte, cujo __main__ é importável
+                # pelos filhos "spawn" (ver trabalhador_miniaturas)
+                workers = min(self.max_workers, len(pendentes))
+                for caminho, segundos, erro in _gerar_em_processo_dedicado(pendentes, workers, self.larguras, formato):
+                    with self._lock:
+                        self.concluidos += 1
+                        self.tempos[caminho] = segundos
+                        if erro:
+                            self.erros[caminho] = erro
+                    if erro:
+                        logger.warning("Falha ao gerar miniaturas de %s: %s", caminho, erro)
+                    else:
+                        logger.info("Miniaturas de %s geradas em %.2fs", caminho, segundos)
+                    if ao_progredir:
+                        ao_progredir(caminho, segundos, self.concluidos, self.total)
+        finally:
+            self.duracao = time.perf_counter() - inicio
+            self.em_andamento = False
+            self._concluido.set()
+
+        logger.info(
+            "Pré-processamento concluído: %d imagem(ns) em %.2fs com %d processo(s)",
+            len(self.tempos), self.duracao, self.max_workers,
+        )
+        return self.relatorio()
+
+    def iniciar(self):
+        """
+        Executa o pré-processamento em uma thread de segundo plano.
+
+        Returns:
+            A própria instância, para consulta de progresso
+        """
+        self.em_andamento = True
+        threading.Thread(target=self._executar_em_segundo_plano, name="aquecimento-miniaturas", daemon=True).start()
+        return self
+
+    def _executar_em_segundo_plano(self):
+        # Uma exceção aqui morreria com a thread sem deixar rastro no log
+        try:
+            self.executar()
+        except Exception:
+            logger.exception("Pré-processamento das miniaturas falhou")
+
+    def aguardar(self, timeout: float = None) -> bool:
+        """
+        Bloqueia até o fim do pré-processamento iniciado por iniciar() ou executar().
+
+        Args:
+            timeout: Tempo máximo de espera em segundos (None espera indefinidamente)
+
+        Returns:
+            True se terminou dentro do prazo
+        """
+        return self._concluido.wait(timeout)
+
+    def relatorio(self) -> dict:
+        """
+        Resume a execução.
+
+        Returns:
+            Dicionário com total, concluidos, workers, duracao, soma dos tempos,
+            tempos por arquivo e erros
+        """
+        with self._lock:
+            return {
+                "total": self.total,
+                "concluidos": self.concluidos,
+                "workers": self.max_workers,
+                "duracao": self.duracao,
+                "tempo_cpu_somado": sum(self.tempos.values()),
+                "tempos": dict(self.tempos),
+                "erros": dict(self.erros),
+            }
+
+
+_galerias = {}
+_galerias_lock = threading.Lock()
+
+
+def iniciar_galeria(caminho_base: str = IMAGENS_DIR) -> AquecimentoMiniaturas:
+    """
+    Inicia, uma vez por processo, a geração em segundo plano das miniaturas da galeria.
+
+    Args:
+        caminho_base: Pasta com uma subpasta por projeto
+
+    Returns:
+        O AquecimentoMiniaturas da pasta, para consulta de progresso
+    """
+    from indice_projetos import obter_indice
+
+    with _galerias_lock:
+        aquecimento = _galerias.get(caminho_base)
+        if aquecimento is None:
+            imagens = [imagem for projeto in obter_indice(caminho_base).projetos() for imagem in projeto["imagens"]]
+            aquecimento = _galerias[caminho_base] = AquecimentoMiniaturas(imagens).iniciar()
+        return aquecimento
+
+
+def listar_imagens(caminho_base: str = IMAGENS_DIR) -> list:
+    """
+    Lista as imagens de todos os projetos da pasta base.
+
+    Args:
+        caminho_base: Pasta com uma subpasta por projeto
+
+    Returns:
+        Lista de caminhos das imagens
+    """
+    from indice_projetos import IndiceProjetos
+
+    indice = IndiceProjetos(caminho_base)
+    indice.atualizar()
+    return [imagem for projeto in indice.projetos() for imagem in projeto["imagens"]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera as miniaturas da galeria em paralelo.")
+    parser.add_argument("--workers", type=int, default=None, help="Quantidade de processos (padrão: núcleos disponíveis)")
+    parser.add_argument("--base", default=IMAGENS_DIR, help="Pasta com as imagens dos projetos")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    def _imprimir(caminho, segundos, concluidos, total):
+        print(f"[{concluidos}/{total}] {segundos:6.2f}s  {os.path.relpath(caminho, args.base)}")
+
+    aquecimento = AquecimentoMiniaturas(listar_imagens(args.base), max_workers=args.workers)
+    relatorio = aquecimento.executar(ao_progredir=_imprimir)
+    print(
+        f"\n{len(relatorio['tempos'])} imagem(ns) processada(s) em {relatorio['duracao']:.2f}s "
+        f"com {relatorio['workers']} processo(s); tempo somado por arquivo: {relatorio['tempo_cpu_somado']:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""
+Pipeline de logging assíncrono do portfólio.
+
+O thread do script apenas coloca os registros em uma fila (QueueHandler);
+um QueueListener em segundo plano grava no arquivo com rotação e no
+console. Avisos repetidos são amostrados antes de entrar na fila: dentro da
+janela configurada só o primeiro de cada mensagem é registrado e o próximo
+informa quantos foram suprimidos.
+
+Variáveis de ambiente:
+    PORTFOLIO_LOG_ARQUIVO=portfolio.log   arquivo de log
+    PORTFOLIO_LOG_ROTACAO=tamanho         "tamanho" ou "diaria"
+    PORTFOLIO_LOG_MAX_BYTES=5242880       tamanho máximo por arquivo (rotação por tamanho)
+    PORTFOLIO_LOG_BACKUPS=5               quantidade de arquivos antigos mantidos
+    PORTFOLIO_LOG_FORMATO=texto           "texto" ou "json" (uma linha JSON por registro)
+    PORTFOLIO_LOG_AMOSTRAGEM=60           janela de amostragem de avisos repetidos, em segundos (0 desativa)
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import threading
+import time
+
+from configuracao import ambiente, ambiente_inteiro, ambiente_real
+
+FORMATO_TEXTO = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener = None
+_lock = threading.Lock()
+
+
+class FormatadorJSON(logging.Formatter):
+    """Formata cada registro como uma linha JSON."""
+
+    def format(self, record):
+        dados = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "mensagem": record.getMessage(),
+        }
+        suprimidos = getattr(record, "suprimidos", 0)
+        if suprimidos:
+            dados["suprimidos"] = suprimidos
+        if record.exc_info:
+            dados["excecao"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            dados["excecao"] = record.exc_text
+        return json.dumps(dados, ensure_ascii=False)
+
+
+class FiltroAmostragem(logging.Filter):
+    """
+    Deixa passar um aviso por mensagem a cada janela de tempo.
+
+    A chave é o modelo da mensagem (antes da interpolação dos argumentos),
+    então "E-mail inválido: %s" conta como uma única mensagem para
+    qualquer endereço. Só o nível amostrado é filtrado: registros
+    informativos (entregas, miniaturas geradas) e erros sempre passam.
+
+    Args:
+        janela: Duração da janela, em segundos
+        nivel: Nível sujeito à amostragem
+    """
+
+    def __init__(self, janela: float, nivel: int = logging.WARNING):
+        super().__init__()
+        self.janela = janela
+        self.nivel = nivel
+        self._ultimos = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno != self.nivel:
+            return True
+        chave = (record.name, record.levelno, str(record.msg))
+        agora = time.monotonic()
+        with self._lock:
+            inicio, suprimidos = self._ultimos.get(chave, (None, 0))
+            if inicio is not None and agora - inicio < self.janela:
+                self._ultimos[chave] = (inicio, suprimidos + 1)
+                return False
+            self._ultimos[chave] = (agora, 0)
+        if suprimidos:
+            record.suprimidos = suprimidos
+            record.msg = f"{record.msg} ({suprimidos} ocorrência(s) semelhante(s) suprimida(s))"
+        return True
+
+
+def _manipulador_arquivo():
+    arquivo = ambiente("PORTFOLIO_LOG_ARQUIVO", "portfolio.log")
+    backups = ambiente_inteiro("PORTFOLIO_LOG_BACKUPS", 5)
+    if ambiente("PORTFOLIO_LOG_ROTACAO", "tamanho") == "diaria":
+        return logging.handlers.TimedRotatingFileHandler(
+            arquivo, when="midnight", backupCount=backups, encoding="utf-8", delay=True
+        )
+    return logging.handlers.RotatingFileHandler(
+        arquivo,
+        maxBytes=ambiente_inteiro("PORTFOLIO_LOG_MAX_BYTES", 5 * 1024 * 1024),
+        backupCount=backups,
+        encoding="utf-8",
+        delay=True,
+    )
+
+
+def configurar_logging(nivel: int = logging.INFO):
+    """
+    Instala o pipeline assíncrono no logger raiz, uma única vez por processo.
+
+    Args:
+        nivel: Nível mínimo do logger raiz
+
+    Returns:
+        O QueueListener em execução
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        formatador = FormatadorJSON() if ambiente("PORTFOLIO_LOG_FORMATO", "texto") == "json" \
+            else logging.Formatter(FORMATO_TEXTO)
+        arquivo = _manipulador_arquivo()
+        console = logging.StreamHandler()
+        for manipulador in (arquivo, console):
+            manipulador.setFormatter(formatador)
+
+        fila = queue.SimpleQueue()
+        entrada = logging.handlers.QueueHandler(fila)
+        janela = ambiente_real("PORTFOLIO_LOG_AMOSTRAGEM", 60.0)
+        if janela > 0:
+            entrada.addFilter(FiltroAmostragem(janela))
+
+        raiz = logging.getLogger()
+        raiz.setLevel(nivel)
+        raiz.addHandler(entrada)
+
+        listener = logging.handlers.QueueListener(fila, arquivo, console, respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        _listener = listener
+        return listener
+
+
+def encerrar_logging():
+    """Esvazia a fila, para o listener e remove o pipeline do logger raiz."""
+    global _listener
+    with _lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        atexit.unregister(_listener.stop)
+        raiz = logging.getLogger()
+        for manipulador in list(raiz.handlers):
+            if isinstance(manipulador, logging.handlers.QueueHandler) and manipulador.queue is _listener.queue:
+                raiz.removeHandler(manipulador)
+        for manipulador in _listener.handlers:
+            manipulador.close()
+        _listener = None
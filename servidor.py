@@ -0,0 +1,52 @@
+"""
+Inicia o app somente depois de aquecer os caches do processo.
+
+O aquecimento (aquecimento.aquecer) roda no mesmo processo do servidor
+Streamlit, antes de a porta ser aberta: o primeiro visitante encontra o
+índice de projetos, as miniaturas, as animações e os dados do PIB prontos.
+Os argumentos são repassados ao `streamlit run`:
+
+    python servidor.py [--server.port 8501 ...]
+
+Com Streamlit que oferece st.App, o app é servido por este módulo com o
+middleware ativos_estaticos.CacheImutavel, que marca as imagens de
+static/galeria/ como imutáveis; em versões anteriores, roda o
+streamlit_app.py diretamente (as imagens ficam só com ETag/Last-Modified).
+"""
+
+import logging
+import os
+import sys
+
+import aquecimento
+from ativos_estaticos import CacheImutavel
+from configuracao import BASE_DIR
+
+try:
+    from starlette.middleware import Middleware
+    from streamlit.starlette import App
+except ImportError:
+    App = None
+
+CAMINHO_APP = os.path.join(BASE_DIR, "streamlit_app.py")
+
+if App is not None:
+    # Descoberto pelo `streamlit run servidor.py` (ver main)
+    app = App(CAMINHO_APP, middleware=[Middleware(CacheImutavel)])
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    relatorio = aquecimento.aquecer().relatorio()
+    if relatorio["erros"]:
+        logging.getLogger(__name__).warning("Aquecimento com falhas: %s", relatorio["erros"])
+
+    from streamlit.web import cli
+
+    script = os.path.abspath(__file__) if App is not None else CAMINHO_APP
+    sys.argv = ["streamlit", "run", script, *sys.argv[1:]]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    main()
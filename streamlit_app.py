@@ -1,303 +1,181 @@
 import streamlit as st
-from PIL import Image
-from streamlit_lottie import st_lottie
-import requests
-import smtplib
-import time
-import logging
-from email.message import EmailMessage
-import os
-from email_validator import validate_email, EmailNotValidError
-from dotenv import load_dotenv
-
-# Carregar variáveis de ambiente do arquivo .env
-load_dotenv()
-
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-IMAGENS_DIR = os.path.join(BASE_DIR, "Imagem")
-EXTENSOES_IMAGEM = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp")
-
-TITULOS_CUSTOMIZADOS = {
-    "agisoft": "Aerofotogrametria de Alta Precisão",
-    "artigos": "Publicações e Pesquisas Costeiras",
-    "gerenciamento de banco de dados espacial": "Sistema de Gestão de Atividades e Quadras",
-    "inconsistencias em banco de dados espacial": "Relatório de Inconsistências no Banco Espacial",
-    "topografia": "Gestão Topográfica e Plantio",
-    "webgis_2": "WebGIS de Auditoria de Aerolevantamentos",
-    "webgis_3": "WebGIS de Vigilância Epidemiológica",
-    "webgis_4": "WebGIS Municipal (600+ Prefeituras)",
-    "webgis_devgis": "Geoportal Corporativo DEVGIS",
-}
+import math
+from html import escape
+import aquecimento
+import ativos_estaticos
+import metricas
+from busca_conteudo import obter_busca
+from cache_imagens import ler_imagem
+from configuracao import IMAGENS_DIR, ambiente_inteiro
+from conteudo import FOTO_PERFIL, SECOES_CURRICULO
+from fragmentos_html import links_com_icone, obter as obter_fragmento
+from miniaturas import gerar_miniatura, miniatura_existente, LARGURAS_MINIATURA, LARGURA_GALERIA
+from indice_projetos import obter_indice as obter_indice_projetos
+from registro_log import configurar_logging
+
+# Dependências pesadas (streamlit_lottie, email_validator, smtplib, PIL,
+# numpy) são importadas apenas na primeira vez em que a página que as usa é
+# exibida; o .env (python-dotenv) só na primeira leitura de configuração.
+# benchmarks/importtime.txt mostra em que fase cada uma é carregada.
 
 # Configuração da página
 st.set_page_config(page_title="Portfólio de Tiago Holanda", page_icon="🌎", layout="wide")
 
-# Função para carregar animações Lottie com cache para melhorar o desempenho
-@st.cache_data(show_spinner=False)
+# Contagem de reruns por sessão (no-op com PORTFOLIO_METRICAS desligado)
+metricas.registrar_rerun()
+
+# Logs enfileirados e gravados em segundo plano, com rotação; o script nunca
+# espera pelo disco
+configurar_logging()
+
+# Caches do processo aquecidos uma única vez; quando o servidor foi iniciado
+# por servidor.py isso já aconteceu antes do primeiro visitante e a chamada
+# não faz nada. Aqui as dependências das páginas continuam sob demanda.
+if aquecimento.habilitado():
+    aquecimento.aquecer(IMAGENS_DIR, em_segundo_plano=True, importar_dependencias=False)
+
+# Animações Lottie servidas do armazenamento local, sem bloquear na rede
+@metricas.instrumentar("load_lottie_url")
 def load_lottie_url(url):
-    try:
-        r = requests.get(url)
-        if r.status_code != 200:
-            return None
-        return r.json()
-    except Exception:
-        return None
-
-# Funções auxiliares para carregar projetos locais
-def _gerar_descricao_projeto(caminho_projeto: str, titulo: str, total_imagens: int) -> str:
-    candidatos = ["descricao.txt", "descricao.md", "README.md", "readme.md"]
-    for nome_arquivo in candidatos:
-        caminho_arquivo = os.path.join(caminho_projeto, nome_arquivo)
-        if os.path.isfile(caminho_arquivo):
-            try:
-                with open(caminho_arquivo, "r", encoding="utf-8") as arquivo:
-                    conteudo = arquivo.read().strip()
-                    if conteudo:
-                        return conteudo
-            except OSError as erro:
-                logging.warning("Não foi possível ler %s: %s", caminho_arquivo, erro)
-
-    return f"Projeto {titulo} com {total_imagens} imagem(ns) demonstrando atividades realizadas nesta frente de trabalho."
-
-
-@st.cache_data(show_spinner=False)
+    from cache_lottie import carregar_lottie
+
+    return carregar_lottie(url)
+
+# Largura da imagem de capa exibida nos cards fechados
+LARGURA_CAPA = min(LARGURAS_MINIATURA)
+
+# Índice de projetos locais, compartilhado por todas as sessões e mantido
+# atualizado por um observador do sistema de arquivos
+@metricas.instrumentar("carregar_projetos_locais")
 def carregar_projetos_locais(caminho_base):
-    projetos = []
-    if not os.path.isdir(caminho_base):
-        return projetos
-
-    for pasta in sorted(os.listdir(caminho_base)):
-        caminho_projeto = os.path.join(caminho_base, pasta)
-        if not os.path.isdir(caminho_projeto):
-            continue
-
-        imagens = [
-            os.path.join(caminho_projeto, arquivo)
-            for arquivo in sorted(os.listdir(caminho_projeto))
-            if arquivo.lower().endswith(EXTENSOES_IMAGEM)
-        ]
-
-        if not imagens:
-            continue
-
-        slug = pasta.lower()
-        titulo = TITULOS_CUSTOMIZADOS.get(slug, pasta.replace("_", " ").title())
-
-        descricao = _gerar_descricao_projeto(caminho_projeto, titulo, len(imagens))
-
-        projetos.append(
-            {
-                "titulo": titulo,
-                "descricao": descricao,
-                "imagens": imagens,
-            }
-        )
+    return obter_indice_projetos(caminho_base).projetos()
 
-    return projetos
-
-# Carregar animações Lottie
-lottie_animation_home = load_lottie_url("https://assets1.lottiefiles.com/packages/lf20_3vbOcw.json")
-lottie_animation_contato = load_lottie_url("https://assets2.lottiefiles.com/packages/lf20_SdQJtK.json")
-
-# Adicionar estilos CSS personalizados para responsividade
-st.markdown("""
-    <style>
-    @import url('https://fonts.googleapis.com/css2?family=Montserrat:wght@400;600;700&display=swap');
-
-    :root {
-        --bg-color: #f5f6fa;
-        --card-bg: #ffffff;
-        --accent: #1d4ed8;
-        --accent-light: #3b82f6;
-        --text-light: #0f172a;
-        --muted: #475569;
-    }
-
-    html, body, [class*="css"]  {
-        font-family: 'Montserrat', sans-serif;
-        background: var(--bg-color);
-        color: var(--text-light);
-    }
-
-    .titulo-principal {
-        font-size: 2.8em;
-        text-align: center;
-        font-weight: 700;
-        color: var(--text-light);
-    }
-    
-    .subtitulo {
-        font-size: 2em;
-        color: var(--accent);
-        margin-top: 24px;
-        margin-bottom: 12px;
-        font-weight: 600;
-    }
-    
-    .texto {
-        font-size: 1.05em;
-        color: var(--text-light);
-        text-align: justify;
-        line-height: 1.6;
-    }
-
-    ul.texto li {
-        margin-bottom: 10px;
-    }
-
-    a, a:hover, a:visited {
-        color: var(--accent-light);
-        text-decoration: none;
-    }
-
-    .formulario {
-        background-color: var(--card-bg);
-        padding: 24px;
-        border-radius: 14px;
-        box-shadow: 0 8px 25px rgba(15, 23, 42, 0.08);
-    }
-
-    .icone-rede {
-        text-align: center;
-        margin-top: 24px;
-    }
-    .icone-rede a {
-        margin: 0 10px;
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        background: rgba(59,130,246,0.12);
-
-        padding: 10px;
-        border-radius: 12px;
-        transition: transform 0.2s ease;
-    }
-    .icone-rede a:hover {
-        transform: translateY(-3px);
-    }
-    .icone-rede img {
-        width: 40px;
-        vertical-align: middle;
-    }
-
-    .hero {
-        background: linear-gradient(135deg, rgba(59,130,246,0.15), rgba(14,165,233,0.08));
-        padding: 40px;
-        border-radius: 24px;
-        box-shadow: 0 20px 50px rgba(15,23,42,0.12);
-        margin-bottom: 30px;
-    }
-
-    .btn-primary {
-        display: inline-block;
-        padding: 12px 28px;
-        border-radius: 999px;
-        background: var(--accent);
-        color: #fff !important;
-        font-weight: 600;
-        border: none;
-        transition: background 0.2s ease, transform 0.2s ease;
-    }
-    .btn-primary:hover {
-        background: #1d4ed8;
-        transform: translateY(-2px);
-    }
-
-    .btn-ghost {
-        display: inline-block;
-        padding: 12px 28px;
-        border-radius: 999px;
-        border: 1px solid rgba(148,163,184,0.6);
-        color: var(--text-light)!
- !important;
-        font-weight: 600;
-        transition: border 0.2s ease, transform 0.2s ease;
-    }
-    .btn-ghost:hover {
-        border-color: var(--accent);
-        transform: translateY(-2px);
-    }
-
-    .section-divider {
-        width: 120px;
-        height: 4px;
-        background: linear-gradient(90deg, var(--accent), transparent);
-        border-radius: 999px;
-        margin: 16px 0 24px;
-    }
-
-    .portfolio-badge {
-        display: inline-flex;
-        background: rgba(99,102,241,0.1);
-        color: var(--accent);
-        border-radius: 999px;
-        padding: 6px 14px;
-        font-size: 0.85em;
-        margin-bottom: 12px;
-    }
-
-    </style>
-    """, unsafe_allow_html=True)
 
-# Função para validar e-mail usando email-validator
+# Pré-processamento das miniaturas em processos paralelos, iniciado uma vez
+# por processo; a galeria exibe marcadores até cada derivado ficar pronto
+def _iniciar_aquecimento_miniaturas(caminho_base):
+    from preprocessamento import iniciar_galeria
+
+    return iniciar_galeria(caminho_base)
+
+
+def _fundo_marcador(marcador):
+    """Estilo com a proporção da imagem e o marcador borrado (LQIP) como fundo."""
+    return (
+        f"aspect-ratio:{marcador['largura']}/{marcador['altura']};"
+        f"background:{marcador['cor']} url('{marcador['lqip']}') center/cover no-repeat"
+    )
+
+
+def _chave_css(texto):
+    """Chave de container utilizável como classe CSS (st-key-<chave>)."""
+    return "".join(c if c.isascii() and c.isalnum() else "-" for c in texto.lower())
+
+
+def _exibir_imagem(destino, caminho, legenda, marcador, chave):
+    """
+    Exibe uma imagem da galeria.
+
+    Com o static serving habilitado, a imagem é publicada em static/galeria/
+    e referenciada por URL (cacheável entre sessões, sem passar pela memória
+    do servidor); caso contrário, é enviada por st.image dentro de um
+    container identificado por `chave`.
+
+    Returns:
+        Regra CSS que reserva o espaço na proporção certa e mostra o marcador
+        até a imagem chegar ao navegador ("" sem marcador ou quando o
+        marcador vai no próprio <img>)
+    """
+    url = ativos_estaticos.publicar(caminho) if ativos_estaticos.habilitado() else None
+    if url is not None:
+        atributos = ""
+        if marcador:
+            atributos = (
+                f" width=\"{marcador['largura']}\" height=\"{marcador['altura']}\""
+                f" style=\"{_fundo_marcador(marcador)}\""
+            )
+        destino.markdown(
+            f"<figure class='imagem-galeria'><img src=\"{url}\" alt=\"{legenda}\"{atributos}"
+            f" loading=\"lazy\" decoding=\"async\"><figcaption>{legenda}</figcaption></figure>",
+            unsafe_allow_html=True,
+        )
+        return ""
+    try:
+        dados = ler_imagem(caminho)
+    except OSError as e:
+        destino.error(f"Não foi possível carregar {legenda.lower()}: {e}")
+        return ""
+    if marcador is None:
+        destino.image(dados, width="stretch", caption=legenda)
+        return ""
+    destino.container(key=chave).image(dados, width="stretch", caption=legenda)
+    return f".st-key-{chave} img{{{_fundo_marcador(marcador)};width:100%;height:auto}}"
+
+
+@metricas.instrumentar("entrega_imagem")
+def _exibir_miniatura(destino, imagem, largura, legenda, marcador=None, chave=None):
+    """
+    Exibe a miniatura da imagem ou um marcador enquanto ela é gerada em segundo plano.
+
+    Returns:
+        Regra CSS do marcador da imagem (ver _exibir_imagem)
+    """
+    miniatura = miniatura_existente(imagem, largura)
+    if miniatura is None:
+        if _iniciar_aquecimento_miniaturas(IMAGENS_DIR).em_andamento:
+            estilo = f" style=\"{_fundo_marcador(marcador)}\"" if marcador else ""
+            destino.markdown(
+                f"<div class='miniatura-pendente'{estilo}><span>Preparando {legenda.lower()}…</span></div>",
+                unsafe_allow_html=True,
+            )
+            return ""
+        miniatura = gerar_miniatura(imagem, largura)
+    return _exibir_imagem(destino, miniatura, legenda, marcador, chave)
+
+# Iniciar a geração das miniaturas assim que o processo sobe; com o
+# aquecimento habilitado isso já acontece na thread dele, fora da primeira
+# execução do script
+if not aquecimento.habilitado():
+    _iniciar_aquecimento_miniaturas(IMAGENS_DIR)
+
+# Estilos CSS personalizados para responsividade (assets/app.css, compartilhado
+# com a exportação estática)
+st.markdown(obter_fragmento("css_app"), unsafe_allow_html=True)
+
+# Função para validar e-mail com cache (sintaxe e, opcionalmente, registros MX)
+@metricas.instrumentar("validar_email")
 def validar_email(email):
     """
     Valida se o e-mail fornecido é válido.
     """
-    try:
-        validate_email(email)
-        return True
-    except EmailNotValidError:
-        return False
+    from validacao_email import obter_servico
+
+    return obter_servico().validar(email).valido
 
 # Função para enviar e-mail
+@metricas.instrumentar("enfileirar_email")
 def enviar_email(nome, email_remetente, mensagem):
     """
-    Envia um e-mail com as informações fornecidas.
+    Grava a mensagem na caixa de saída; a entrega por SMTP ocorre em segundo plano.
     """
-    try:
-        # Configuração do e-mail
-        email_destino = os.environ.get('EMAIL_DESTINO')  # Use variáveis de ambiente para segurança
-        email_usuario = os.environ.get('EMAIL_USUARIO')
-        email_senha = os.environ.get('EMAIL_SENHA')
+    from caixa_saida import configuracao_completa, enfileirar_contato
 
-        if not all([email_destino, email_usuario, email_senha]):
+    try:
+        if not configuracao_completa():
             st.error("Configurações de e-mail não encontradas. Por favor, configure as variáveis de ambiente.")
             return False
 
-        msg = EmailMessage()
-        msg.set_content(f"Nome: {nome}\nE-mail: {email_remetente}\n\nMensagem:\n{mensagem}")
-        msg['Subject'] = f"Contato do Portfólio - {nome}"
-        msg['From'] = email_usuario
-        msg['To'] = email_destino
-
-        # Configuração do servidor SMTP
-        servidor = smtplib.SMTP('smtp.gmail.com', 587)  # Exemplo com Gmail
-        servidor.starttls()
-        servidor.login(email_usuario, email_senha)
-        servidor.send_message(msg)
-        servidor.quit()
+        enfileirar_contato(nome, email_remetente, mensagem)
         return True
-    except smtplib.SMTPException as e:
-        st.error(f"Ocorreu um erro ao enviar o e-mail: {e}")
-        return False
     except Exception as e:
         st.error(f"Ocorreu um erro inesperado: {e}")
         return False
 
 # Lista de links com ícones, labels e URLs
-links_profissionais = [
-    {'icon': '<img src="https://cdn-icons-png.flaticon.com/512/300/300221.png" width="40"/>', 'label': 'Google Acadêmico', 'url': 'https://scholar.google.com.br/citations?user=XLu_qAIAAAAJ&hl=pt-BR'},
-    {'icon': '<img src="https://cdn-icons-png.flaticon.com/512/174/174857.png" width="40"/>', 'label': 'LinkedIn', 'url': 'https://www.linkedin.com/in/tiago-holanda-082928141/'},
-    {'icon': '<img src="https://cdn-icons-png.flaticon.com/512/25/25231.png" width="40"/>', 'label': 'GitHub', 'url': 'https://github.com/tiagofholanda'},
-    {'icon': '<img src="https://lattes.cnpq.br/image/layout_set_logo?img_id=1311768&t=1729293336662" width="40"/>', 'label': 'Lattes', 'url': 'http://lattes.cnpq.br/4969639760120080'},
-    {'icon': '<img src="https://c5.rgstatic.net/m/419438641133902/images/icons/svgicons/new-index-logo.svg" width="40"/>', 'label': 'ResearchGate', 'url': 'https://www.researchgate.net/profile/Tiago_Holanda'},
-    {'icon': '<img src="https://www.pikpng.com/pngl/m/424-4243430_reviewers-for-these-journals-can-track-verify-and.png" width="80"/>', 'label': 'Publons', 'url': 'https://publons.com/researcher/3962699/tiago-holanda/'},
-    {'icon': '<img src="https://upload.wikimedia.org/wikipedia/commons/0/06/ORCID_iD.svg" width="40"/>', 'label': 'ORCID', 'url': 'https://orcid.org/0000-0001-6898-5027'},
-    {'icon': '<img src="https://www.elsevier.com/images/elsevier-logo.svg" width="80"/>', 'label': 'Scopus', 'url': 'https://www.scopus.com/authid/detail.uri?authorId=57376293300'},
-]
+links_profissionais = links_com_icone()
 
 # Função para Currículo
+@metricas.instrumentar("pagina:curriculo")
 def mostrar_curriculo():
     """
     Exibe o currículo profissional e acadêmico.
@@ -305,157 +183,19 @@ def mostrar_curriculo():
     # Layout usando apenas CSS responsivo
     col1, col2 = st.columns([1, 2], gap="large")
     with col1:
-        st.image("https://avatars.githubusercontent.com/u/111590174?v=4", use_column_width=True)
+        st.image(FOTO_PERFIL, width="stretch")
         # Ícones de redes sociais
-        links_html = '<div class="icone-rede">'
-        for link in links_profissionais:
-            links_html += f'<a href="{link["url"]}" target="_blank" title="{link["label"]}">{link["icon"]}</a> '
-        links_html += '</div>'
-        st.markdown(links_html, unsafe_allow_html=True)
+        st.markdown(obter_fragmento("links_sociais"), unsafe_allow_html=True)
     with col2:
-        st.markdown('<h2 class="subtitulo">Resumo Profissional</h2>', unsafe_allow_html=True)
-        st.markdown("""
-        <p class="texto" style="color:#000000;">
-            Especialista em Geoprocessamento, Sistemas WebGIS e Análise de Dados, com atuação em desenvolvimento de soluções espaciais, automação de processos com Python e R, integração de bancos PostGIS e visualização de dados em plataformas como Streamlit, Power BI e React/Mapbox. Experiência comprovada em projetos para setores público e privado, além de sólida produção acadêmica e atividades de docência.
-        </p>
-        """, unsafe_allow_html=True)
-
-    # Dados pessoais
-    st.markdown('<h2 class="subtitulo">Dados Pessoais</h2>', unsafe_allow_html=True)
-    st.markdown("""
-    <ul class="texto">
-        <li><strong>Nome:</strong> Tiago Fernando de Holanda</li>
-        <li><strong>Endereço:</strong> Rua Rio Grande do Sul, n.º 711, Barro Preto – Belo Horizonte/MG</li>
-        <li><strong>Telefones:</strong> (81) 99667-4681</li>
-        <li><strong>E-mails:</strong> tfholanda@gmail.com / tiagofholanda@hotmail.com</li>
-        <li><strong>Estado Civil:</strong> Solteiro</li>
-        <li><strong>Data de Nascimento:</strong> 08/07/1995</li>
-        <li><strong>Nacionalidade:</strong> Brasileiro</li>
-        <li><strong>Naturalidade:</strong> Cabo de Santo Agostinho/PE</li>
-        <li><strong>CNH:</strong> Categoria B</li>
-    </ul>
-    """, unsafe_allow_html=True)
+        st.markdown(obter_fragmento("resumo_profissional"), unsafe_allow_html=True)
 
-    # Formação
-    st.markdown('<h2 class="subtitulo">Formação Acadêmica e Técnica</h2>', unsafe_allow_html=True)
-    st.markdown("""
-    <ul class="texto">
-        <li>Graduando em Análise e Desenvolvimento de Sistemas – Estácio</li>
-        <li>Graduado em Geografia – UFPE (2018)</li>
-        <li>Mestre em Ciências Geodésicas e Tecnologia da Geoinformação – UFPE (2020)</li>
-        <li>Técnico em Geoprocessamento – IF Sul de Minas</li>
-        <li>Técnico em Agrimensura – Especialista em Georreferenciamento</li>
-    </ul>
-    """, unsafe_allow_html=True)
-
-    # Experiências profissionais
-    st.markdown('<h2 class="subtitulo">Experiências Profissionais</h2>', unsafe_allow_html=True)
-    st.markdown("""
-    <ul class="texto">
-        <li>
-            <strong>UFABC</strong><br>
-            <strong>Função:</strong> Tutor e Professor da Especialização em Geoprocessamento<br>
-            <strong>Atuação:</strong> Orientação de TCC, tutoria em disciplinas específicas e acompanhamento pedagógico da pós-graduação.<br>
-            <strong>Período:</strong> 10/07/2023 – 01/08/2025
-        </li>
-        <li>
-            <strong>DEVGIS</strong><br>
-            <strong>Função:</strong> Desenvolvedor WebGIS / Especialista de Geoprocessamento<br>
-            <strong>Atuação:</strong> React + Mapbox GL JS, APIs REST, dashboards em tempo real, otimização de performance com grandes volumes de dados, integração PostGIS/frontend e bibliotecas internas de mapeamento.<br>
-            <strong>Período:</strong> 10/02/2024 – 01/10/2025
-        </li>
-        <li>
-            <strong>AERO Engenharia</strong><br>
-            <strong>Função:</strong> Especialista de Geoprocessamento<br>
-            <strong>Atuação:</strong> Estruturação de dados GIS, automações com Python e R, dashboards em R/Python, IA para detecção de focos de dengue e implantação de WebGIS com Geoserver/Geonode em nuvem.<br>
-            <strong>Período:</strong> 10/02/2025 – 01/10/2025
-        </li>
-        <li>
-            <strong>NMC Integrativa</strong><br>
-            <strong>Função:</strong> Especialista de Geoprocessamento / Coordenação de Projetos<br>
-            <strong>Atuação:</strong> Estruturação de dados, automação com Python e R, dashboards para gestão e planejamento de tarefas internas.<br>
-            <strong>Período:</strong> 04/06/2024 – 15/12/2024
-        </li>
-        <li>
-            <strong>RAC Soluções Ambientais (Fundação Renova)</strong><br>
-            <strong>Função:</strong> Analista de Planejamento / Geoprocessamento<br>
-            <strong>Atuação:</strong> Automação, mapeamento aerofotogramétrico com drones, dashboards, sensoriamento remoto e supervisão de contratos nos programas 07 e 08 de reassentamento.<br>
-            <strong>Período:</strong> 10/03/2023 – 27/05/2024
-        </li>
-        <li>
-            <strong>Empresa Caroá Topografia e Agrimensura</strong><br>
-            <strong>Função:</strong> Prestador de serviço técnico-científico<br>
-            <strong>Atuação:</strong> Planejamento e execução de mapeamentos aerofotogramétricos e implantação de GIS.<br>
-            <strong>Período:</strong> 30/06/2021 – 10/03/2023
-        </li>
-        <li>
-            <strong>Corpo Técnico de Perícia Ambiental – Ipojuca/PE</strong><br>
-            <strong>Função:</strong> Consultor Técnico<br>
-            <strong>Atuação:</strong> Estruturação de mapeamentos aerofotogramétricos e GIS para perícias ambientais.<br>
-            <strong>Período:</strong> 03/2021 – 04/2021
-        </li>
-        <li>
-            <strong>Professor do Departamento de Geografia – UPE</strong><br>
-            <strong>Disciplinas:</strong> Cartografia Básica, Cartografia Temática, Estatística Aplicada, Geotecnologias e Afins.<br>
-            <strong>Período:</strong> 01/2020 – 07/2021
-        </li>
-    </ul>
-    """, unsafe_allow_html=True)
-
-    # Projetos, Pesquisas e Atuação Acadêmica
-    st.markdown('<h2 class="subtitulo">Projetos, Pesquisas e Atuação Acadêmica</h2>', unsafe_allow_html=True)
-    st.markdown("""
-    <ul class="texto">
-        <li>Projeto PELDTAMS (UFPE): monitoramento anual de praia com Drone e GNSS (2017 – atual).</li>
-        <li>Doutorado em Ponta de Pedra – PE: monitoramento costeiro com Drone e GNSS (2017 – 2018).</li>
-        <li>Monitoramento da Caatinga em Itacuruba/PE com Drone (fev/2019).</li>
-        <li>Mestrado – Monitoramento da Praia do Paiva/PE com GNSS e Drone.</li>
-        <li>Monitoramento com Drone na Reserva Biológica Ilha Atol das Rocas (2020 – atual).</li>
-    </ul>
-    """, unsafe_allow_html=True)
-
-    # Competências Técnicas
-    st.markdown('<h2 class="subtitulo">Competências Técnicas</h2>', unsafe_allow_html=True)
-    st.markdown("""
-    <ul class="texto">
-        <li><strong>Softwares de processamento e modelagem:</strong> Agisoft Photoscan/Metashape, Pix4D Mapper, Bentley, Trimble Business Center, GTR Processor, TOPCOM.</li>
-        <li><strong>GIS:</strong> ArcGIS Desktop/Online/Pro/Server, ArcGIS Apps, QGIS, Global Mapper e manipulação de bancos PostGIS.</li>
-        <li><strong>Modelagem Costeira:</strong> DELFT 3D, XBEACH, SMC.</li>
-        <li><strong>Programação:</strong> Python, R (incluindo IA), HTML5, JavaScript, desenvolvimento Streamlit, React, Mapbox GL JS.</li>
-        <li><strong>Sensoriamento e Topografia:</strong> Operação de drones (RPAS), GNSS, aerofotogrametria, geração de dashboards e análises em Power BI.</li>
-    </ul>
-    """, unsafe_allow_html=True)
-
-    # Cursos
-    st.markdown('<h2 class="subtitulo">Cursos e Capacitações</h2>', unsafe_allow_html=True)
-    st.markdown("""
-    <ul class="texto">
-        <li>R para geoprocessamento de dados espaciais – UFF (20h)</li>
-        <li>Python para geoprocessamento de dados espaciais</li>
-        <li>Capacitação ET-EDGV – UFPE (4h)</li>
-        <li>Disseminação do banco de dados do IBGE – UFPE (4h)</li>
-        <li>Análises de qualidade de dados espaciais – Graltec (2h)</li>
-        <li>Introdução ao AutoCAD 3D – Graltec (2h)</li>
-        <li>Banco de Dados Espaciais – Graltec (1h)</li>
-        <li>VANTs na Topografia – Graltec (2h)</li>
-        <li>Mapeamento Aéreo Express – Droneng (2h)</li>
-        <li>Google Earth no Geoprocessamento – Graltec (2h)</li>
-    </ul>
-    """, unsafe_allow_html=True)
-
-    # Conteúdos elaborados
-    st.markdown('<h2 class="subtitulo">Conteúdos e Palestras Elaboradas</h2>', unsafe_allow_html=True)
-    st.markdown("""
-    <ul class="texto">
-        <li>Palestra/curso sobre drones aplicados à climatologia (UFPE).</li>
-        <li>Curso ministrado no Encontro do Pensamento Geográfico – EPG/UFPE (2019).</li>
-        <li>Curso para o LACCOST/Departamento de Oceanografia da UFPE (2020).</li>
-        <li>Curso no Departamento de Geografia da UFPE – AMPLAGEO (2020).</li>
-        <li>Curso no Departamento de Oceanografia da UFPE – LABOGEO (2020).
-    </ul>
-    """, unsafe_allow_html=True)
+    # Seções do currículo (dados pessoais, formação, experiências etc.),
+    # pré-montadas a partir de conteudo.SECOES_CURRICULO
+    for secao in SECOES_CURRICULO:
+        st.markdown(obter_fragmento(f"curriculo_{secao['id']}"), unsafe_allow_html=True)
 
 # Função para Portfólio
+@metricas.instrumentar("pagina:portfolio")
 def mostrar_portfolio():
     """
     Exibe o portfólio de projetos.
@@ -469,7 +209,32 @@ def mostrar_portfolio():
         st.info("Adicione imagens em subpastas dentro da pasta 'Imagem' para mostrar os projetos automaticamente.")
         return
 
-    for projeto in projetos:
+    galeria = _iniciar_aquecimento_miniaturas(IMAGENS_DIR)
+    if galeria.em_andamento:
+        st.progress(galeria.progresso, text=f"Otimizando imagens: {galeria.concluidos}/{galeria.total}")
+
+    # Paginação: apenas os cards da página selecionada são enviados ao navegador
+    projetos_por_pagina = max(1, ambiente_inteiro("PORTFOLIO_PROJETOS_POR_PAGINA", 3))
+    total_paginas = max(1, math.ceil(len(projetos) / projetos_por_pagina))
+    pagina = 1
+    if total_paginas > 1:
+        pagina = int(st.number_input(
+            f"Página (de {total_paginas})",
+            min_value=1,
+            max_value=total_paginas,
+            value=1,
+            step=1,
+            key="portfolio_pagina",
+        ))
+    inicio = (pagina - 1) * projetos_por_pagina
+
+    # Regras CSS dos marcadores das imagens exibidas, enviadas em um único
+    # bloco antes dos cards
+    bloco_estilos = st.empty()
+    estilos = []
+    for projeto in projetos[inicio:inicio + projetos_por_pagina]:
+        marcadores = projeto.get('marcadores') or [None] * len(projeto['imagens'])
+        chave_projeto = _chave_css(projeto['slug'])
         with st.container():
             st.markdown("""
                 <div class="texto" style="background-color: var(--secondary-background-color, #f5f5f5); padding: 20px; border-radius: 12px; box-shadow: 0 4px 12px rgba(0,0,0,0.08); margin-bottom: 25px;">
@@ -478,13 +243,36 @@ def mostrar_portfolio():
             st.markdown(f"<p class='texto'>{projeto['descricao']}</p>", unsafe_allow_html=True)
             st.markdown(f"<p style='color:#888;'>Total de imagens: {len(projeto['imagens'])}</p>", unsafe_allow_html=True)
 
+            # As imagens do card só são enviadas quando o visitante abre a galeria
+            abrir_galeria = st.toggle("Mostrar imagens", key=f"galeria_{projeto['slug']}")
+            if not abrir_galeria:
+                estilos.append(_exibir_miniatura(
+                    st, projeto['imagens'][0], LARGURA_CAPA, "Imagem 1", marcadores[0], f"capa-{chave_projeto}",
+                ))
+                st.markdown("""</div>""", unsafe_allow_html=True)
+                continue
+
+            # Miniaturas por padrão; a resolução original só é enviada sob demanda
+            ver_original = st.toggle("Ver imagens em resolução original", key=f"original_{projeto['slug']}")
+
             cols = st.columns(2)
             for idx, imagem in enumerate(projeto['imagens']):
-                cols[idx % 2].image(imagem, use_column_width=True, caption=f"Imagem {idx + 1}")
+                chave = f"imagem-{chave_projeto}-{idx}"
+                if ver_original:
+                    estilos.append(_exibir_imagem(cols[idx % 2], imagem, f"Imagem {idx + 1}", marcadores[idx], chave))
+                else:
+                    estilos.append(_exibir_miniatura(
+                        cols[idx % 2], imagem, LARGURA_GALERIA, f"Imagem {idx + 1}", marcadores[idx], chave,
+                    ))
 
             st.markdown("""</div>""", unsafe_allow_html=True)
 
+    estilos = "".join(estilos)
+    if estilos:
+        bloco_estilos.markdown(f"<style>{estilos}</style>", unsafe_allow_html=True)
+
 # Função para Contato
+@metricas.instrumentar("pagina:contato")
 def mostrar_contato():
     """
     Exibe as informações de contato e um formulário para envio de mensagens.
@@ -495,19 +283,11 @@ def mostrar_contato():
     """, unsafe_allow_html=True)
     
     # Informações de contato
-    st.markdown("""
-    <ul class="texto">
-        <li><strong>E-mail:</strong> tfholanda@gmail.com / tiagofholanda@hotmail.com</li>
-    </ul>
-    """, unsafe_allow_html=True)
+    st.markdown(obter_fragmento("contato_info"), unsafe_allow_html=True)
     
     # Exibir os links profissionais
     st.markdown('<h2 class="subtitulo">Redes e Plataformas</h2>', unsafe_allow_html=True)
-    links_html = '<div class="icone-rede">'
-    for link in links_profissionais:
-        links_html += f'<a href="{link["url"]}" target="_blank" title="{link["label"]}">{link["icon"]}</a> '
-    links_html += '</div>'
-    st.markdown(links_html, unsafe_allow_html=True)
+    st.markdown(obter_fragmento("links_sociais"), unsafe_allow_html=True)
     
     # Formulário de contato
     st.markdown('<h2 class="subtitulo">Enviar uma Mensagem</h2>', unsafe_allow_html=True)
@@ -522,48 +302,214 @@ def mostrar_contato():
     if submit_button:
         if nome and email_remetente and mensagem:
             if validar_email(email_remetente):
-                with st.spinner('Enviando mensagem...'):
-                    sucesso = enviar_email(nome, email_remetente, mensagem)
-                    if sucesso:
-                        st.success("Mensagem enviada com sucesso!")
+                sucesso = enviar_email(nome, email_remetente, mensagem)
+                if sucesso:
+                    st.success("Mensagem enviada com sucesso!")
             else:
                 st.error("Por favor, insira um endereço de e-mail válido.")
         else:
             st.error("Por favor, preencha todos os campos.")
 
 # Função para a Home
+@metricas.instrumentar("pagina:home")
 def mostrar_home():
     """
     Exibe a página inicial.
     """
-    st.markdown("""
-    <p class="texto">
-        Olá! Sou Tiago Holanda, um profissional dedicado nas áreas de Geografia e Geoinformação. Navegue pelo meu portfólio para conhecer mais sobre minha trajetória acadêmica, projetos desenvolvidos e como entrar em contato.
-    </p>
-    """, unsafe_allow_html=True)
-    st_lottie(lottie_animation_home, height=300)
+    st.markdown(obter_fragmento("home_intro"), unsafe_allow_html=True)
+    from cache_lottie import URL_LOTTIE_HOME
+    from streamlit_lottie import st_lottie
+
+    lottie_animation_home = load_lottie_url(URL_LOTTIE_HOME)
+    if lottie_animation_home:
+        st_lottie(lottie_animation_home, height=300)
     
     # Exibir os links profissionais
-    links_html = '<div class="icone-rede">'
-    for link in links_profissionais:
-        links_html += f'<a href="{link["url"]}" target="_blank" title="{link["label"]}">{link["icon"]}</a> '
-    links_html += '</div>'
-    st.markdown(links_html, unsafe_allow_html=True)
+    st.markdown(obter_fragmento("links_sociais"), unsafe_allow_html=True)
+
+# Dados de PIB lidos do cache colunar (matriz float32); a chave é o hash do
+# CSV, então uma nova versão do arquivo substitui o recurso em cache
+@metricas.cache_resource(show_spinner=False, max_entries=2)
+def _obter_dados_pib(digest):
+    from dados_pib import carregar_pib
+
+    return carregar_pib()
+
+
+@metricas.instrumentar("carregar_dados_pib")
+def carregar_dados_pib():
+    from dados_pib import CAMINHO_CSV
+    from miniaturas import hash_conteudo
+
+    return _obter_dados_pib(hash_conteudo(CAMINHO_CSV))
+
+
+def carregar_indicadores_pib(dados):
+    from indicadores_pib import obter_indicadores
 
-# Inicializar o estado da página
+    return obter_indicadores(dados)
+
+# Países exibidos ao abrir o explorador
+PAISES_PIB_PADRAO = ["BRA", "USA", "CHN", "IND", "DEU"]
+
+# Função para o explorador do PIB
+@metricas.instrumentar("pagina:pib")
+def mostrar_pib():
+    """
+    Exibe a evolução do PIB dos países selecionados e o ranking de um ano.
+    """
+    import numpy as np
+    import busca_paises
+    import graficos_pib
+    from indicadores_pib import INDICADORES
+
+    dados = carregar_dados_pib()
+    indicadores = carregar_indicadores_pib(dados)
+    nome_por_codigo = dict(zip(dados.codigos, dados.nomes))
+    primeiro_ano, ultimo_ano = int(dados.anos[0]), int(dados.anos[-1])
+
+    st.markdown('<h1 class="titulo-principal">Explorador do PIB</h1>', unsafe_allow_html=True)
+    st.markdown(
+        '<p class="texto">PIB em US$ correntes (Banco Mundial), de '
+        f'{primeiro_ano} a {ultimo_ano}.</p>',
+        unsafe_allow_html=True,
+    )
+
+    col_busca, col_agregados = st.columns([2, 1])
+    consulta = col_busca.text_input("Buscar país ou código", key="pib_busca", placeholder="ex.: Brasil, DEU, germany")
+    incluir_agregados = col_agregados.checkbox("Incluir regiões e agregados", key="pib_agregados")
+
+    # Opções da lista: resultado da busca (ou todos os países) sem perder a seleção atual
+    selecionados = st.session_state.get(
+        "pib_paises", [codigo for codigo in PAISES_PIB_PADRAO if codigo in nome_por_codigo],
+    )
+    if consulta.strip():
+        indice = busca_paises.obter_indice(dados)
+        resultados = [r.codigo for r in indice.buscar(consulta, incluir_agregados=incluir_agregados)]
+    elif incluir_agregados:
+        resultados = dados.codigos
+    else:
+        resultados = [codigo for codigo in dados.codigos if not busca_paises.eh_agregado(codigo)]
+    opcoes = list(dict.fromkeys(list(selecionados) + resultados))
+
+    codigos = st.multiselect(
+        "Países e regiões",
+        options=opcoes,
+        default=selecionados,
+        format_func=lambda codigo: f"{nome_por_codigo[codigo]} ({codigo})",
+        key="pib_paises",
+    )
+    col1, col2 = st.columns([2, 1])
+    ano_inicial, ano_final = col1.slider(
+        "Período", min_value=primeiro_ano, max_value=ultimo_ano,
+        value=(primeiro_ano, ultimo_ano), key="pib_periodo",
+    )
+    indicador = col2.selectbox(
+        "Indicador", options=list(INDICADORES), format_func=INDICADORES.get, key="pib_indicador",
+    )
+
+    # Evolução: figura montada uma vez por seleção, com séries longas decimadas
+    graficos_pib.exibir(st, graficos_pib.figura_evolucao(
+        dados, indicadores, codigos, ano_inicial, ano_final, indicador,
+    ))
+
+    # Crescimento anual composto no período, calculado para todos os países de uma vez
+    encontrados = [codigo for codigo in codigos if codigo in dados.linha_por_codigo]
+    if encontrados and ano_final > ano_inicial:
+        cagr = indicadores.cagr_periodo(ano_inicial, ano_final)[dados.linhas(encontrados)]
+        st.markdown(f"**CAGR {ano_inicial}–{ano_final}:** " + " · ".join(
+            f"{nome_por_codigo[codigo]} {valor:.1%}" if not np.isnan(valor) else f"{nome_por_codigo[codigo]} —"
+            for codigo, valor in zip(encontrados, cagr)
+        ))
+
+    # Ranking do último ano do período, ordenado sobre a coluna inteira
+    graficos_pib.exibir(st, graficos_pib.figura_ranking(dados, ano_final, incluir_agregados=incluir_agregados))
+
+# Página administrativa oculta com as métricas de desempenho
+def mostrar_metricas():
+    """
+    Exibe latências, acertos de cache e reruns coletados pelo módulo metricas.
+    """
+    dados = metricas.resumo()
+    st.markdown('<h1 class="titulo-principal">Métricas</h1>', unsafe_allow_html=True)
+
+    sessoes = dados["sessoes"]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Reruns", dados["reruns"])
+    col2.metric("Sessões", sessoes["ativas"])
+    col3.metric("Reruns por sessão (média / máx.)", f"{sessoes['reruns_media']:.1f} / {sessoes['reruns_max']}")
+
+    st.markdown('<h2 class="subtitulo">Latência por trecho</h2>', unsafe_allow_html=True)
+    st.table([
+        {
+            "Trecho": nome,
+            "Chamadas": trecho["contagem"],
+            "p50 (ms)": round(trecho["p50"] * 1000, 2),
+            "p95 (ms)": round(trecho["p95"] * 1000, 2),
+            "p99 (ms)": round(trecho["p99"] * 1000, 2),
+        }
+        for nome, trecho in sorted(dados["trechos"].items())
+    ])
+
+    st.markdown('<h2 class="subtitulo">Caches</h2>', unsafe_allow_html=True)
+    st.table([
+        {"Função": nome, "Chamadas": cache["chamadas"], "Acertos": cache["acertos"], "Falhas": cache["falhas"]}
+        for nome, cache in sorted(dados["caches"].items())
+    ])
+
+    for nome, valores in sorted(dados["coletores"].items()):
+        st.markdown(f'<h2 class="subtitulo">{nome}</h2>', unsafe_allow_html=True)
+        st.table([{"Métrica": chave, "Valor": valor} for chave, valor in sorted(valores.items())])
+
+    st.download_button("Exportar (Prometheus)", metricas.texto_prometheus(), file_name="metricas.prom")
+
+# Acessível apenas por ?metricas=<PORTFOLIO_METRICAS_TOKEN> com a coleta habilitada
+if metricas.acesso_administrativo(st.query_params):
+    mostrar_metricas()
+    st.stop()
+
+MENU_PAGINAS = ["Home", "Currículo", "Portfólio", "PIB", "Contato"]
+
+# Inicializar o estado da página (?pagina=Contato abre direto o formulário,
+# usado pelos links da exportação estática)
 if 'page' not in st.session_state:
-    st.session_state.page = 'Home'
+    pagina_inicial = st.query_params.get("pagina", "Home")
+    st.session_state.page = pagina_inicial if pagina_inicial in MENU_PAGINAS else 'Home'
 
 # Função de navegação
 def navigation():
     st.markdown('<h1 class="titulo-principal">Portfólio de Tiago Holanda</h1>', unsafe_allow_html=True)
-    menu_items = ["Home", "Currículo", "Portfólio", "Contato"]
+    menu_items = MENU_PAGINAS
     cols = st.columns(len(menu_items))
     for i, item in enumerate(menu_items):
         if cols[i].button(item):
             st.session_state.page = item
 
+# Busca no currículo e nos projetos; o botão de cada resultado abre a página
+def mostrar_busca():
+    consulta = st.text_input(
+        "Buscar no portfólio", key="busca_conteudo", placeholder="PostGIS, drone, dengue…",
+    ).strip()
+    if not consulta:
+        return
+    resultados = obter_busca(IMAGENS_DIR).buscar(consulta)
+    if not resultados:
+        st.info(f"Nenhum resultado para “{consulta}”.")
+        return
+    for i, resultado in enumerate(resultados):
+        with st.container(border=True):
+            st.markdown(
+                f'<span class="busca-pagina">{resultado.pagina}</span>'
+                f'<h3 class="busca-titulo">{escape(resultado.titulo)}</h3>'
+                f'<p class="busca-trecho">{resultado.trecho}</p>',
+                unsafe_allow_html=True,
+            )
+            if st.button(f"Abrir {resultado.pagina}", key=f"busca_resultado_{i}"):
+                st.session_state.page = resultado.pagina
+                st.rerun()
+
 navigation()
+mostrar_busca()
 
 # Exibir a página selecionada
 if st.session_state.page == "Home":
@@ -572,5 +518,7 @@ elif st.session_state.page == "Currículo":
     mostrar_curriculo()
 elif st.session_state.page == "Portfólio":
     mostrar_portfolio()
+elif st.session_state.page == "PIB":
+    mostrar_pib()
 elif st.session_state.page == "Contato":
     mostrar_contato()
\ No newline at end of file
@@ -0,0 +1,114 @@
+import indice_projetos
+import busca_conteudo
+from busca_conteudo import BuscaConteudo, IndiceBusca, documentos_curriculo, radical, termos
+
+
+class _ProjetosFalsos:
+    """Substitui IndiceProjetos: apenas versao e projetos()."""
+
+    def __init__(self, projetos=()):
+        self.versao = 1
+        self._projetos = list(projetos)
+        self.leituras = 0
+
+    def projetos(self):
+        self.leituras += 1
+        return list(self._projetos)
+
+    def trocar(self, projetos):
+        self._projetos = list(projetos)
+        self.versao += 1
+
+
+def _projetos(resultados):
+    return [r.id for r in resultados if r.tipo == "projeto"]
+
+
+def _indice(*documentos):
+    indice = IndiceBusca()
+    for id_documento, titulo, texto in documentos:
+        indice.definir(id_documento, "projeto", titulo, "Portfólio", texto)
+    return indice
+
+
+def test_termos_sem_acento_stopwords_e_plural():
+    assert termos("Análises das Áreas Costeiras") == termos("analise area costeiro")
+    assert radical("mapas") == radical("mapa")
+    assert "de" not in termos("banco de dados")
+
+
+def test_bm25_prefere_titulo_e_frequencia():
+    indice = _indice(
+        ("projeto:a", "Drone na praia", "Levantamento costeiro."),
+        ("projeto:b", "Praia", "Voo de drone sobre a praia."),
+        ("projeto:c", "Dengue", "Casos por bairro."),
+    )
+    resultados = indice.buscar("drone")
+    assert [r.id for r in resultados] == ["projeto:a", "projeto:b"]
+    assert resultados[0].pontuacao > resultados[1].pontuacao
+    assert indice.buscar("inexistente") == []
+
+
+def test_consulta_sem_acento_encontra_texto_acentuado():
+    indice = _indice(("projeto:a", "Índices", "Análise espacial da vegetação."))
+    assert [r.id for r in indice.buscar("analise vegetacao")] == ["projeto:a"]
+
+
+def test_prefixo_digitado_pela_metade():
+    indice = _indice(("projeto:a", "Banco", "Consultas em PostGIS."), ("projeto:b", "Outro", "Sem relação."))
+    assert [r.id for r in indice.buscar("postg")] == ["projeto:a"]
+    # Prefixos curtos demais não são expandidos
+    assert indice.buscar("po") == []
+
+
+def test_trecho_destaca_termos_sem_pontuacao_duplicada():
+    documentos = dict((id_documento, texto) for id_documento, _, texto in documentos_curriculo())
+    assert all(".." not in texto for texto in documentos.values())
+
+    indice = _indice(("projeto:a", "Projeto", "Mapeamento com <drone> em praia."))
+    resultado = indice.buscar("drone")[0]
+    assert "<mark>drone</mark>" in resultado.trecho
+    assert "&lt;" in resultado.trecho and "<drone>" not in resultado.trecho
+
+
+def test_memoria_invalidada_ao_alterar_documento():
+    indice = _indice(("projeto:a", "A", "Drone."))
+    assert len(indice.buscar("drone")) == 1
+    assert indice.definir("projeto:a", "projeto", "A", "Portfólio", "Drone.") is False
+    indice.definir("projeto:b", "projeto", "B", "Portfólio", "Drone também.")
+    assert len(indice.buscar("drone")) == 2
+    indice.remover("projeto:a")
+    assert [r.id for r in indice.buscar("drone")] == ["projeto:b"]
+    assert indice.estatisticas()["documentos"] == 1
+
+
+def test_sincronizacao_incremental_pela_versao():
+    projetos = _ProjetosFalsos([{"slug": "drone", "titulo": "Drone", "descricao": "Aerolevantamento."}])
+    busca = BuscaConteudo(projetos)
+    assert _projetos(busca.buscar("aerolevantamento")) == ["projeto:drone"]
+    assert "curriculo:resumo" in busca.indice.ids("curriculo:")
+
+    leituras = projetos.leituras
+    assert busca.sincronizar() == 0
+    assert projetos.leituras == leituras
+
+    projetos.trocar([{"slug": "dengue", "titulo": "Dengue", "descricao": "Casos de dengue."}])
+    assert busca.sincronizar() == 2
+    assert _projetos(busca.buscar("aerolevantamento")) == []
+    assert _projetos(busca.buscar("dengue")) == ["projeto:dengue"]
+
+
+def test_obter_busca_por_pasta(monkeypatch):
+    pastas = {
+        "a": _ProjetosFalsos([{"slug": "x", "titulo": "Drone", "descricao": "Praia."}]),
+        "b": _ProjetosFalsos([{"slug": "y", "titulo": "Dengue", "descricao": "Casos."}]),
+    }
+    monkeypatch.setattr(indice_projetos, "obter_indice", pastas.__getitem__)
+    monkeypatch.setattr(busca_conteudo, "_buscas", {})
+
+    busca_a = busca_conteudo.obter_busca("a")
+    busca_b = busca_conteudo.obter_busca("b")
+    assert busca_a is busca_conteudo.obter_busca("a")
+    assert busca_a is not busca_b
+    assert _projetos(busca_a.buscar("drone")) == ["projeto:x"]
+    assert _projetos(busca_b.buscar("dengue")) == ["projeto:y"]
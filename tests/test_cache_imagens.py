@@ -0,0 +1,77 @@
+import os
+import threading
+
+from cache_imagens import CacheImagens, max_bytes_imagens
+
+
+def _arquivo(pasta, nome, tamanho, byte=b"a"):
+    caminho = pasta / nome
+    caminho.write_bytes(byte * tamanho)
+    return str(caminho)
+
+
+def test_respeita_orcamento_descartando_menos_usadas(tmp_path):
+    a, b, c = (_arquivo(tmp_path, nome, 40) for nome in ("a.png", "b.png", "c.png"))
+    cache = CacheImagens(max_bytes=100)
+    cache.ler(a)
+    cache.ler(b)
+    cache.ler(a)
+    cache.ler(c)
+
+    estatisticas = cache.estatisticas()
+    assert estatisticas["bytes"] == 80
+    assert estatisticas["descartes"] == 1
+    # b era a menos usada
+    cache.ler(a)
+    cache.ler(c)
+    assert cache.estatisticas()["acertos"] == 3
+    cache.ler(b)
+    assert cache.estatisticas()["falhas"] == 4
+
+
+def test_arquivo_maior_que_o_orcamento_nao_entra(tmp_path):
+    grande = _arquivo(tmp_path, "grande.png", 200)
+    cache = CacheImagens(max_bytes=100)
+    assert cache.ler(grande) == b"a" * 200
+    assert cache.ler(grande) == b"a" * 200
+    assert cache.estatisticas()["imagens"] == 0
+    assert cache.estatisticas()["falhas"] == 2
+
+
+def test_arquivo_substituido_nao_e_servido_da_memoria(tmp_path):
+    caminho = _arquivo(tmp_path, "a.png", 10)
+    cache = CacheImagens(max_bytes=100)
+    assert cache.ler(caminho) == b"a" * 10
+
+    _arquivo(tmp_path, "a.png", 12, b"b")
+    info = os.stat(caminho)
+    os.utime(caminho, ns=(info.st_atime_ns, info.st_mtime_ns + 1_000_000))
+    assert cache.ler(caminho) == b"b" * 12
+    assert cache.estatisticas()["bytes"] == 12
+
+
+def test_leituras_concorrentes_mantem_contagem_de_bytes(tmp_path):
+    caminhos = [_arquivo(tmp_path, f"{i}.png", 30) for i in range(10)]
+    cache = CacheImagens(max_bytes=150)
+
+    def ler():
+        for _ in range(50):
+            for caminho in caminhos:
+                assert len(cache.ler(caminho)) == 30
+
+    threads = [threading.Thread(target=ler) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    estatisticas = cache.estatisticas()
+    assert estatisticas["bytes"] == 30 * estatisticas["imagens"] <= 150
+    assert estatisticas["acertos"] + estatisticas["falhas"] == 8 * 50 * 10
+
+
+def test_orcamento_do_ambiente_tolera_valor_invalido(monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_CACHE_IMAGENS_MB", "0.5")
+    assert CacheImagens().max_bytes == 512 * 1024
+    monkeypatch.setenv("PORTFOLIO_CACHE_IMAGENS_MB", "64MB")
+    assert max_bytes_imagens() == 64 * 1024 * 1024
@@ -0,0 +1,114 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import cache_lottie
+from configuracao import BASE_DIR
+
+ANIMACAO = {"v": "5.7.4", "layers": [{"nm": "camada"}]}
+
+
+class _Origem(BaseHTTPRequestHandler):
+    requisicoes = []
+
+    def do_GET(self):
+        _Origem.requisicoes.append(self.headers.get("If-None-Match"))
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        corpo = json.dumps(ANIMACAO).encode()
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def origem():
+    _Origem.requisicoes = []
+    servidor = ThreadingHTTPServer(("127.0.0.1", 0), _Origem)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{servidor.server_address[1]}/animacao.json"
+    servidor.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def diretorios(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_lottie, "DIRETORIO_LOTTIE", str(tmp_path / "cache"))
+    monkeypatch.setattr(cache_lottie, "DIRETORIO_DISTRIBUIDAS", str(tmp_path / "distribuidas"))
+    monkeypatch.setattr(cache_lottie, "_memoria", {})
+    monkeypatch.setattr(cache_lottie, "_verificado_em", {})
+    return tmp_path
+
+
+def test_carrega_copia_distribuida_sem_rede(diretorios, monkeypatch):
+    url = "http://origem.invalida/animacao.json"
+    monkeypatch.setattr(cache_lottie, "_revalidar", False)
+    monkeypatch.setattr(cache_lottie, "ANIMACOES_DISTRIBUIDAS", {url: "home.json"})
+    cache_lottie._gravar_json(str(diretorios / "distribuidas" / "home.json"), ANIMACAO)
+
+    assert cache_lottie.carregar_lottie(url) == ANIMACAO
+    assert cache_lottie.carregar_lottie("http://origem.invalida/outra.json") is None
+
+
+def test_revalidacao_condicional(origem):
+    assert cache_lottie.revalidar(origem) is True
+    assert cache_lottie._memoria[origem] == ANIMACAO
+
+    # Com o ETag gravado, a origem responde 304 e nada é regravado
+    assert cache_lottie.revalidar(origem) is False
+    assert _Origem.requisicoes == [None, '"v1"']
+
+
+def test_meta_lida_uma_vez_por_processo(origem, monkeypatch):
+    cache_lottie.revalidar(origem)
+    monkeypatch.setattr(cache_lottie, "_verificado_em", {})
+
+    lidos = []
+    ler_json = cache_lottie._ler_json
+
+    def _contar(caminho):
+        lidos.append(caminho)
+        return ler_json(caminho)
+
+    monkeypatch.setattr(cache_lottie, "_ler_json", _contar)
+    for _ in range(5):
+        cache_lottie._agendar_revalidacao(origem)
+    assert sum(caminho.endswith(".meta.json") for caminho in lidos) == 1
+    # Verificada há pouco: nenhuma nova requisição à origem
+    assert _Origem.requisicoes == [None]
+
+
+def test_sementes_versionadas_sao_animacoes_validas():
+    for nome in cache_lottie.ANIMACOES_DISTRIBUIDAS.values():
+        with open(os.path.join(BASE_DIR, "assets", "lottie", nome), encoding="utf-8") as arquivo:
+            assert cache_lottie._animacao_valida(json.load(arquivo)), nome
+
+
+def test_versao_da_origem_substitui_a_semente(origem, diretorios, monkeypatch):
+    semente = {"v": "5.7.4", "layers": [{"nm": "semente"}]}
+    monkeypatch.setattr(cache_lottie, "_revalidar", False)
+    monkeypatch.setattr(cache_lottie, "ANIMACOES_DISTRIBUIDAS", {origem: "home.json"})
+    cache_lottie._gravar_json(str(diretorios / "distribuidas" / "home.json"), semente)
+
+    assert cache_lottie.carregar_lottie(origem) == semente
+    assert cache_lottie.revalidar(origem) is True
+    assert cache_lottie.carregar_lottie(origem) == ANIMACAO
+
+    # Processo novo: o cache em disco tem precedência sobre a semente
+    monkeypatch.setattr(cache_lottie, "_memoria", {})
+    assert cache_lottie.carregar_lottie(origem) == ANIMACAO
+
+
+def test_revalidar_desligado_pelo_ambiente(monkeypatch):
+    monkeypatch.setattr(cache_lottie, "_revalidar", None)
+    monkeypatch.setenv("LOTTIE_REVALIDAR", "0")
+    assert cache_lottie.revalidacao_habilitada() is False
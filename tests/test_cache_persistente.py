@@ -0,0 +1,192 @@
+import sqlite3
+import threading
+import time
+
+import pytest
+
+import cache_persistente
+from cache_persistente import CachePersistente, persistente
+
+
+@pytest.fixture
+def caminho(tmp_path):
+    return str(tmp_path / "cache.db")
+
+
+def _acessada(caminho, chave):
+    with sqlite3.connect(caminho) as conexao:
+        return conexao.execute("SELECT acessada FROM entradas WHERE chave = ?", (chave,)).fetchone()[0]
+
+
+def test_valor_sobrevive_a_reinicio(caminho):
+    cache = CachePersistente(caminho)
+    cache.definir("a", {"x": [1, 2]})
+    assert cache.obter("a") == (True, {"x": [1, 2]})
+
+    reiniciado = CachePersistente(caminho)
+    assert reiniciado.obter("a") == (True, {"x": [1, 2]})
+    assert reiniciado.obter("a") == (True, {"x": [1, 2]})
+    estatisticas = reiniciado.estatisticas()
+    assert (estatisticas["acertos_disco"], estatisticas["acertos_memoria"]) == (1, 1)
+    assert reiniciado.obter("b") == (False, None)
+
+
+def test_ttl_expira_nos_dois_niveis(caminho, monkeypatch):
+    agora = [1000.0]
+    monkeypatch.setattr(cache_persistente.time, "time", lambda: agora[0])
+    cache = CachePersistente(caminho)
+    cache.definir("a", 1, ttl=10)
+    agora[0] += 11
+    assert cache.obter("a") == (False, None)
+    assert CachePersistente(caminho).obter("a") == (False, None)
+
+
+def test_acerto_no_disco_nao_regrava_horario_de_acesso_recente(caminho, monkeypatch):
+    agora = [1000.0]
+    monkeypatch.setattr(cache_persistente.time, "time", lambda: agora[0])
+    cache = CachePersistente(caminho)
+    cache.definir("a", 1, memoria=False)
+
+    agora[0] += 10
+    assert cache.obter("a", memoria=False) == (True, 1)
+    assert _acessada(caminho, "a") == 1000.0
+
+    agora[0] += cache_persistente.INTERVALO_ACESSO
+    assert cache.obter("a", memoria=False) == (True, 1)
+    assert _acessada(caminho, "a") == agora[0]
+
+
+def test_limite_de_disco_descarta_menos_acessadas(caminho, monkeypatch):
+    agora = [1000.0]
+    monkeypatch.setattr(cache_persistente.time, "time", lambda: agora[0])
+    cache = CachePersistente(caminho, max_bytes_disco=30)
+    for chave in ("a", "b", "c"):
+        cache.definir(chave, "x" * 8, memoria=False)
+        agora[0] += 1
+    cache.definir("d", "x" * 8, memoria=False)
+
+    assert cache.obter("a", memoria=False) == (False, None)
+    assert all(cache.obter(chave, memoria=False)[0] for chave in "bcd")
+    assert cache.estatisticas()["descartes_disco"] == 1
+
+
+def test_limite_de_memoria(caminho):
+    cache = CachePersistente(caminho, max_bytes_memoria=25)
+    for chave in ("a", "b", "c"):
+        cache.definir(chave, "x" * 8)
+    estatisticas = cache.estatisticas()
+    assert estatisticas["bytes_memoria"] <= 25
+    assert estatisticas["descartes_memoria"] == 1
+    # A entrada descartada da memória continua no disco
+    assert cache.obter("a") == (True, "x" * 8)
+
+
+def test_calculo_unico_com_chamadas_concorrentes(caminho):
+    cache = CachePersistente(caminho)
+    calculos = []
+    liberar = threading.Event()
+
+    def calcular():
+        calculos.append(1)
+        liberar.wait(2)
+        return 42
+
+    resultados = []
+    threads = [threading.Thread(target=lambda: resultados.append(cache.obter_ou_calcular("k", calcular)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    liberar.set()
+    for thread in threads:
+        thread.join()
+
+    assert resultados == [42] * 8
+    assert len(calculos) == 1
+    estatisticas = cache.estatisticas()
+    assert estatisticas["falhas"] == 8
+    assert estatisticas["esperas"] == 7
+
+
+def test_excecao_no_calculo_nao_e_cacheada(caminho):
+    cache = CachePersistente(caminho)
+    with pytest.raises(ValueError):
+        cache.obter_ou_calcular("k", lambda: (_ for _ in ()).throw(ValueError("falhou")))
+    assert cache.obter_ou_calcular("k", lambda: 7) == 7
+
+
+def test_disco_indisponivel_usa_apenas_memoria(tmp_path):
+    bloqueio = tmp_path / "arquivo"
+    bloqueio.write_text("")
+    cache = CachePersistente(str(bloqueio / "cache.db"))
+    cache.definir("a", 1)
+    assert cache.obter("a") == (True, 1)
+    assert cache.estatisticas()["disco_disponivel"] == 0
+
+
+def test_prefixo_versionado_remove_versoes_antigas(caminho):
+    cache = CachePersistente(caminho)
+    cache.definir("figura_pib:v1:abc", "antiga")
+    cache.definir("figura_pib_extra:v1:abc", "outro nome")
+    cache.definir("mx:v1:abc", True)
+
+    reiniciado = CachePersistente(caminho)
+    assert reiniciado.prefixo_versionado("figura_pib", 2) == "figura_pib:v2:"
+    assert reiniciado.obter("figura_pib:v1:abc") == (False, None)
+    assert reiniciado.obter("figura_pib_extra:v1:abc") == (True, "outro nome")
+    assert reiniciado.obter("mx:v1:abc") == (True, True)
+
+    reiniciado.definir("figura_pib:v2:abc", "nova")
+    assert reiniciado.prefixo_versionado("figura_pib", 2) == "figura_pib:v2:"
+    assert reiniciado.obter("figura_pib:v2:abc") == (True, "nova")
+
+
+def test_decorador_persistente(caminho, monkeypatch):
+    monkeypatch.setattr(cache_persistente, "_cache", CachePersistente(caminho))
+    chamadas = []
+
+    @persistente("dobro", versao=1, chave=lambda valor, ignorado=None: [valor])
+    def dobro(valor, ignorado=None):
+        chamadas.append(valor)
+        return valor * 2
+
+    assert dobro(2) == 4
+    assert dobro(2, ignorado="x") == 4
+    assert chamadas == [2]
+
+    dobro.invalidar()
+    assert dobro(2) == 4
+    assert chamadas == [2, 2]
+
+
+def test_configuracao_do_ambiente_tolera_valor_invalido(caminho, monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_CACHE_PERSISTENTE", caminho)
+    monkeypatch.setenv("PORTFOLIO_CACHE_PERSISTENTE_MB", "meio")
+    cache = CachePersistente()
+    assert cache.caminho == caminho
+    assert cache.max_bytes_disco == cache_persistente.MB_DISCO_PADRAO * 1024 * 1024
+
+
+def test_prefixo_versionado_limpa_uma_vez_com_chamadas_concorrentes(caminho, monkeypatch):
+    cache = CachePersistente(caminho)
+    limpezas = []
+    original = cache.remover_prefixo
+
+    def remover_prefixo(*args, **kwargs):
+        limpezas.append(args)
+        time.sleep(0.05)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(cache, "remover_prefixo", remover_prefixo)
+    barreira = threading.Barrier(8)
+
+    def chamar():
+        barreira.wait()
+        cache.prefixo_versionado("figura_pib", 3)
+
+    threads = [threading.Thread(target=chamar) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(limpezas) == 1
@@ -0,0 +1,107 @@
+import socket
+from email import message_from_bytes
+from email.policy import default
+
+import pytest
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller")
+
+import caixa_saida  # noqa: E402
+from caixa_saida import ENVIADA, PENDENTE, CaixaSaida, TrabalhadorEntrega, enviar_smtp  # noqa: E402
+
+
+class _Coletor:
+    def __init__(self):
+        self.mensagens = []
+
+    async def handle_DATA(self, server, session, envelope):
+        self.mensagens.append(message_from_bytes(envelope.content, policy=default))
+        return "250 OK"
+
+
+def _porta_livre() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.fixture
+def porta(monkeypatch):
+    porta = _porta_livre()
+    monkeypatch.setenv("SMTP_SERVER", "127.0.0.1")
+    monkeypatch.setenv("SMTP_PORT", str(porta))
+    monkeypatch.setenv("SMTP_TLS", "none")
+    monkeypatch.setenv("EMAIL_USUARIO", "portfolio@example.com")
+    monkeypatch.setenv("EMAIL_SENHA", "senha")
+    monkeypatch.setenv("EMAIL_DESTINO", "destino@example.com")
+    # Nova tentativa imediata, para não esperar o backoff
+    monkeypatch.setattr(caixa_saida, "BACKOFF_BASE", 0)
+    return porta
+
+
+@pytest.fixture
+def caixa(tmp_path):
+    return CaixaSaida(str(tmp_path / "caixa.db"))
+
+
+def _servidor(porta):
+    coletor = _Coletor()
+    controlador = aiosmtpd_controller.Controller(coletor, hostname="127.0.0.1", port=porta)
+    controlador.start()
+    return controlador, coletor
+
+
+def test_entrega_e_nova_tentativa_apos_falha(porta, caixa):
+    trabalhador = TrabalhadorEntrega(caixa, enviar=enviar_smtp, janela_resumo=0)
+    id_mensagem = caixa.enfileirar("Maria", "maria@example.com", "Olá!")
+
+    # Servidor fora do ar: a mensagem continua pendente, com o erro registrado
+    assert trabalhador.processar_pendentes() == 0
+    [registro] = caixa.pendentes()
+    assert registro["id"] == id_mensagem
+    assert registro["tentativas"] == 1
+    assert registro["ultimo_erro"]
+
+    controlador, coletor = _servidor(porta)
+    try:
+        assert trabalhador.processar_pendentes() == 1
+    finally:
+        controlador.stop()
+
+    assert caixa.contagem() == {ENVIADA: 1}
+    [mensagem] = coletor.mensagens
+    assert mensagem["Subject"] == "Contato do Portfólio - Maria"
+    assert mensagem["Reply-To"] == "maria@example.com"
+    assert "Olá!" in mensagem.get_content()
+
+
+def test_resumo_agrupa_mensagens_da_janela(porta, caixa):
+    trabalhador = TrabalhadorEntrega(caixa, enviar=enviar_smtp, janela_resumo=60)
+    caixa.enfileirar("Ana", "ana@example.com", "Primeira")
+    caixa.enfileirar("Bruno", "bruno@example.com", "Segunda", atraso=30)
+
+    controlador, coletor = _servidor(porta)
+    try:
+        assert trabalhador.processar_pendentes() == 2
+        assert trabalhador.processar_pendentes() == 0
+    finally:
+        controlador.stop()
+
+    assert caixa.contagem() == {ENVIADA: 2}
+    [mensagem] = coletor.mensagens
+    assert mensagem["Subject"] == "Contato do Portfólio - 2 mensagens"
+    assert "Primeira" in mensagem.get_content() and "Segunda" in mensagem.get_content()
+
+
+def test_mensagem_sobrevive_a_reabertura(tmp_path):
+    caminho = str(tmp_path / "caixa.db")
+    CaixaSaida(caminho).enfileirar("Carla", "carla@example.com", "Persistida")
+    assert CaixaSaida(caminho).contagem() == {PENDENTE: 1}
+
+
+def test_janela_lida_do_ambiente_a_cada_verificacao(caixa, monkeypatch):
+    trabalhador = TrabalhadorEntrega(caixa, enviar=lambda mensagens, config: None)
+    monkeypatch.setenv("EMAIL_RESUMO_JANELA", "abc")
+    assert trabalhador.janela() == 0.0
+    monkeypatch.setenv("EMAIL_RESUMO_JANELA", "120")
+    assert trabalhador.janela() == 120.0
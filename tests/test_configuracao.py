@@ -0,0 +1,29 @@
+import logging
+
+from configuracao import ambiente_inteiro, ambiente_real
+
+
+def test_ambiente_inteiro(monkeypatch, caplog):
+    monkeypatch.delenv("PORTFOLIO_TESTE_INTEIRO", raising=False)
+    assert ambiente_inteiro("PORTFOLIO_TESTE_INTEIRO", 3) == 3
+
+    monkeypatch.setenv("PORTFOLIO_TESTE_INTEIRO", "7")
+    assert ambiente_inteiro("PORTFOLIO_TESTE_INTEIRO", 3) == 7
+
+    monkeypatch.setenv("PORTFOLIO_TESTE_INTEIRO", "sete")
+    with caplog.at_level(logging.WARNING, logger="configuracao"):
+        assert ambiente_inteiro("PORTFOLIO_TESTE_INTEIRO", 3) == 3
+    assert "PORTFOLIO_TESTE_INTEIRO" in caplog.text
+
+
+def test_ambiente_real(monkeypatch, caplog):
+    monkeypatch.delenv("PORTFOLIO_TESTE_REAL", raising=False)
+    assert ambiente_real("PORTFOLIO_TESTE_REAL", 1.5) == 1.5
+
+    monkeypatch.setenv("PORTFOLIO_TESTE_REAL", "2.5")
+    assert ambiente_real("PORTFOLIO_TESTE_REAL", 1.5) == 2.5
+
+    monkeypatch.setenv("PORTFOLIO_TESTE_REAL", "abc")
+    with caplog.at_level(logging.WARNING, logger="configuracao"):
+        assert ambiente_real("PORTFOLIO_TESTE_REAL", 1.5) == 1.5
+    assert "PORTFOLIO_TESTE_REAL" in caplog.text
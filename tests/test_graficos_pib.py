@@ -0,0 +1,130 @@
+import importlib
+import json
+import math
+
+import numpy as np
+import pytest
+
+import graficos_pib
+from graficos_pib import CacheFiguras, decimar, limite_por_serie, lttb
+
+
+def _lttb_referencia(pontos, limite):
+    """LTTB como descrito por Steinarsson (2013), ponto a ponto."""
+    n = len(pontos)
+    passo = (n - 2) / (limite - 2)
+    escolhidos = [0]
+    a = 0
+    for i in range(limite - 2):
+        inicio_media = math.floor((i + 1) * passo) + 1
+        fim_media = min(math.floor((i + 2) * passo) + 1, n)
+        media = pontos[inicio_media:fim_media]
+        media_x = sum(p[0] for p in media) / len(media)
+        media_y = sum(p[1] for p in media) / len(media)
+
+        inicio = math.floor(i * passo) + 1
+        fim = math.floor((i + 1) * passo) + 1
+        ax, ay = pontos[a]
+        melhor, maior_area = inicio, -1.0
+        for j in range(inicio, fim):
+            area = abs((ax - media_x) * (pontos[j][1] - ay) - (ax - pontos[j][0]) * (media_y - ay))
+            if area > maior_area:
+                melhor, maior_area = j, area
+        escolhidos.append(melhor)
+        a = melhor
+    escolhidos.append(n - 1)
+    return escolhidos
+
+
+@pytest.mark.parametrize("n, limite", [(100, 10), (1000, 37), (64, 63), (500, 3)])
+def test_lttb_igual_a_referencia(n, limite):
+    rng = np.random.default_rng(n + limite)
+    x = np.arange(n, dtype=np.float64) + 1960
+    y = np.cumsum(rng.normal(size=n))
+    pontos = list(zip(x.tolist(), y.tolist()))
+    assert lttb(x, y, limite).tolist() == _lttb_referencia(pontos, limite)
+
+
+def test_lttb_preserva_extremos_e_ordem():
+    x = np.arange(400, dtype=np.float64)
+    y = np.sin(x / 20)
+    y[123] = 50.0
+    y[321] = -50.0
+    indices = lttb(x, y, 40)
+    assert len(indices) == 40
+    assert indices[0] == 0 and indices[-1] == 399
+    assert np.all(np.diff(indices) > 0)
+    assert 123 in indices and 321 in indices
+
+
+def test_lttb_dentro_do_limite_devolve_tudo():
+    x = np.arange(10.0)
+    assert lttb(x, x, 10).tolist() == list(range(10))
+    assert lttb(x, x, 2).tolist() == list(range(10))
+
+
+def test_decimar_ignora_anos_sem_dado():
+    x = np.arange(1960, 2024, dtype=np.float64)
+    y = np.where(np.arange(len(x)) % 3 == 0, np.nan, np.arange(len(x), dtype=np.float64))
+    curto_x, curto_y = decimar(x, y, 100)
+    assert curto_x is x and curto_y is y
+
+    reduzido_x, reduzido_y = decimar(x, y, 10)
+    assert len(reduzido_x) == 10
+    assert not np.isnan(reduzido_y).any()
+    assert reduzido_x[0] == 1961 and reduzido_x[-1] == 2022
+
+
+def test_limite_por_serie(monkeypatch):
+    monkeypatch.setattr(graficos_pib, "ORCAMENTO_PONTOS", 1500)
+    assert limite_por_serie(1) == 1500
+    assert limite_por_serie(10) == 150
+    assert limite_por_serie(1000) == graficos_pib.PONTOS_MINIMOS
+    assert limite_por_serie(0, orcamento=100) == 100
+
+
+def test_cache_figuras_limita_quantidade_e_bytes():
+    cache = CacheFiguras(max_figuras=3, max_bytes=100)
+    for chave in "abc":
+        cache.definir(chave, "x" * 20)
+    assert cache.obter("a") == "x" * 20
+    cache.definir("d", "x" * 20)
+    # "b" era a menos usada depois da leitura de "a"
+    assert cache.obter("b") is None
+    assert {chave for chave in "acd" if cache.obter(chave)} == set("acd")
+
+    cache.definir("e", "y" * 90)
+    estatisticas = cache.estatisticas()
+    assert estatisticas["bytes"] <= 100
+    assert cache.obter("e") == "y" * 90
+    assert estatisticas["payload_max_bytes"] == 90
+
+
+def test_figura_serializada_constroi_uma_vez(monkeypatch, tmp_path):
+    from cache_persistente import CachePersistente
+
+    persistente = CachePersistente(str(tmp_path / "cache.db"))
+    monkeypatch.setattr(graficos_pib, "obter_cache_persistente", lambda: persistente)
+    monkeypatch.setattr(graficos_pib, "_cache", CacheFiguras())
+    construcoes = []
+
+    def construir():
+        construcoes.append(1)
+        return graficos_pib.go.Figure(graficos_pib.go.Scatter(x=[1, 2], y=[3, 4]))
+
+    primeira = graficos_pib.figura_serializada(("teste", 1), construir)
+    assert graficos_pib.figura_serializada(("teste", 1), construir) == primeira
+    # Processo reiniciado: a figura vem do disco
+    monkeypatch.setattr(graficos_pib, "_cache", CacheFiguras())
+    assert graficos_pib.figura_serializada(("teste", 1), construir) == primeira
+    assert len(construcoes) == 1
+    assert json.loads(primeira)["data"][0]["y"] == [3, 4]
+
+
+def test_orcamento_invalido_no_ambiente_usa_o_padrao(monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_PIB_ORCAMENTO_PONTOS", "1.500")
+    try:
+        assert importlib.reload(graficos_pib).ORCAMENTO_PONTOS == 1500
+    finally:
+        monkeypatch.delenv("PORTFOLIO_PIB_ORCAMENTO_PONTOS")
+        importlib.reload(graficos_pib)
@@ -0,0 +1,22 @@
+import json
+import re
+
+import icones
+from conteudo import LINKS_PROFISSIONAIS
+from fragmentos_html import construir_links_sociais, links_com_icone
+
+
+def test_compilado_versionado_cobre_todos_os_links():
+    with open(icones.CAMINHO_COMPILADO, encoding="utf-8") as arquivo:
+        compilados = json.load(arquivo)
+    assert set(compilados) == {link["id"] for link in LINKS_PROFISSIONAIS}
+    # O arquivo versionado corresponde aos ícones em assets/icones
+    assert compilados == icones.compilar()
+
+
+def test_barra_de_links_sem_urls_externas():
+    html = construir_links_sociais(links_com_icone())
+    fontes = re.findall(r'<img src="([^"]*)"', html)
+    assert len(fontes) == len(LINKS_PROFISSIONAIS)
+    externas = [fonte for fonte in fontes if not fonte.startswith("data:")]
+    assert externas == []
@@ -0,0 +1,88 @@
+import os
+import shutil
+import threading
+import time
+
+import pytest
+
+import indice_projetos
+from indice_projetos import IndiceProjetos, ObservadorProjetos
+
+IMAGEM_EXEMPLO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Imagem", "agisoft", "agisoft1.png")
+
+
+class _IndiceContador(IndiceProjetos):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.chamadas = []
+        self.chamou = threading.Event()
+
+    def atualizar(self, pastas=None):
+        self.chamadas.append(None if pastas is None else set(pastas))
+        resultado = super().atualizar(pastas)
+        self.chamou.set()
+        return resultado
+
+
+@pytest.fixture
+def base(tmp_path):
+    pasta = tmp_path / "Imagem" / "projeto"
+    pasta.mkdir(parents=True)
+    shutil.copy(IMAGEM_EXEMPLO, pasta / "a.png")
+    (pasta / "descricao.txt").write_text("Primeira versão", encoding="utf-8")
+    return tmp_path
+
+
+def _indice(base):
+    return _IndiceContador(str(base / "Imagem"), str(base / "manifesto.json"))
+
+
+def test_rajada_de_eventos_gera_uma_atualizacao(base, monkeypatch):
+    monkeypatch.setattr(indice_projetos, "ATRASO_OBSERVADOR", 0.1)
+    indice = _indice(base)
+    observador = ObservadorProjetos(indice)
+
+    raiz = indice.caminho_base
+    for nome in ("a.png", "b.png", "descricao.txt"):
+        observador._registrar(os.path.join(raiz, "projeto", nome))
+    observador._registrar(os.path.join(raiz, "outro", "c.png"))
+    observador._registrar(raiz)
+    observador._registrar(os.path.join(os.path.dirname(raiz), "fora.png"))
+
+    assert indice.chamou.wait(2)
+    time.sleep(0.2)
+    assert indice.chamadas == [{"projeto", "outro"}]
+
+
+def test_leituras_da_varredura_nao_reativam_o_observador(base, monkeypatch):
+    pytest.importorskip("watchdog")
+    monkeypatch.setattr(indice_projetos, "ATRASO_OBSERVADOR", 0.1)
+    indice = _indice(base)
+    indice.atualizar()
+    indice.chamadas.clear()
+    indice.chamou.clear()
+
+    observador = indice.observar()
+    try:
+        (base / "Imagem" / "projeto" / "descricao.txt").write_text("Segunda versão", encoding="utf-8")
+        assert indice.chamou.wait(3)
+        assert indice.projetos()[0]["descricao"] == "Segunda versão"
+
+        # A releitura de descricao.txt e das imagens não pode gerar nova rodada
+        time.sleep(1.0)
+        assert len(indice.chamadas) == 1
+    finally:
+        observador.parar()
+
+
+def test_varredura_incremental_reaproveita_manifesto(base):
+    indice = _indice(base)
+    assert indice.atualizar() == {"projeto"}
+    assert indice.atualizar() == set()
+
+    reaberto = _indice(base)
+    assert reaberto.atualizar() == set()
+    assert reaberto.projetos() == indice.projetos()
+
+    (base / "Imagem" / "projeto" / "descricao.txt").write_text("Outra", encoding="utf-8")
+    assert reaberto.atualizar() == {"projeto"}
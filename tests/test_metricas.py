@@ -0,0 +1,61 @@
+import importlib
+import sys
+
+import pytest
+
+import metricas
+
+
+@pytest.fixture
+def habilitadas(monkeypatch):
+    monkeypatch.setattr(metricas, "_habilitado", True)
+
+
+def test_importar_nao_le_o_ambiente(monkeypatch):
+    import configuracao
+
+    lidas = []
+    monkeypatch.setattr(configuracao, "ambiente", lambda nome, padrao=None: lidas.append(nome) or padrao)
+    monkeypatch.delitem(sys.modules, "metricas")
+    modulo = importlib.import_module("metricas")
+    try:
+        assert lidas == []
+        assert modulo.habilitado() is False
+        assert lidas == ["PORTFOLIO_METRICAS"]
+    finally:
+        sys.modules["metricas"] = metricas
+
+
+def test_pagina_fechada_sem_token(habilitadas, monkeypatch):
+    monkeypatch.delenv("PORTFOLIO_METRICAS_TOKEN", raising=False)
+    assert not metricas.acesso_administrativo({"metricas": ""})
+    assert not metricas.acesso_administrativo({"metricas": "qualquer"})
+
+
+def test_pagina_exige_token(habilitadas, monkeypatch):
+    monkeypatch.setenv("PORTFOLIO_METRICAS_TOKEN", "segredo")
+    assert metricas.acesso_administrativo({"metricas": "segredo"})
+    assert not metricas.acesso_administrativo({"metricas": "segred"})
+    assert not metricas.acesso_administrativo({"metricas": "ségredo"})
+    assert not metricas.acesso_administrativo({})
+
+
+def test_pagina_fechada_com_coleta_desligada(monkeypatch):
+    monkeypatch.setattr(metricas, "_habilitado", False)
+    monkeypatch.setenv("PORTFOLIO_METRICAS_TOKEN", "segredo")
+    assert not metricas.acesso_administrativo({"metricas": "segredo"})
+
+
+def test_instrumentar_decide_na_chamada(monkeypatch):
+    monkeypatch.setattr(metricas, "_habilitado", False)
+
+    @metricas.instrumentar("teste:dobro")
+    def dobro(valor):
+        return valor * 2
+
+    assert dobro(2) == 4
+    assert "teste:dobro" not in metricas._totais
+
+    monkeypatch.setattr(metricas, "_habilitado", True)
+    assert dobro(3) == 6
+    assert metricas._totais["teste:dobro"][0] == 1
@@ -0,0 +1,71 @@
+import logging
+import os
+import shutil
+import sys
+import time
+import types
+
+import miniaturas
+import preprocessamento
+from preprocessamento import AquecimentoMiniaturas
+
+IMAGEM_EXEMPLO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Imagem", "agisoft", "agisoft1.png")
+
+
+def test_gera_miniaturas_sem_reexecutar_o_main_do_processo(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("PORTFOLIO_CACHE_DIR", str(cache))
+    monkeypatch.setattr(miniaturas, "DIRETORIO_MINIATURAS", str(cache / "miniaturas"))
+
+    # b.png é uma cópia de a.png (mesmo digest); c.png não é uma imagem
+    imagens = []
+    for nome in ("a.png", "b.png"):
+        shutil.copy(IMAGEM_EXEMPLO, tmp_path / nome)
+        imagens.append(str(tmp_path / nome))
+    (tmp_path / "c.png").write_bytes(b"nao e uma imagem")
+    imagens.append(str(tmp_path / "c.png"))
+
+    # Como sob o Streamlit: o __main__ é um script que não pode ser reexecutado
+    marcador = tmp_path / "main_executado"
+    script = tmp_path / "app.py"
+    script.write_text(f"open({str(marcador)!r}, 'w').close()\n", encoding="utf-8")
+    principal = types.ModuleType("__main__")
+    principal.__file__ = str(script)
+    monkeypatch.setitem(sys.modules, "__main__", principal)
+
+    aquecimento = AquecimentoMiniaturas(imagens, max_workers=2, larguras=(120,))
+    relatorio = aquecimento.executar()
+
+    assert sys.modules["__main__"] is principal
+    assert not marcador.exists()
+    assert relatorio["concluidos"] == 3
+    assert list(relatorio["erros"]) == [imagens[2]]
+    formato = miniaturas.formato_padrao()
+    digest = miniaturas.hash_conteudo(imagens[0])
+    assert os.path.exists(miniaturas.caminho_miniatura(digest, 120, formato))
+
+    # Segunda execução: nada pendente além da imagem inválida
+    assert AquecimentoMiniaturas(imagens[:2], larguras=(120,)).executar()["tempos"] == {}
+
+
+def test_falha_do_processo_dedicado_em_segundo_plano_vai_para_o_log(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(miniaturas, "DIRETORIO_MINIATURAS", str(tmp_path / "miniaturas"))
+    shutil.copy(IMAGEM_EXEMPLO, tmp_path / "a.png")
+
+    def _falhar(*args):
+        raise RuntimeError("trabalhador_miniaturas terminou com código 1")
+        yield
+
+    monkeypatch.setattr(preprocessamento, "_gerar_em_processo_dedicado", _falhar)
+    with caplog.at_level(logging.ERROR, logger="preprocessamento"):
+        aquecimento = AquecimentoMiniaturas([str(tmp_path / "a.png")], larguras=(120,)).iniciar()
+        assert aquecimento.aguardar(10)
+        # O log é gravado logo depois do evento de conclusão
+        for _ in range(100):
+            if caplog.records:
+                break
+            time.sleep(0.01)
+
+    [registro] = caplog.records
+    assert registro.exc_info[0] is RuntimeError
+    assert not aquecimento.em_andamento
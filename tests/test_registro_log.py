@@ -0,0 +1,72 @@
+import json
+import logging
+
+import pytest
+
+import registro_log
+from registro_log import FiltroAmostragem
+
+
+def _registro(nivel, msg, *args, nome="teste"):
+    return logging.LogRecord(nome, nivel, __file__, 1, msg, args, None)
+
+
+def test_avisos_repetidos_sao_amostrados_por_modelo():
+    filtro = FiltroAmostragem(janela=60)
+    aceitos = [filtro.filter(_registro(logging.WARNING, "E-mail inválido: %s", f"v{i}@")) for i in range(5)]
+    assert aceitos == [True, False, False, False, False]
+    assert filtro.filter(_registro(logging.WARNING, "Outro aviso"))
+    assert filtro.filter(_registro(logging.WARNING, "E-mail inválido: %s", "x@", nome="outro"))
+
+
+def test_informativos_e_erros_nunca_sao_amostrados():
+    filtro = FiltroAmostragem(janela=60)
+    for nivel, msg in [
+        (logging.INFO, "Mensagem de contato %s entregue (%s)"),
+        (logging.DEBUG, "Detalhe %s"),
+        (logging.ERROR, "Erro ao carregar imagem %s"),
+        (logging.CRITICAL, "Falha grave %s"),
+    ]:
+        assert all(filtro.filter(_registro(nivel, msg, i)) for i in range(3))
+
+
+def test_proximo_aviso_apos_a_janela_informa_suprimidos(monkeypatch):
+    agora = [1000.0]
+    monkeypatch.setattr(registro_log.time, "monotonic", lambda: agora[0])
+    filtro = FiltroAmostragem(janela=10)
+    for _ in range(4):
+        filtro.filter(_registro(logging.WARNING, "Imagem ausente: %s", "a.png"))
+
+    agora[0] += 11
+    registro = _registro(logging.WARNING, "Imagem ausente: %s", "b.png")
+    assert filtro.filter(registro)
+    assert registro.suprimidos == 3
+    assert registro.getMessage() == "Imagem ausente: b.png (3 ocorrência(s) semelhante(s) suprimida(s))"
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    arquivo = tmp_path / "portfolio.log"
+    monkeypatch.setenv("PORTFOLIO_LOG_ARQUIVO", str(arquivo))
+    monkeypatch.setenv("PORTFOLIO_LOG_FORMATO", "json")
+    monkeypatch.setenv("PORTFOLIO_LOG_AMOSTRAGEM", "60")
+    raiz = logging.getLogger()
+    nivel, manipuladores = raiz.level, list(raiz.handlers)
+    registro_log.encerrar_logging()
+    registro_log.configurar_logging()
+    yield arquivo
+    registro_log.encerrar_logging()
+    raiz.setLevel(nivel)
+    raiz.handlers[:] = manipuladores
+
+
+def test_pipeline_grava_informativos_e_amostra_avisos(pipeline):
+    logger = logging.getLogger("caixa_saida")
+    for i in range(3):
+        logger.info("Mensagem de contato %s entregue (%s)", i, "a@example.com")
+        logger.warning("Falha ao entregar mensagem %s: %s", i, "recusada")
+    registro_log.encerrar_logging()
+
+    linhas = [json.loads(linha) for linha in pipeline.read_text(encoding="utf-8").splitlines()]
+    assert [linha["nivel"] for linha in linhas] == ["INFO", "WARNING", "INFO", "INFO"]
+    assert linhas[0]["mensagem"] == "Mensagem de contato 0 entregue (a@example.com)"
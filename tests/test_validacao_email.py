@@ -0,0 +1,92 @@
+import threading
+import types
+
+import pytest
+
+import cache_persistente
+from cache_persistente import CachePersistente
+from validacao_email import ServicoValidacaoEmail, resolvedor_dns
+
+dns_resolver = pytest.importorskip("dns.resolver")
+pytest.importorskip("email_validator")
+
+
+class _ResolvedorFalso:
+    """Substitui dns.resolver.Resolver com respostas fixas por domínio."""
+
+    respostas = {}
+    consultas = []
+
+    def __init__(self, configure=True):
+        self.nameservers = []
+        self.port = 53
+
+    def resolve(self, dominio, tipo, lifetime=None):
+        _ResolvedorFalso.consultas.append((dominio, tipo))
+        resposta = _ResolvedorFalso.respostas[(dominio, tipo)]
+        if isinstance(resposta, Exception):
+            raise resposta
+        return [types.SimpleNamespace(exchange=servidor) for servidor in resposta]
+
+
+@pytest.fixture
+def dns_falso(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache_persistente, "_cache", CachePersistente(str(tmp_path / "cache.db")))
+    monkeypatch.setattr(dns_resolver, "Resolver", _ResolvedorFalso)
+    _ResolvedorFalso.consultas = []
+    _ResolvedorFalso.respostas = {
+        ("exemplo.com.br", "MX"): ["mx1.exemplo.com.br."],
+        ("nulo.com.br", "MX"): ["."],
+        ("inexistente.com.br", "MX"): dns_resolver.NXDOMAIN(),
+        ("lento.com.br", "MX"): dns_resolver.LifetimeTimeout(timeout=0.1, errors={}),
+    }
+    return ServicoValidacaoEmail(verificar_entrega=True, resolvedor=resolvedor_dns(["127.0.0.1:5353"]), timeout=1)
+
+
+def test_mx_encontrado(dns_falso):
+    assert dns_falso.validar("ana@exemplo.com.br").valido
+    assert dns_falso.validar("bruno@exemplo.com.br").valido
+    assert _ResolvedorFalso.consultas == [("exemplo.com.br", "MX")]
+
+
+def test_nxdomain_e_mx_nulo_recusam(dns_falso):
+    resultado = dns_falso.validar("ana@inexistente.com.br")
+    assert not resultado.valido
+    assert "inexistente.com.br" in resultado.motivo
+    assert not dns_falso.validar("ana@nulo.com.br").valido
+
+
+def test_timeout_do_resolvedor_aceita_e_nao_cacheia(dns_falso):
+    assert dns_falso.validar("ana@lento.com.br").valido
+    assert dns_falso.metricas()["dns_erros"] == 1
+
+    # A falha não fica em cache: a próxima validação consulta de novo
+    assert dns_falso.validar("bruno@lento.com.br").valido
+    assert _ResolvedorFalso.consultas.count(("lento.com.br", "MX")) == 2
+
+
+def test_orcamento_de_tempo_estourado_aceita_e_preenche_cache():
+    liberar = threading.Event()
+    consultas = []
+
+    def resolvedor_lento(dominio, timeout):
+        consultas.append(dominio)
+        liberar.wait(5)
+        return False
+
+    servico = ServicoValidacaoEmail(verificar_entrega=True, resolvedor=resolvedor_lento, timeout=0.05)
+    assert servico.validar("ana@demorado.com.br").valido
+    assert servico.metricas()["dns_timeouts"] == 1
+
+    # A consulta termina em segundo plano e a resposta passa a valer
+    liberar.set()
+    futuro = servico._em_andamento.get("demorado.com.br")
+    if futuro is not None:
+        futuro.result(5)
+    assert not servico.validar("bruno@demorado.com.br").valido
+    assert consultas == ["demorado.com.br"]
+
+
+def test_sintaxe_invalida_nao_consulta_dns():
+    servico = ServicoValidacaoEmail(verificar_entrega=True, resolvedor=lambda dominio, timeout: pytest.fail())
+    assert not servico.validar("sem-arroba").valido
@@ -0,0 +1,41 @@
+"""
+Processo dedicado à geração paralela de miniaturas.
+
+O preprocessamento executa este módulo com `python -m trabalhador_miniaturas`
+em vez de criar o ProcessPoolExecutor dentro do servidor Streamlit. Assim o
+__main__ deste processo é um módulo importável: os filhos "spawn" o
+reimportam pelo nome, sem reexecutar o script do app e sem que o __main__ do
+servidor precise ser trocado.
+
+Entrada (stdin): um JSON com workers, larguras, formato e a lista de imagens
+como pares [caminho, digest].
+Saída (stdout): uma linha JSON por imagem concluída, com caminho, segundos e
+erro (null em caso de sucesso).
+"""
+
+import json
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from preprocessamento import _processar_imagem
+
+
+def main():
+    tarefa = json.load(sys.stdin)
+    larguras = tuple(tarefa["larguras"])
+    formato = tarefa["formato"]
+
+    contexto = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=tarefa["workers"], mp_context=contexto) as executor:
+        futuros = [
+            executor.submit(_processar_imagem, caminho, digest, larguras, formato)
+            for caminho, digest in tarefa["imagens"]
+        ]
+        for futuro in as_completed(futuros):
+            caminho, segundos, erro = futuro.result()
+            print(json.dumps({"caminho": caminho, "segundos": segundos, "erro": erro}), flush=True)
+
+
+if __name__ == "__main__":
+    main()
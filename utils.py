@@ -3,73 +3,20 @@ Módulo de utilidades e configurações compartilhadas
 """
 
 import streamlit as st
-import requests
-import smtplib
 import logging
-import os
-from email.message import EmailMessage
-from email_validator import validate_email, EmailNotValidError
-from dotenv import load_dotenv
-
-# Configuração de logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('portfolio.log'),
-        logging.StreamHandler()
-    ]
-)
+import metricas
+from fragmentos_html import links_com_icone, links_sociais, registrar as registrar_fragmento
+from registro_log import configurar_logging
 
-logger = logging.getLogger(__name__)
+# Validação de e-mail, caixa de saída, Lottie e PIL são importados dentro das
+# funções que os usam; o .env é lido sob demanda por configuracao.ambiente()
+# e o logging assíncrono (registro_log) é instalado na primeira mensagem
 
-# Carregar variáveis de ambiente
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 # ============= CONFIGURAÇÕES =============
 
-PROFESSIONAL_LINKS = [
-    {
-        'icon': '<img src="https://cdn-icons-png.flaticon.com/512/300/300221.png" width="40"/>',
-        'label': 'Google Acadêmico',
-        'url': 'https://scholar.google.com.br/citations?user=XLu_qAIAAAAJ&hl=pt-BR'
-    },
-    {
-        'icon': '<img src="https://cdn-icons-png.flaticon.com/512/174/174857.png" width="40"/>',
-        'label': 'LinkedIn',
-        'url': 'https://www.linkedin.com/in/tiago-holanda-082928141/'
-    },
-    {
-        'icon': '<img src="https://cdn-icons-png.flaticon.com/512/25/25231.png" width="40"/>',
-        'label': 'GitHub',
-        'url': 'https://github.com/tiagofholanda'
-    },
-    {
-        'icon': '<img src="https://lattes.cnpq.br/image/layout_set_logo?img_id=1311768&t=1729293336662" width="40"/>',
-        'label': 'Lattes',
-        'url': 'http://lattes.cnpq.br/4969639760120080'
-    },
-    {
-        'icon': '<img src="https://c5.rgstatic.net/m/419438641133902/images/icons/svgicons/new-index-logo.svg" width="40"/>',
-        'label': 'ResearchGate',
-        'url': 'https://www.researchgate.net/profile/Tiago_Holanda'
-    },
-    {
-        'icon': '<img src="https://www.pikpng.com/pngl/m/424-4243430_reviewers-for-these-journals-can-track-verify-and.png" width="80"/>',
-        'label': 'Publons',
-        'url': 'https://publons.com/researcher/3962699/tiago-holanda/'
-    },
-    {
-        'icon': '<img src="https://upload.wikimedia.org/wikipedia/commons/0/06/ORCID_iD.svg" width="40"/>',
-        'label': 'ORCID',
-        'url': 'https://orcid.org/0000-0001-6898-5027'
-    },
-    {
-        'icon': '<img src="https://www.elsevier.com/images/elsevier-logo.svg" width="80"/>',
-        'label': 'Scopus',
-        'url': 'https://www.scopus.com/authid/detail.uri?authorId=57376293300'
-    },
-]
+PROFESSIONAL_LINKS = links_com_icone()
 
 # ============= FUNÇÕES DE VALIDAÇÃO E EMAIL =============
 
@@ -83,17 +30,19 @@ def validar_email(email: str) -> bool:
     Returns:
         True se válido, False caso contrário
     """
-    try:
-        validate_email(email)
-        return True
-    except EmailNotValidError as e:
-        logger.warning(f"E-mail inválido: {email} - {str(e)}")
-        return False
+    from validacao_email import obter_servico
+
+    resultado = obter_servico().validar(email)
+    if not resultado.valido:
+        configurar_logging()
+        logger.warning("E-mail inválido: %s - %s", email, resultado.motivo)
+    return resultado.valido
 
 
 def enviar_email(nome: str, email_remetente: str, mensagem: str) -> bool:
     """
-    Envia um e-mail com as informações fornecidas.
+    Grava a mensagem na caixa de saída durável; a entrega por SMTP é feita
+    em segundo plano, com novas tentativas em caso de falha.
     
     Args:
         nome: Nome do remetente
@@ -101,75 +50,52 @@ def enviar_email(nome: str, email_remetente: str, mensagem: str) -> bool:
         mensagem: Conteúdo da mensagem
         
     Returns:
-        True se enviado com sucesso, False caso contrário
+        True se a mensagem foi aceita na caixa de saída, False caso contrário
     """
-    try:
-        # Configuração do e-mail
-        email_destino = os.getenv('EMAIL_DESTINO')
-        email_usuario = os.getenv('EMAIL_USUARIO')
-        email_senha = os.getenv('EMAIL_SENHA')
+    from caixa_saida import configuracao_completa, enfileirar_contato
 
-        if not all([email_destino, email_usuario, email_senha]):
+    configurar_logging()
+    try:
+        if not configuracao_completa():
             logger.error("Variáveis de ambiente de e-mail não configuradas")
             st.error("❌ Configurações de e-mail não encontradas. Por favor, configure as variáveis de ambiente.")
             return False
 
-        msg = EmailMessage()
-        msg.set_content(f"Nome: {nome}\nE-mail: {email_remetente}\n\nMensagem:\n{mensagem}")
-        msg['Subject'] = f"Contato do Portfólio - {nome}"
-        msg['From'] = email_usuario
-        msg['To'] = email_destino
-
-        # Configuração do servidor SMTP (Gmail)
-        with smtplib.SMTP_SSL('smtp.gmail.com', 465) as servidor:
-            servidor.login(email_usuario, email_senha)
-            servidor.send_message(msg)
-        
-        logger.info(f"E-mail enviado com sucesso de {email_remetente}")
+        id_mensagem = enfileirar_contato(nome, email_remetente, mensagem)
+        logger.info("Mensagem %s de %s enfileirada para entrega", id_mensagem, email_remetente)
         return True
         
-    except smtplib.SMTPException as e:
-        logger.error(f"Erro SMTP ao enviar e-mail: {str(e)}")
-        st.error(f"❌ Erro ao enviar e-mail: {str(e)}")
-        return False
     except Exception as e:
-        logger.error(f"Erro inesperado ao enviar e-mail: {str(e)}")
+        logger.error("Erro inesperado ao enfileirar e-mail: %s", e)
         st.error(f"❌ Erro inesperado: {str(e)}")
         return False
 
 
 # ============= FUNÇÕES DE CACHE E LOTTIE =============
 
-@st.cache_data(show_spinner=False)
+@metricas.instrumentar("load_lottie_url")
 def load_lottie_url(url: str):
     """
-    Carrega animação Lottie de uma URL com cache.
+    Carrega animação Lottie a partir do armazenamento local (sem acessar a rede).
     
     Args:
-        url: URL da animação Lottie
+        url: URL de origem da animação Lottie
         
     Returns:
-        Dados JSON da animação ou None se falhar
+        Dados JSON da animação ou None se não houver cópia local
     """
-    try:
-        r = requests.get(url, timeout=10)
-        if r.status_code == 200:
-            return r.json()
-        else:
-            logger.warning(f"Erro ao carregar Lottie: Status {r.status_code}")
-            return None
-    except requests.exceptions.RequestException as e:
-        logger.warning(f"Erro ao carregar Lottie de {url}: {str(e)}")
-        return None
-    except Exception as e:
-        logger.error(f"Erro ao processar Lottie: {str(e)}")
-        return None
+    from cache_lottie import carregar_lottie
 
+    return carregar_lottie(url)
 
-@st.cache_data(show_spinner=False)
+
+@metricas.instrumentar("load_image")
 def load_image(image_path: str):
     """
-    Carrega imagem com cache.
+    Carrega imagem a partir dos bytes guardados em cache_imagens.
+    
+    O cache guarda apenas o arquivo codificado, dentro de um orçamento de
+    bytes; a imagem é decodificada pelo chamador, sob demanda.
     
     Args:
         image_path: Caminho local da imagem
@@ -178,10 +104,14 @@ def load_image(image_path: str):
         Objeto PIL Image ou None se falhar
     """
     try:
+        import io
         from PIL import Image
-        return Image.open(image_path)
+        from cache_imagens import ler_imagem
+
+        return Image.open(io.BytesIO(ler_imagem(image_path)))
     except Exception as e:
-        logger.error(f"Erro ao carregar imagem {image_path}: {str(e)}")
+        configurar_logging()
+        logger.error("Erro ao carregar imagem %s: %s", image_path, e)
         return None
 
 
@@ -189,7 +119,7 @@ def load_image(image_path: str):
 
 def render_social_links(links=None):
     """
-    Renderiza links de redes sociais em HTML.
+    Renderiza links de redes sociais em HTML (montado uma vez e reutilizado).
     
     Args:
         links: Lista de dicionários com ícone, label e url
@@ -197,22 +127,12 @@ def render_social_links(links=None):
     Returns:
         String HTML contendo os links formatados
     """
-    if links is None:
-        links = PROFESSIONAL_LINKS
-    
-    links_html = '<div class="icone-rede">'
-    for link in links:
-        links_html += f'<a href="{link["url"]}" target="_blank" title="{link["label"]}">{link["icon"]}</a>'
-    links_html += '</div>'
-    return links_html
+    if links is None or links is PROFESSIONAL_LINKS:
+        return links_sociais()
+    return links_sociais(links)
 
 
-def apply_custom_css():
-    """
-    Aplica estilos CSS personalizados no Streamlit.
-    """
-    # CSS inline principal
-    st.markdown("""
+CSS_PERSONALIZADO = """
         <style>
         /* Importando font Google */
         @import url('https://fonts.googleapis.com/css2?family=Montserrat:wght@400;500;700&display=swap');
@@ -352,4 +272,12 @@ def apply_custom_css():
             }
         }
         </style>
-        """, unsafe_allow_html=True)
+        """
+
+
+def apply_custom_css():
+    """
+    Aplica estilos CSS personalizados no Streamlit.
+    """
+    # CSS inline principal, registrado uma vez no cache de fragmentos
+    st.markdown(registrar_fragmento("css_utils", CSS_PERSONALIZADO), unsafe_allow_html=True)
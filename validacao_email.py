@@ -0,0 +1,256 @@
+"""
+Serviço de validação de e-mail com cache.
+
+A validação sintática (email_validator) é memorizada em um cache LRU com
+TTL. A verificação opcional de entregabilidade consulta os registros MX do
+domínio em segundo plano, com cache TTL próprio por domínio e um orçamento
+de tempo estrito: se o resolvedor não responder a tempo, o formulário não
+espera e o e-mail é aceito. As respostas do resolvedor DNS também ficam no
+cache persistente em disco e valem após um reinício do processo.
+
+Variáveis de ambiente:
+    EMAIL_VERIFICAR_ENTREGA=1       habilita a consulta MX
+    EMAIL_DNS_TIMEOUT=0.5           orçamento por consulta, em segundos
+    EMAIL_DNS_SERVIDORES=127.0.0.1:5353   resolvedores a usar (ex.: um stub local)
+"""
+
+import collections
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturoTimeout
+
+import metricas
+from cache_persistente import persistente
+from configuracao import ambiente, ambiente_real
+
+logger = logging.getLogger(__name__)
+
+ResultadoValidacao = collections.namedtuple("ResultadoValidacao", ["valido", "motivo"])
+
+TTL_SINTAXE = 60 * 60
+TTL_MX = 6 * 60 * 60
+TTL_MX_NEGATIVO = 10 * 60
+MAX_SINTAXE = 2048
+MAX_DOMINIOS = 512
+
+
+class CacheTTL:
+    """
+    Cache LRU com expiração por entrada e contadores de acertos e falhas.
+
+    Args:
+        tamanho_maximo: Quantidade máxima de entradas
+        ttl: Tempo de vida padrão das entradas, em segundos
+    """
+
+    def __init__(self, tamanho_maximo: int, ttl: float):
+        self.tamanho_maximo = tamanho_maximo
+        self.ttl = ttl
+        self._dados = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, chave):
+        """
+        Returns:
+            Tupla (encontrado, valor)
+        """
+        agora = time.monotonic()
+        with self._lock:
+            entrada = self._dados.get(chave)
+            if entrada is not None and entrada[0] > agora:
+                self._dados.move_to_end(chave)
+                self.acertos += 1
+                return True, entrada[1]
+            if entrada is not None:
+                del self._dados[chave]
+            self.falhas += 1
+            return False, None
+
+    def definir(self, chave, valor, ttl: float = None):
+        with self._lock:
+            self._dados[chave] = (time.monotonic() + (self.ttl if ttl is None else ttl), valor)
+            self._dados.move_to_end(chave)
+            while len(self._dados) > self.tamanho_maximo:
+                self._dados.popitem(last=False)
+
+    def __len__(self):
+        return len(self._dados)
+
+
+def resolvedor_dns(servidores=None):
+    """
+    Cria uma função de consulta MX baseada no dnspython.
+
+    Args:
+        servidores: Lista de "host" ou "host:porta"; None usa os do sistema
+
+    Returns:
+        Função (dominio, timeout) -> bool indicando se o domínio aceita e-mail
+    """
+    import dns.resolver
+
+    resolver = dns.resolver.Resolver(configure=not servidores)
+    if servidores:
+        resolver.nameservers = [servidor.rsplit(":", 1)[0] for servidor in servidores]
+        portas = {int(servidor.rsplit(":", 1)[1]) for servidor in servidores if ":" in servidor}
+        if portas:
+            resolver.port = portas.pop()
+
+    # Falhas do resolvedor (exceções) não são gravadas; respostas negativas
+    # expiram antes das positivas
+    @persistente(
+        "mx", versao=1, memoria=False,
+        ttl=lambda entregavel: TTL_MX if entregavel else TTL_MX_NEGATIVO,
+        chave=lambda dominio, timeout: [servidores, dominio.lower()],
+    )
+    def _consultar(dominio: str, timeout: float) -> bool:
+        try:
+            resposta = resolver.resolve(dominio, "MX", lifetime=timeout)
+            return any(str(registro.exchange) != "." for registro in resposta)
+        except dns.resolver.NXDOMAIN:
+            return False
+        except dns.resolver.NoAnswer:
+            # Sem MX, o domínio ainda pode receber e-mail pelo registro A
+            try:
+                resolver.resolve(dominio, "A", lifetime=timeout)
+                return True
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                return False
+
+    return _consultar
+
+
+class ServicoValidacaoEmail:
+    """
+    Valida endereços de e-mail com cache de sintaxe e de domínios.
+
+    Args:
+        verificar_entrega: Consulta os registros MX do domínio
+        resolvedor: Função (dominio, timeout) -> bool; padrão: resolvedor_dns()
+        timeout: Orçamento de espera por uma consulta MX, em segundos
+    """
+
+    def __init__(self, verificar_entrega: bool = False, resolvedor=None, timeout: float = 0.5):
+        self.verificar_entrega = verificar_entrega
+        self.resolvedor = resolvedor
+        self.timeout = timeout
+        self.cache_sintaxe = CacheTTL(MAX_SINTAXE, TTL_SINTAXE)
+        self.cache_dominios = CacheTTL(MAX_DOMINIOS, TTL_MX)
+        self.timeouts = 0
+        self.erros_dns = 0
+        self._em_andamento = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def _sintaxe(self, email: str) -> ResultadoValidacao:
+        encontrado, resultado = self.cache_sintaxe.obter(email)
+        if encontrado:
+            return resultado
+
+        from email_validator import validate_email, EmailNotValidError
+
+        try:
+            info = validate_email(email, check_deliverability=False)
+            resultado = ResultadoValidacao(True, info.ascii_domain)
+        except EmailNotValidError as e:
+            resultado = ResultadoValidacao(False, str(e))
+        self.cache_sintaxe.definir(email, resultado)
+        return resultado
+
+    def _consultar_dominio(self, dominio: str) -> bool:
+        try:
+            entregavel = self.resolvedor(dominio, self.timeout * 4)
+            self.cache_dominios.definir(dominio, entregavel, None if entregavel else TTL_MX_NEGATIVO)
+            return entregavel
+        except Exception as e:
+            # Falha do resolvedor não é cacheada: a próxima tentativa consulta de novo
+            with self._lock:
+                self.erros_dns += 1
+            logger.info("Consulta MX de %s falhou: %s", dominio, e)
+            raise
+        finally:
+            with self._lock:
+                self._em_andamento.pop(dominio, None)
+
+    def _dominio_entregavel(self, dominio: str) -> bool:
+        encontrado, entregavel = self.cache_dominios.obter(dominio)
+        if encontrado:
+            return entregavel
+
+        with self._lock:
+            if self.resolvedor is None:
+                self.resolvedor = resolvedor_dns(_servidores_configurados())
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="consulta-mx")
+            futuro = self._em_andamento.get(dominio)
+            if futuro is None:
+                futuro = self._executor.submit(self._consultar_dominio, dominio)
+                self._em_andamento[dominio] = futuro
+
+        try:
+            return futuro.result(timeout=self.timeout)
+        except FuturoTimeout:
+            # A consulta continua em segundo plano e preenche o cache ao terminar
+            with self._lock:
+                self.timeouts += 1
+            return True
+        except Exception:
+            return True
+
+    def validar(self, email: str) -> ResultadoValidacao:
+        """
+        Valida a sintaxe e, se habilitado, a entregabilidade do domínio.
+
+        Args:
+            email: Endereço a validar
+
+        Returns:
+            ResultadoValidacao(valido, motivo); motivo traz o domínio quando
+            válido ou a mensagem de erro quando inválido
+        """
+        resultado = self._sintaxe(email)
+        if not resultado.valido or not self.verificar_entrega:
+            return resultado
+
+        if not self._dominio_entregavel(resultado.motivo):
+            return ResultadoValidacao(False, f"O domínio {resultado.motivo} não aceita e-mails.")
+        return resultado
+
+    def metricas(self) -> dict:
+        """
+        Returns:
+            Acertos e falhas de cada cache, timeouts e erros de DNS
+        """
+        return {
+            "sintaxe_acertos": self.cache_sintaxe.acertos,
+            "sintaxe_falhas": self.cache_sintaxe.falhas,
+            "dominios_acertos": self.cache_dominios.acertos,
+            "dominios_falhas": self.cache_dominios.falhas,
+            "dns_timeouts": self.timeouts,
+            "dns_erros": self.erros_dns,
+        }
+
+
+def _servidores_configurados():
+    valor = ambiente("EMAIL_DNS_SERVIDORES", "").strip()
+    return [servidor.strip() for servidor in valor.split(",") if servidor.strip()] or None
+
+
+_servico = None
+_servico_lock = threading.Lock()
+
+
+def obter_servico() -> ServicoValidacaoEmail:
+    """Retorna o serviço de validação do processo, configurado pelo ambiente."""
+    global _servico
+    with _servico_lock:
+        if _servico is None:
+            _servico = ServicoValidacaoEmail(
+                verificar_entrega=ambiente("EMAIL_VERIFICAR_ENTREGA", "0") == "1",
+                timeout=ambiente_real("EMAIL_DNS_TIMEOUT", 0.5),
+            )
+            metricas.registrar_coletor("validacao_email", _servico.metricas)
+        return _servico